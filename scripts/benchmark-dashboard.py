@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Operator Test Dashboard - Synthetic Load Benchmark
+Version: 1.0
+
+Measures what every read-only route of the web dashboard costs on the remote
+path, without a cluster. The benchmark:
+
+  1. generates a REPORT_DIR with hundreds of report_* trees (operator folders,
+     output logs, phase/wait timings, results.csv, a certsuite claim.json per
+     installed operator); the newest reports get large logs and multi-MB
+     results.csv and claim.json files,
+  2. puts a fake ``ssh`` on PATH that runs the remote command locally and
+     counts it, next to ``oc`` and ``tmux`` stubs so no real cluster or test
+     session is ever touched,
+  3. starts web-dashboard.py against it (SSH_TRANSPORT=subprocess, or
+     BACKEND=local to read the fixture directly) and drives each /api route
+     at the requested concurrency,
+  4. prints p50/p99 latency, remote calls per request and the dashboard's
+     peak RSS (VmHWM) for each route.
+
+Control routes (/api/test/start, /api/test/stop, /api/cleanup) are not
+driven. /api/stream is measured up to its first event.
+
+Requires: Linux (/proc), bash; the dashboard's own dependencies.
+
+Usage:
+  python3 scripts/benchmark-dashboard.py [--reports 300] [--concurrency 8] [--requests 40]
+      [--routes status,reports] [--backend ssh|local] [--workdir DIR] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD = os.path.join(SCRIPT_DIR, 'web-dashboard.py')
+
+OPERATORS = [
+    'nfd', 'kiali-ossm', 'cluster-logging', 'metallb-operator', 'ptp-operator',
+    'quay-operator', 'loki-operator', 'amq-streams', 'sriov-network-operator',
+    'local-storage-operator', 'web-terminal', 'servicemeshoperator',
+    'openshift-gitops-operator', 'rhbk-operator', 'cincinnati-operator',
+    'compliance-operator', 'file-integrity-operator', 'node-healthcheck-operator',
+]
+CATALOG_INDEX = 'registry.redhat.io/redhat/redhat-operator-index:v4.20'
+PHASES = [
+    ('Wait for cluster to be reachable', 5),
+    ('install operator', 20),
+    ('Wait for CSV to appear and label resources under test', 90),
+    ('run CNF suite', 400),
+    ('Parse claim file', 5),
+    ('unlabel operator', 5),
+    ('Remove operator', 15),
+    ('Wait for cleanup to finish', 30),
+]
+CSV_HEADER = 'CNFName,OperatorVersion,testID,Suite,Description,State,StartTime,EndTime,SkipReason,CheckDetails,CNFType'
+TEST_CASES = [f'{suite}-check-{n}' for suite in ('access-control', 'lifecycle', 'networking', 'observability',
+                                                 'operator', 'platform-alteration', 'affiliated-certification')
+              for n in range(12)]
+CERTSUITE_LINE = ('time="{ts}" level=info msg="Running test case {test} for {operator}: '
+                  'checking container image, pod security context and service account bindings"\n')
+
+# (name, path template, kind); {report} cycles through the reports, {latest} is the newest
+ROUTES = [
+    ('status', '/api/status', 'json'),
+    ('results_latest', '/api/results/latest', 'json'),
+    ('live_output', '/api/live-output', 'json'),
+    ('completed_tests', '/api/completed-tests', 'json'),
+    ('timing', '/api/timing', 'json'),
+    ('reports', '/api/reports?limit=50', 'json'),
+    ('report_summary', '/api/report-summary?report={report}', 'json'),
+    ('testcases', '/api/testcases?limit=30', 'json'),
+    ('download_csv', '/api/download/csv?report={latest}', 'body'),
+    ('download_csv_combined', '/api/download/csv/combined', 'body'),
+    ('results_query', '/api/results/query?limit=30&result=failed&group_by=CNFName,testID', 'json'),
+    ('results_query_csv', '/api/results/query?limit=30&operator=nfd&format=csv', 'body'),
+    ('cluster_info', '/api/cluster/info', 'json'),
+    ('test_config', '/api/test/config', 'json'),
+    ('stream', '/api/stream', 'stream'),
+    ('metrics', '/metrics', 'body'),
+]
+
+SSH_SHIM = """#!/bin/bash
+# Fake ssh for the benchmark: drop the options and the host, run the command locally
+while [ $# -gt 0 ]; do
+	case "$1" in
+	-o | -i | -p | -l) shift 2 ;;
+	-*) shift ;;
+	*) break ;;
+	esac
+done
+shift
+echo "$*" | head -c 200 | tr '\\n' ' ' >>"$BENCH_CALLS_LOG"
+echo >>"$BENCH_CALLS_LOG"
+exec bash -c "$*"
+"""
+STUB = """#!/bin/bash
+# Benchmark stub: there is no cluster or test session here
+echo "$(basename "$0"): not available in the benchmark" >&2
+exit 1
+"""
+
+
+def write_executable(path, content):
+    with open(path, 'w') as f:
+        f.write(content)
+    os.chmod(path, 0o755)
+
+
+def build_fixture(report_dir, reports, operators, large_reports, log_mb, csv_mb, claim_mb, seed=0):
+    """Generate ``reports`` report_* trees, one per day, newest last"""
+    rng = random.Random(seed)
+    os.makedirs(report_dir, exist_ok=True)
+    now = datetime.now().replace(microsecond=0)
+    for number in range(reports):
+        started = now - timedelta(days=reports - number)
+        stamp = started.strftime('%Y-%m-%d_%H-%M-%S_UTC')
+        folder = os.path.join(report_dir, f'report_{stamp}')
+        os.makedirs(folder, exist_ok=True)
+        large = number >= reports - large_reports
+        chosen = rng.sample(OPERATORS, min(operators, len(OPERATORS)))
+        write_report(folder, stamp, started, chosen, rng,
+                     log_bytes=int(log_mb * 2**20) if large else 0,
+                     csv_bytes=int(csv_mb * 2**20) if large else 0,
+                     claim_bytes=int(claim_mb * 2**20) if large else 0)
+        # Folder mtime drives the dashboard's ordering, like a real run finishing
+        finished = started.timestamp() + 3600
+        os.utime(folder, (finished, finished))
+
+
+def write_report(folder, stamp, started, operators, rng, log_bytes, csv_bytes, claim_bytes):
+    clock = started.timestamp()
+    log = []
+    phases = []
+    waits = []
+    rows = []
+    for operator in operators:
+        os.makedirs(os.path.join(folder, operator), exist_ok=True)
+        header = f'********* package= {operator} catalog index= {CATALOG_INDEX} **********'
+        log.append(header)
+        phases.append(f'{int(clock)}\t{header}')
+        log.append(f'namespace= test-{operator}')
+        failed = rng.random() < 0.15
+        for phase, seconds in PHASES:
+            if failed and phase == 'run CNF suite':
+                log.append('Operator failed to install, continue')
+                phases.append(f'{int(clock)}\tOperator failed to install, continue')
+                break
+            if phase == 'run CNF suite':
+                log.append(f'operator {operator} installed')
+            log.append(phase)
+            phases.append(f'{int(clock)}\t{phase}')
+            duration = seconds * rng.uniform(0.7, 1.5)
+            if phase.startswith('Wait'):
+                waits.append(f'{int(clock)}\t{operator}\t{phase}\t{int(duration)}\tok')
+            clock += duration
+        if not failed:
+            results = {}
+            for test in TEST_CASES:
+                state = rng.choices(['passed', 'failed', 'skipped'], [0.8, 0.1, 0.1])[0]
+                suite = test.rsplit("-check", 1)[0]
+                rows.append(f'{operator},v1.0.0,{test},{suite},"Checks {test}",{state},'
+                            f'{int(clock)},{int(clock) + 2},,,non-telco')
+                results[test] = {'testID': {'id': test, 'suite': suite, 'tags': 'common'}, 'state': state,
+                                 'duration': 2, 'capturedTestOutput': f'Checked {test} for {operator}'}
+            write_claim(os.path.join(folder, operator, 'claim.json'), results, claim_bytes)
+    log.append('DONE')
+    phases.append(f'{int(clock)}\tDONE')
+
+    with open(os.path.join(folder, f'output_{stamp}.log'), 'w') as f:
+        f.write('\n'.join(log[:-1]) + '\n')
+        # Large logs: certsuite chatter before the final line, as in a real run
+        line = CERTSUITE_LINE.format(ts=stamp, test=TEST_CASES[0], operator=operators[-1])
+        f.write(line * (log_bytes // len(line)))
+        f.write(log[-1] + '\n')
+    with open(os.path.join(folder, 'phase-times.log'), 'w') as f:
+        f.write('\n'.join(phases) + '\n')
+    with open(os.path.join(folder, 'waits.log'), 'w') as f:
+        f.write('\n'.join(waits) + '\n')
+    with open(os.path.join(folder, 'operator-list.txt'), 'w') as f:
+        f.write(''.join(f'{operator},{CATALOG_INDEX}\n' for operator in operators))
+    with open(os.path.join(folder, 'index.html'), 'w') as f:
+        f.write(''.join(f'<a href="{operator}/">{operator}</a>\n' for operator in operators))
+    with open(os.path.join(folder, 'results.csv'), 'w') as f:
+        f.write(CSV_HEADER + '\n')
+        body = ''.join(row + '\n' for row in rows)
+        f.write(body)
+        # Multi-MB results.csv: repeat the rows (a long operator list in a real run)
+        if body:
+            f.write(body * (csv_bytes // len(body)))
+
+
+def write_claim(path, results, pad_bytes):
+    """certsuite claim.json; large ones carry their size in node and configuration dumps, as real ones do"""
+    node = {'metadata': {'name': 'worker', 'labels': {'node-role.kubernetes.io/worker': ''}},
+            'status': {'images': [{'names': ['registry.example.com/image@sha256:' + '0' * 64]}] * 20}}
+    count = pad_bytes // len(json.dumps(node)) if pad_bytes else 0
+    claim = {'claim': {'configurations': {'operators': [], 'pods': []}, 'nodes': {'nodeSummary': [node] * count},
+                       'results': results, 'versions': {'certSuite': 'v5.0.0', 'claimFormat': 'v0.5.0'}}}
+    with open(path, 'w') as f:
+        json.dump(claim, f)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def peak_rss_kb(pid):
+    """VmHWM (peak resident set size) of a process in kB"""
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1])
+    return 0
+
+
+def count_lines(path):
+    try:
+        with open(path, 'rb') as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+class Dashboard:
+    """web-dashboard.py running against the fake remote host"""
+
+    def __init__(self, workdir, report_dir, collector_interval, backend='ssh'):
+        self.workdir = workdir
+        self.calls_log = os.path.join(workdir, 'remote-calls.log')
+        self.port = free_port()
+        self.base_url = f'http://127.0.0.1:{self.port}'
+        bin_dir = os.path.join(workdir, 'bin')
+        os.makedirs(bin_dir, exist_ok=True)
+        write_executable(os.path.join(bin_dir, 'ssh'), SSH_SHIM)
+        for stub in ('oc', 'tmux'):
+            write_executable(os.path.join(bin_dir, stub), STUB)
+        live_file = os.path.join(workdir, 'live-output.log')
+        open(live_file, 'w').close()
+        self.env = dict(
+            os.environ,
+            PATH=bin_dir + os.pathsep + os.environ.get('PATH', ''),
+            BENCH_CALLS_LOG=self.calls_log,
+            REMOTE_HOST='benchmark-host',
+            SSH_TRANSPORT='subprocess',
+            REPORT_DIR=report_dir,
+            REMOTE_BASE_DIR=workdir,
+            LIVE_OUTPUT_FILE=live_file,
+            LOG_DIR=os.path.join(workdir, 'logs'),
+            XDG_CACHE_HOME=os.path.join(workdir, 'cache'),
+            DASHBOARD_PORT=str(self.port),
+            COLLECTOR_INTERVAL=str(collector_interval),
+            BACKEND=backend,
+            DEMO_MODE='false',
+            DEBUG='false',
+        )
+        for name in ('REPORT_INDEX_PATH', 'SSH_KEY_PATH', 'SSH_USER'):
+            self.env.pop(name, None)
+        self.process = None
+
+    def start(self, timeout=30):
+        shutil.rmtree(self.env['LOG_DIR'], ignore_errors=True)
+        shutil.rmtree(self.env['XDG_CACHE_HOME'], ignore_errors=True)
+        self.log = open(os.path.join(self.workdir, 'dashboard.log'), 'w')
+        self.process = subprocess.Popen([sys.executable, DASHBOARD], env=self.env,
+                                        stdout=self.log, stderr=subprocess.STDOUT)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f'dashboard exited with {self.process.returncode}, see {self.log.name}')
+            try:
+                urllib.request.urlopen(self.base_url + '/', timeout=2).read()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f'dashboard did not answer within {timeout}s, see {self.log.name}')
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.process:
+            self.log.close()
+
+    def remote_calls(self):
+        return count_lines(self.calls_log)
+
+    def peak_rss_kb(self):
+        return peak_rss_kb(self.process.pid)
+
+
+def request_once(base_url, path, kind, timeout):
+    """Latency of one request in seconds; raises on HTTP errors"""
+    started = time.perf_counter()
+    with urllib.request.urlopen(base_url + path, timeout=timeout) as response:
+        if kind == 'stream':
+            for line in response:
+                if line.startswith(b'data:'):
+                    break
+        else:
+            while response.read(65536):
+                pass
+    return time.perf_counter() - started
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def run_route(dashboard, name, template, kind, reports, requests, concurrency, timeout):
+    paths = [template.format(report=reports[i % len(reports)], latest=reports[0])
+             for i in range(requests)]
+    calls_before = dashboard.remote_calls()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def one(path):
+        try:
+            latency = request_once(dashboard.base_url, path, kind, timeout)
+            with lock:
+                latencies.append(latency)
+        except (OSError, urllib.error.HTTPError) as e:
+            with lock:
+                errors.append(str(e))
+
+    started = time.perf_counter()
+    # The first request runs alone: it pays for cold caches
+    one(paths[0])
+    cold = latencies[0] if latencies else None
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, paths[1:]))
+    elapsed = time.perf_counter() - started
+    calls = dashboard.remote_calls() - calls_before
+    return {
+        'route': name,
+        'path': template,
+        'requests': requests,
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'cold_ms': round(cold * 1000, 1) if cold is not None else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 1) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1) if latencies else None,
+        'requests_per_second': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'remote_calls': calls,
+        'remote_calls_per_request': round(calls / requests, 2),
+        'peak_rss_mb': round(dashboard.peak_rss_kb() / 1024, 1),
+    }
+
+
+def print_table(results):
+    columns = [('route', 22), ('cold_ms', 9), ('p50_ms', 9), ('p99_ms', 9), ('requests_per_second', 8),
+               ('remote_calls_per_request', 8), ('peak_rss_mb', 9), ('errors', 6)]
+    titles = {'requests_per_second': 'req/s', 'remote_calls_per_request': 'ssh/req',
+              'peak_rss_mb': 'rss_mb'}
+    print('  '.join(titles.get(name, name).rjust(width) if index else titles.get(name, name).ljust(width)
+                    for index, (name, width) in enumerate(columns)))
+    for result in results:
+        cells = []
+        for index, (name, width) in enumerate(columns):
+            value = '-' if result[name] is None else str(result[name])
+            cells.append(value.rjust(width) if index else value.ljust(width))
+        print('  '.join(cells))
+    for result in results:
+        if result['first_error']:
+            print(f"{result['route']}: {result['errors']} error(s), first: {result['first_error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the web dashboard against a local fake remote host')
+    parser.add_argument('--workdir', help='where the fixture and logs go (default: a temporary directory)')
+    parser.add_argument('--reports', type=int, default=300, help='report_* trees to generate')
+    parser.add_argument('--operators', type=int, default=12, help='operators per report')
+    parser.add_argument('--large-reports', type=int, default=5, help='newest reports with large files')
+    parser.add_argument('--log-mb', type=float, default=20, help='output log size of the large reports')
+    parser.add_argument('--csv-mb', type=float, default=4, help='results.csv size of the large reports')
+    parser.add_argument('--claim-mb', type=float, default=2, help='size of each claim.json in the large reports')
+    parser.add_argument('--regenerate', action='store_true', help='rebuild an existing fixture in --workdir')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent requests per route')
+    parser.add_argument('--requests', type=int, default=40, help='requests per route')
+    parser.add_argument('--timeout', type=float, default=120, help='per-request timeout in seconds')
+    parser.add_argument('--routes', default='', help='comma-separated route names (default: all)')
+    parser.add_argument('--collector-interval', type=float, default=3600,
+                        help='COLLECTOR_INTERVAL of the dashboard; the default keeps background '
+                             'refreshes out of the per-route remote call counts')
+    parser.add_argument('--backend', choices=('ssh', 'local'), default='ssh',
+                        help='BACKEND of the dashboard: the fake ssh, or direct reads of the fixture')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    routes = ROUTES
+    if args.routes:
+        wanted = set(args.routes.split(','))
+        unknown = wanted - {name for name, _, _ in ROUTES}
+        if unknown:
+            parser.error(f"unknown route(s): {', '.join(sorted(unknown))}")
+        routes = [route for route in ROUTES if route[0] in wanted]
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='dashboard-benchmark-')
+    report_dir = os.path.join(workdir, 'reports')
+    if args.regenerate:
+        shutil.rmtree(report_dir, ignore_errors=True)
+    if not os.path.isdir(report_dir):
+        print(f'Generating {args.reports} reports in {report_dir}...')
+        build_fixture(report_dir, args.reports, args.operators, args.large_reports, args.log_mb, args.csv_mb,
+                      args.claim_mb)
+    reports = sorted((name for name in os.listdir(report_dir) if name.startswith('report_')), reverse=True)
+    if not reports:
+        sys.exit(f'No report_* folders in {report_dir}')
+
+    dashboard = Dashboard(workdir, report_dir, args.collector_interval, args.backend)
+    print(f'Starting dashboard on {dashboard.base_url} ({len(reports)} reports, {args.backend} backend)...')
+    dashboard.start()
+    results = []
+    try:
+        for name, template, kind in routes:
+            results.append(run_route(dashboard, name, template, kind, reports,
+                                     args.requests, args.concurrency, args.timeout))
+    finally:
+        dashboard.stop()
+
+    print()
+    print_table(results)
+    print(f'\nWork directory: {workdir}')
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'reports': len(reports),
+                'backend': args.backend,
+                'concurrency': args.concurrency,
+                'requests': args.requests,
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
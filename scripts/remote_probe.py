@@ -0,0 +1,897 @@
+#!/usr/bin/env python3
+"""
+Operator Test Dashboard - Remote Probe
+Version: 1.0
+
+Collects everything the dashboard needs to know about the test host in a
+single execution and prints it as one JSON document. The dashboard streams
+this file to the remote interpreter over SSH (``python3 - status ...``), so
+nothing has to be installed on the test host. When the dashboard runs on the
+test host itself (BACKEND=local) it imports this module and calls the
+collectors directly instead.
+
+Standard library only; must keep working on the Python 3.6 shipped with RHEL 8.
+
+Usage:
+  python3 remote_probe.py status --report-dir /var/www/html --session operator-test \
+      [--live-file /tmp/operator-test-output.log --live-since 0 --live-id ID] [--live-lines 200]
+  python3 remote_probe.py reports --report-dir /var/www/html [--newest] [--names report_A report_B]
+  python3 remote_probe.py claims --report-dir /var/www/html --names report_A report_B
+  python3 remote_probe.py inventory [--chunk-size 500]
+  python3 remote_probe.py tail --file /tmp/operator-test-output.log --session operator-test \
+      [--since 0 --id ID] [--lines 200]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from itertools import accumulate, chain
+
+# Terminal control sequences written to the tmux pipe-pane capture (colors, cursor moves, titles)
+ANSI_RE = re.compile(r'\x1b(\[[0-9;?]*[ -/]*[@-~]|\][^\x07\x1b]*(\x07|\x1b\\)|[()][0-9A-Za-z]|[=>])')
+# Upper bound of bytes returned by a single tail read
+TAIL_MAX_BYTES = 1024 * 1024
+# Parser state of logs still being written, so repeated probes only parse the new tail
+LOG_CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                              'operator-test-dashboard', 'log-parser.json')
+LOG_CACHE_MAX_AGE = 24 * 3600
+# Read size when streaming claim.json files
+CLAIM_CHUNK_SIZE = 64 * 1024
+
+
+def run(args):
+    """Run a local command and return (stdout, exit status); 127 if it cannot start"""
+    try:
+        result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                universal_newlines=True)
+    except OSError:
+        return '', 127
+    return result.stdout, result.returncode
+
+
+def tmux_session_running(session):
+    _, returncode = run(['tmux', 'has-session', '-t', session])
+    return returncode == 0
+
+
+def tmux_capture(session, start):
+    output, _ = run(['tmux', 'capture-pane', '-t', session, '-p', '-S', str(start)])
+    return output
+
+
+def tmux_session_capture(session):
+    """(session creation time, whether the pane output is being piped to a file)"""
+    output, _ = run(['tmux', 'display-message', '-p', '-t', session, '#{session_created} #{pane_pipe}'])
+    fields = output.split()
+    if len(fields) != 2:
+        return '', False
+    return fields[0], fields[1] == '1'
+
+
+def clean_terminal_text(text):
+    """Turn raw pane output into plain lines, as ``tmux capture-pane`` would show them"""
+    lines = []
+    for line in text.split('\n'):
+        line = ANSI_RE.sub('', line).rstrip('\r')
+        # A bare carriage return redraws the line: keep what was drawn last
+        lines.append(line.rsplit('\r', 1)[-1])
+    return '\n'.join(lines)
+
+
+def capture_file_id(path, session):
+    """Identity of the capture file for the current session, or '' if it is missing or stale"""
+    created, piped = tmux_session_capture(session)
+    # Without an active pipe-pane the file is left over from an earlier run
+    if not piped:
+        return ''
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ''
+    return '{}-{}'.format(created, st.st_ino)
+
+
+def tail_file(path, file_id, since=-1, lines=200):
+    """Complete lines appended to path after byte offset ``since``.
+
+    When the cursor is missing or belongs to another file (new run, rotated
+    file) the last ``lines`` lines are returned instead and ``reset`` is set.
+    ``next`` is the offset to pass as ``since`` on the following call.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        reset = since < 0 or since > size
+        start = max(0, size - TAIL_MAX_BYTES) if reset else since
+        f.seek(start)
+        chunk = f.read(TAIL_MAX_BYTES)
+    if reset and start > 0:
+        # Drop the partial first line
+        cut = chunk.find(b'\n') + 1
+        chunk = chunk[cut:]
+        start += cut
+    # Only hand out complete lines; a trailing partial line is picked up next time
+    last_newline = chunk.rfind(b'\n')
+    if last_newline >= 0:
+        chunk = chunk[:last_newline + 1]
+    elif len(chunk) < TAIL_MAX_BYTES:
+        chunk = b''
+    text = clean_terminal_text(chunk.decode('utf-8', 'replace'))
+    text = text[:-1] if text.endswith('\n') else text
+    if reset:
+        text = '\n'.join(text.split('\n')[-lines:])
+    return {
+        'id': file_id,
+        'offset': start,
+        'next': start + len(chunk),
+        'reset': reset,
+        'data': text,
+    }
+
+
+def tail_live_output(path, session, since=-1, file_id='', lines=200):
+    """Incremental read of the session's capture file, falling back to the tmux scrollback"""
+    current_id = capture_file_id(path, session) if path else ''
+    if current_id:
+        return tail_file(path, current_id, since if file_id == current_id else -1, lines)
+    # No capture file (session not started by the dashboard): last lines of the scrollback
+    scrollback = tmux_capture(session, '-').splitlines()
+    return {
+        'id': '',
+        'offset': 0,
+        'next': -1,
+        'reset': True,
+        'data': '\n'.join(scrollback[-lines:]).strip(),
+    }
+
+
+def newest(pattern, want_dir=False):
+    """Newest path matching a glob by mtime (like ``ls -td pattern | head -1``)"""
+    paths = [p for p in glob.glob(pattern) if os.path.isdir(p) == want_dir]
+    if not paths:
+        return ''
+    return max(paths, key=lambda p: os.stat(p).st_mtime)
+
+
+def operator_dirs(report_dir):
+    """Operator result folders in a report (one per tested operator)"""
+    try:
+        return sorted(entry.name for entry in os.scandir(report_dir)
+                      if entry.is_dir() and not entry.name.startswith('.'))
+    except OSError:
+        return []
+
+
+class LogParser:
+    """Streaming parser for a batch-runner log (output_*.log).
+
+    Walks the log once, line by line, and builds one record per operator
+    from the markers run-basic-batch-operators-test.sh writes with
+    echo_color. Lines are matched exactly, so command output copied into
+    the log cannot be mistaken for a marker, and a failure is attributed
+    to the operator whose header it follows. The log carries no
+    timestamps; phases are kept in the order they were reached. The same
+    markers with their time are in phase-times.log, which is fed through
+    this parser with ``ts`` set (see ``collect_phase_times``).
+
+    The parser state is plain JSON so a later call can resume from
+    ``offset`` when the log has grown.
+    """
+
+    HEADER_RE = re.compile(r'^\*+ package= (\S+) catalog index= (\S*)')
+    NAMESPACE_RE = re.compile(r'^namespace= (\S+)$')
+    INSTALLED_RE = re.compile(r'^operator (\S+) installed$')
+    PHASES = {
+        'Cluster cleanup': 'cleanup',
+        'install operator': 'install',
+        'Wait for CSV to appear and label resources under test': 'wait_csv',
+        'run CNF suite': 'cnf_suite',
+        'unlabel operator': 'unlabel',
+        'Remove operator': 'uninstall',
+        'Wait for cleanup to finish': 'wait_cleanup',
+        'Parse claim file': 'parse_claim',
+    }
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.offset = state.get('offset', 0)
+        self.records = state.get('records', [])
+        self.done = state.get('done', False)
+
+    def state(self):
+        return {'offset': self.offset, 'records': self.records, 'done': self.done}
+
+    def feed_file(self, path):
+        """Parse complete lines from ``offset`` to the end of the file"""
+        with open(path, 'rb') as f:
+            f.seek(self.offset)
+            for raw in f:
+                # A partial last line is still being written: pick it up next time
+                if not raw.endswith(b'\n'):
+                    break
+                self.offset += len(raw)
+                self.feed_line(raw.decode('utf-8', 'replace').rstrip('\r\n'))
+
+    def feed_line(self, line, ts=None):
+        header = self.HEADER_RE.match(line)
+        if header:
+            package = header.group(1)
+            self.records.append({
+                'package': package,
+                'name': package.rstrip('+-'),
+                'catalog_index': header.group(2),
+                'namespace': '',
+                'phases': [],
+                'status': 'running',
+            })
+            if ts is not None:
+                self.records[-1]['started'] = ts
+                self.records[-1]['phase_starts'] = []
+            return
+        if line == 'DONE':
+            self.done = True
+            if ts is not None and self.records:
+                self.records[-1]['finished'] = ts
+        if not self.records:
+            return
+        record = self.records[-1]
+        namespace = self.NAMESPACE_RE.match(line)
+        installed = self.INSTALLED_RE.match(line)
+        if namespace:
+            record['namespace'] = namespace.group(1)
+        elif installed:
+            record['status'] = 'installed'
+            record['name'] = installed.group(1)
+        elif line == 'Operator failed to install, continue':
+            record['status'] = 'failed'
+        elif line in self.PHASES:
+            record['phases'].append(self.PHASES[line])
+            if ts is not None:
+                record['phase_starts'].append([self.PHASES[line], ts])
+
+    def summary(self):
+        records = [dict(record) for record in self.records]
+        for index, record in enumerate(records):
+            finished = self.done or index < len(records) - 1
+            # The CNF suite exits with errors when the run moves on before unlabeling
+            if finished and 'cnf_suite' in record['phases'] and 'unlabel' not in record['phases']:
+                record['suite_error'] = True
+            if finished and record['status'] == 'running':
+                record['status'] = 'incomplete'
+        return summarize_records(records, self.done)
+
+
+def summarize_records(records, done):
+    """Log summary of parsed operator records (see LogParser.summary)"""
+    installed = [r['name'] for r in records if r['status'] == 'installed']
+    failed = [r['name'] for r in records if r['status'] == 'failed']
+    return {
+        'total': len(records),
+        'installed': len(installed),
+        'failed': len(failed),
+        'installed_operators': installed,
+        'failed_operators': sorted(set(failed), key=failed.index),
+        'operators': records,
+        'done': done,
+    }
+
+
+def collect_phase_times(path):
+    """Durations per operator and phase from phase-times.log ("<epoch>\t<message>" lines).
+
+    A phase lasts until the next phase marker; "prepare" is the time from the
+    operator header to its first phase. The operator still running has no
+    end: its ``seconds`` is None and ``started`` lets the caller compute
+    the elapsed time.
+    """
+    parser = LogParser()
+    try:
+        with open(path, errors='replace') as f:
+            for line in f:
+                stamp, _, message = line.rstrip('\n').partition('\t')
+                try:
+                    parser.feed_line(message, int(stamp))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    records = [record for record in parser.summary()['operators'] if 'started' in record]
+    timings = []
+    for index, record in enumerate(records):
+        if index + 1 < len(records):
+            end = records[index + 1]['started']
+        else:
+            end = record.get('finished')
+        marks = [['prepare', record['started']]] + record['phase_starts']
+        phases = {}
+        for position, (phase, start) in enumerate(marks):
+            phase_end = marks[position + 1][1] if position + 1 < len(marks) else end
+            if phase_end is not None:
+                phases[phase] = phases.get(phase, 0) + phase_end - start
+        timings.append({
+            'name': record['name'],
+            'status': record['status'],
+            'started': record['started'],
+            'seconds': end - record['started'] if end is not None else None,
+            'phase': marks[-1][0],
+            'phases': phases,
+        })
+    return timings
+
+
+def collect_waits(paths):
+    """Totals per wait from waits.log files ("<epoch>\t<operator>\t<wait>\t<seconds>\t<status>" lines)"""
+    waits = {}
+    for path in paths:
+        try:
+            with open(path, errors='replace') as f:
+                for line in f:
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) != 5 or not fields[3].isdigit():
+                        continue
+                    seconds = int(fields[3])
+                    entry = waits.setdefault(fields[2], {'count': 0, 'seconds': 0, 'max_seconds': 0, 'failed': 0})
+                    entry['count'] += 1
+                    entry['seconds'] += seconds
+                    entry['max_seconds'] = max(entry['max_seconds'], seconds)
+                    if fields[4] != '0':
+                        entry['failed'] += 1
+        except OSError:
+            continue
+    return waits
+
+
+def operator_list(path):
+    """Operator names of operator-list.txt ("package[,catalog index]" lines), suffixes removed"""
+    try:
+        with open(path, errors='replace') as f:
+            return [line.split(',')[0].strip().rstrip('+-') for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def load_log_cache():
+    try:
+        with open(LOG_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_log_cache(cache):
+    """Write the cache atomically; logs idle for longer than LOG_CACHE_MAX_AGE are dropped"""
+    now = time.time()
+    cache = dict((path, entry) for path, entry in cache.items() if now - entry['mtime'] < LOG_CACHE_MAX_AGE)
+    try:
+        os.makedirs(os.path.dirname(LOG_CACHE_FILE), exist_ok=True)
+        # Unique per thread too: the dashboard's local backend probes from several threads
+        tmp = '{}.{}.{}'.format(LOG_CACHE_FILE, os.getpid(), threading.get_ident())
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.rename(tmp, LOG_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def parse_log(path):
+    """Parse a log, reusing the cached state of an earlier call.
+
+    The cache is keyed by (path, size, mtime): an unchanged log is not read
+    at all and a grown log is only parsed from where the last call stopped.
+    Only recently modified logs (a run in progress) are cached.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return LogParser().summary()
+    live = time.time() - st.st_mtime < LOG_CACHE_MAX_AGE
+    cache = load_log_cache() if live else {}
+    entry = cache.get(path)
+    if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime:
+        return LogParser(entry['state']).summary()
+    # Resume only if the log grew; anything else means it was rewritten
+    resumable = entry and entry['size'] <= st.st_size and entry['state']['offset'] <= st.st_size
+    parser = LogParser(entry['state'] if resumable else None)
+    try:
+        parser.feed_file(path)
+    except OSError:
+        pass
+    if live:
+        cache[path] = {'size': st.st_size, 'mtime': st.st_mtime, 'state': parser.state()}
+        save_log_cache(cache)
+    return parser.summary()
+
+
+def directory_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def list_report_dirs(report_dir):
+    """report_* and debug_* (DEBUG_RUN) directories with their mtime, newest first"""
+    reports = []
+    try:
+        for entry in os.scandir(report_dir):
+            if entry.name.startswith(('report_', 'debug_')) and entry.is_dir():
+                reports.append({'name': entry.name, 'mtime': entry.stat().st_mtime})
+    except OSError:
+        pass
+    reports.sort(key=lambda report: report['mtime'], reverse=True)
+    return reports
+
+
+def shard_dirs(report_dir):
+    """(id, folder) of the shards of a run-sharded-batch-operators-test.sh report, by id"""
+    try:
+        entries = [entry for entry in os.scandir(os.path.join(report_dir, '.shards'))
+                   if entry.is_dir() and entry.name.isdigit()]
+    except OSError:
+        return []
+    return [(entry.name, entry.path) for entry in sorted(entries, key=lambda entry: int(entry.name))]
+
+
+def collect_report(report_dir):
+    log_file = newest(os.path.join(report_dir, 'output_*.log'))
+    operators = operator_list(os.path.join(report_dir, 'operator-list.txt'))
+    shards = shard_dirs(report_dir)
+    # A sharded run logs the operators in each shard's folder; the report's own log
+    # only has the runner's messages, and its DONE once all shards have finished
+    log_files = [path for path in [log_file] + [newest(os.path.join(path, 'output_*.log'))
+                                                for _, path in shards] if path]
+    log_stats = []
+    for path in log_files:
+        try:
+            log_stats.append(os.stat(path))
+        except OSError:
+            pass
+    log = parse_log(log_file) if log_file else None
+    if shards:
+        records = [record for path in log_files if path != log_file for record in parse_log(path)['operators']]
+        log = summarize_records(records, bool(log and log['done']))
+        timings = []
+        for shard_id, path in shards:
+            for timing in collect_phase_times(os.path.join(path, 'phase-times.log')):
+                timing['shard'] = shard_id
+                timings.append(timing)
+    else:
+        timings = collect_phase_times(os.path.join(report_dir, 'phase-times.log'))
+    return {
+        'name': os.path.basename(report_dir),
+        'path': report_dir,
+        'mtime': directory_mtime(report_dir),
+        'operators_total': len(operators),
+        'operator_list': operators,
+        'operator_dirs': operator_dirs(report_dir),
+        'shards': [{'id': shard_id, 'operators': operator_list(os.path.join(path, 'operator-list.txt'))}
+                   for shard_id, path in shards],
+        'log_file': log_file,
+        'log_size': sum(st.st_size for st in log_stats),
+        'log_mtime': max([st.st_mtime for st in log_stats] or [0]),
+        'log': log,
+        'timings': timings,
+        'waits': collect_waits([os.path.join(path, 'waits.log') for path in [report_dir] + [p for _, p in shards]]),
+    }
+
+
+def collect_status(report_dir, session, live_file='', live_since=-1, live_id='', live_lines=0):
+    running = tmux_session_running(session)
+    current_operator = ''
+    recent_output = ''
+    live = None
+    if running:
+        for line in reversed(tmux_capture(session, -100).splitlines()):
+            if 'package=' in line:
+                current_operator = (line.rsplit('package= ', 1)[-1].split() or [''])[0]
+                break
+        recent_output = '\n'.join(tmux_capture(session, -20).splitlines()[-15:]).strip()
+        if live_lines:
+            live = tail_live_output(live_file, session, live_since, live_id, live_lines)
+    latest = newest(os.path.join(report_dir, 'report_*'), want_dir=True)
+    return {
+        'test_running': running,
+        'current_operator': current_operator,
+        'recent_output': recent_output,
+        'live': live,
+        'latest_report': collect_report(latest) if latest else None,
+        'report_dir_mtime': directory_mtime(report_dir),
+        # Remote clock, for the elapsed time of the running operator
+        'now': time.time(),
+    }
+
+
+def collect_reports(report_dir, names, include_newest=False):
+    """Listing of all reports, plus full facts for the requested ones"""
+    reports = list_report_dirs(report_dir)
+    wanted = list(names)
+    if include_newest and reports and reports[0]['name'] not in wanted:
+        wanted.append(reports[0]['name'])
+    listed = set(report['name'] for report in reports)
+    return {
+        'report_dir_mtime': directory_mtime(report_dir),
+        'reports': reports,
+        'details': [collect_report(os.path.join(report_dir, name)) for name in wanted if name in listed],
+    }
+
+
+class JSONStream:
+    """Forward-only reader over a large JSON document.
+
+    Values the caller asks for are decoded one at a time with the json
+    module; everything else is skipped by counting brackets outside strings
+    without building objects. Memory is bounded by the largest decoded
+    value, not by the size of the document.
+    """
+
+    STRUCTURE_RE = re.compile(r'["{}\[\]]')
+    STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+    STRING_END_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+    WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+    NUMBER_TAIL_RE = re.compile(r'[0-9.eE+-]*')
+    NON_BRACKETS = bytes(sorted(set(range(256)) - set(b'{}[]')))
+    DEPTH = {ord('{'): 1, ord('['): 1, ord('}'): -1, ord(']'): -1}
+
+    def __init__(self, f, chunk_size=CLAIM_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Append the next chunk to the unconsumed part of the buffer; False at the end.
+
+        Chunks grow with the unconsumed part, so a value that spans many
+        chunks is not rescanned from its start for every one of them.
+        """
+        chunk = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message):
+        return ValueError('{} in JSON document'.format(message))
+
+    def peek(self):
+        """Next non-whitespace character, '' at the end of the document"""
+        while True:
+            self.pos = self.WHITESPACE_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self._error('expected {!r}'.format(char))
+        self.pos += 1
+
+    def decode(self):
+        """Decode the next value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the end of the buffer (94786. | 5) goes on in the next chunk
+            if (isinstance(value, (int, float)) and self.NUMBER_TAIL_RE.match(self.buf, end).end() == len(self.buf)
+                    and self._fill()):
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Move past the next value without decoding it"""
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in '{[':
+            self.decode()
+            return
+        depth = 0
+        # Whole buffers at a time while the value goes on past them: strings
+        # are dropped and the bracket depth summed without a Python loop
+        while True:
+            segment = self.buf[self.pos:]
+            end = len(self.buf)
+            if '\\"' in segment:
+                outside = self.STRING_RE.sub('', segment)
+                if '"' in outside:
+                    # The buffer ends in a string: stop at its opening quote, the last unescaped one
+                    outside = outside[:outside.index('"')]
+                    end = self.buf.rindex('"', self.pos)
+                    while self._escaped(end):
+                        end = self.buf.rindex('"', self.pos, end)
+            else:
+                # No escaped quotes: every other piece is a string
+                parts = segment.split('"')
+                outside = ''.join(parts[0::2])
+                if len(parts) % 2 == 0:
+                    end = self.buf.rindex('"')
+            brackets = outside.encode().translate(None, self.NON_BRACKETS)
+            depths = list(accumulate(chain([depth], map(self.DEPTH.__getitem__, brackets))))
+            if 0 in depths[1:]:
+                break
+            self.pos = end
+            depth = depths[-1]
+            if not self._fill():
+                raise self._error('unexpected end')
+        # The value ends in this buffer: find where, token by token
+        while True:
+            match = self.STRUCTURE_RE.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise self._error('unexpected end')
+                continue
+            char = match.group()
+            if char == '"':
+                self.pos = match.start()
+                self._skip_string()
+                continue
+            self.pos = match.end()
+            depth += 1 if char in '{[' else -1
+            if depth == 0:
+                return
+
+    def _escaped(self, index):
+        start = index
+        while start > 0 and self.buf[start - 1] == '\\':
+            start -= 1
+        return (index - start) % 2 == 1
+
+    def _skip_string(self):
+        while True:
+            match = self.STRING_END_RE.match(self.buf, self.pos + 1)
+            if match:
+                self.pos = match.end()
+                return
+            if not self._fill():
+                raise self._error('unterminated string')
+
+    def keys(self):
+        """Keys of the object at the current position, in order.
+
+        The caller consumes each key's value (``decode`` or ``skip``) before
+        asking for the next key.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self._error("expected ',' or '}'")
+
+
+def claim_results(path):
+    """[test id, suite, state, duration] of every test case in a certsuite claim.json.
+
+    Only the ``claim.results`` section is decoded, one test case at a time;
+    the large sections (configurations, nodes, captured output of other
+    tests) are skipped over.
+    """
+    rows = []
+    with open(path, encoding='utf-8', errors='replace') as f:
+        stream = JSONStream(f)
+        for key in stream.keys():
+            if key != 'claim':
+                stream.skip()
+                continue
+            for section in stream.keys():
+                if section != 'results':
+                    stream.skip()
+                    continue
+                for test_id in stream.keys():
+                    value = stream.decode()
+                    # Older claims hold a list of results per test case
+                    for result in value if isinstance(value, list) else [value]:
+                        test = result.get('testID') or {}
+                        duration = result.get('duration')
+                        rows.append([test.get('id') or test_id, test.get('suite', ''), result.get('state', ''),
+                                     duration if isinstance(duration, (int, float)) else None])
+    return rows
+
+
+def collect_claims(report_dir, names):
+    """Test case results from the claim.json of every operator folder of the named reports"""
+    listed = set(report['name'] for report in list_report_dirs(report_dir))
+    reports = []
+    for name in names:
+        if name not in listed:
+            continue
+        folder = os.path.join(report_dir, name)
+        operators = {}
+        errors = []
+        for operator in operator_dirs(folder):
+            path = os.path.join(folder, operator, 'claim.json')
+            if not os.path.isfile(path):
+                continue
+            try:
+                operators[operator] = claim_results(path)
+            except (OSError, ValueError, AttributeError):
+                errors.append(operator)
+        reports.append({'name': name, 'operators': operators, 'errors': errors})
+    return {'reports': reports}
+
+
+INVENTORY_KINDS = ('clusterversion', 'nodes', 'catalogsource', 'csv', 'subscriptions')
+
+
+def oc_items(kinds, chunk_size):
+    """Items of one ``oc get <kinds> -A -o json`` call; None if it failed"""
+    output, returncode = run(['oc', 'get', ','.join(kinds), '-A', '-o', 'json',
+                              '--chunk-size={}'.format(chunk_size)])
+    if returncode != 0:
+        return None
+    try:
+        return json.loads(output).get('items', [])
+    except ValueError:
+        return None
+
+
+def condition_status(obj, condition_type):
+    for condition in obj.get('status', {}).get('conditions') or []:
+        if condition.get('type') == condition_type:
+            return condition.get('status') == 'True'
+    return False
+
+
+def inventory_record(item):
+    """(section, compact record) for one API object; the full objects never leave the host"""
+    kind = item.get('kind')
+    metadata = item.get('metadata', {})
+    spec = item.get('spec') or {}
+    status = item.get('status') or {}
+    if kind == 'ClusterVersion':
+        return 'cluster_versions', {
+            'name': metadata.get('name', ''),
+            'version': status.get('desired', {}).get('version', ''),
+            'available': condition_status(item, 'Available'),
+            'progressing': condition_status(item, 'Progressing'),
+        }
+    if kind == 'Node':
+        labels = metadata.get('labels') or {}
+        return 'nodes', {
+            'name': metadata.get('name', ''),
+            'ready': condition_status(item, 'Ready'),
+            'roles': sorted(label.split('/', 1)[1] for label in labels
+                            if label.startswith('node-role.kubernetes.io/')),
+            'kubelet_version': status.get('nodeInfo', {}).get('kubeletVersion', ''),
+        }
+    if kind == 'CatalogSource':
+        return 'catalog_sources', {
+            'namespace': metadata.get('namespace', ''),
+            'name': metadata.get('name', ''),
+            'image': spec.get('image', ''),
+            'display_name': spec.get('displayName', ''),
+            'status': status.get('connectionState', {}).get('lastObservedState', 'Unknown'),
+        }
+    if kind == 'ClusterServiceVersion':
+        # Copies OLM places in every target namespace are not separate installs
+        if 'olm.copiedFrom' in (metadata.get('labels') or {}):
+            return None, None
+        return 'operators', {
+            'namespace': metadata.get('namespace', ''),
+            'name': metadata.get('name', ''),
+            'display_name': spec.get('displayName', ''),
+            'version': spec.get('version', ''),
+            'status': status.get('phase', 'Unknown'),
+        }
+    if kind == 'Subscription':
+        return 'subscriptions', {
+            'namespace': metadata.get('namespace', ''),
+            'name': metadata.get('name', ''),
+            'package': spec.get('name', ''),
+            'channel': spec.get('channel', ''),
+            'source': spec.get('source', ''),
+            'installed_csv': status.get('installedCSV', ''),
+            'state': status.get('state', ''),
+        }
+    return None, None
+
+
+def collect_inventory(chunk_size=500):
+    """Cluster identity and resources in one batched ``oc get``, reduced to compact records.
+
+    If the batched call fails (e.g. one kind is not readable) each kind is
+    fetched on its own so the others are still reported.
+    """
+    user, _ = run(['oc', 'whoami'])
+    server, _ = run(['oc', 'whoami', '--show-server'])
+    inventory = {
+        'user': user.strip(),
+        'api_url': server.strip(),
+        'cluster_versions': [],
+        'nodes': [],
+        'catalog_sources': [],
+        'operators': [],
+        'subscriptions': [],
+        'errors': [],
+    }
+    items = oc_items(INVENTORY_KINDS, chunk_size)
+    if items is None:
+        items = []
+        for kind in INVENTORY_KINDS:
+            kind_items = oc_items([kind], chunk_size)
+            if kind_items is None:
+                inventory['errors'].append(kind)
+            else:
+                items.extend(kind_items)
+    for item in items:
+        section, record = inventory_record(item)
+        if section:
+            inventory[section].append(record)
+    for section in ('nodes', 'catalog_sources', 'operators', 'subscriptions'):
+        inventory[section].sort(key=lambda record: (record.get('namespace', ''), record['name']))
+    return inventory
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Operator Test Dashboard remote probe')
+    subparsers = parser.add_subparsers(dest='command')
+    status = subparsers.add_parser('status', help='test run status and latest report facts')
+    status.add_argument('--report-dir', default='/var/www/html')
+    status.add_argument('--session', default='operator-test')
+    status.add_argument('--live-file', default='', help='tmux pipe-pane capture file')
+    status.add_argument('--live-since', type=int, default=-1, help='byte offset already seen')
+    status.add_argument('--live-id', default='', help='capture file id the offset belongs to')
+    status.add_argument('--live-lines', type=int, default=0,
+                        help='also return live output (last N lines when starting over)')
+    reports = subparsers.add_parser('reports', help='report listing and facts for selected reports')
+    reports.add_argument('--report-dir', default='/var/www/html')
+    reports.add_argument('--names', nargs='*', default=[], help='reports to collect facts for')
+    reports.add_argument('--newest', action='store_true', help='also collect facts for the newest report')
+    claims = subparsers.add_parser('claims', help='test case results from the claim.json files of reports')
+    claims.add_argument('--report-dir', default='/var/www/html')
+    claims.add_argument('--names', nargs='*', default=[], help='reports to read the claims of')
+    inventory = subparsers.add_parser('inventory', help='cluster resources as compact records')
+    inventory.add_argument('--chunk-size', type=int, default=500, help='API list page size for oc')
+    tail = subparsers.add_parser('tail', help='live output appended since a byte offset')
+    tail.add_argument('--file', default='')
+    tail.add_argument('--session', default='operator-test')
+    tail.add_argument('--since', type=int, default=-1)
+    tail.add_argument('--id', default='')
+    tail.add_argument('--lines', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    if args.command == 'status':
+        result = collect_status(args.report_dir, args.session, args.live_file, args.live_since,
+                                args.live_id, args.live_lines)
+    elif args.command == 'reports':
+        result = collect_reports(args.report_dir, args.names, args.newest)
+    elif args.command == 'claims':
+        result = collect_claims(args.report_dir, args.names)
+    elif args.command == 'inventory':
+        result = collect_inventory(args.chunk_size)
+    elif args.command == 'tail':
+        result = tail_live_output(args.file, args.session, args.since, args.id, args.lines)
+    else:
+        parser.print_help()
+        return 2
+    json.dump(result, sys.stdout)
+    sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
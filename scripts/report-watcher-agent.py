@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Operator Test Dashboard - Report Watcher Agent
+Version: 1.0
+
+Runs on the test host and turns changes under REPORT_DIR into an append-only
+event log, so the dashboard is told about them instead of polling:
+
+  report_created / report_removed       a report_* or debug_* folder appeared or went away
+  operator_started                      an operator result folder was created
+  operator_installed / operator_failed  the run log says so
+  results_appended                      results.csv grew (``rows``: data rows now)
+  run_done                              the run log reached DONE
+  live_output                           the test session output grew (at most once a second)
+  agent_started                         the agent (re)started: consumers should resync
+
+Changes are noticed with inotify (through ctypes, nothing to install); where
+inotify is not available the agent polls. Either way a wake-up only rescans
+the newest reports, picking up from where the last scan stopped.
+
+Each event is one JSON line with a sequence number that keeps growing across
+restarts, e.g. {"seq": 12, "time": 1770000000.5, "type": "operator_started",
+"report": "report_...", "operator": "nfd"}.
+
+One agent runs per event log. Its lock file records its pid and a hash of its
+code; started again with other code (the dashboard copied a new version), the
+agent stops the running one and takes over, otherwise it exits.
+
+Standard library only, Python 3.6+. Imports remote_probe.py from its own folder.
+
+Usage:
+  python3 report-watcher-agent.py watch --report-dir /var/www/html [--live-file FILE] [--event-log FILE]
+  python3 report-watcher-agent.py follow [--since SEQ] [--event-log FILE]
+  python3 report-watcher-agent.py events [--since SEQ] [--event-log FILE]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import fcntl
+import hashlib
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from remote_probe import LogParser, list_report_dirs, newest, operator_dirs, shard_dirs  # noqa: E402
+
+EVENT_LOG_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                              'operator-test-dashboard', 'watcher-events.jsonl')
+# The event log is cut to its newest half when it grows past this size
+EVENT_LOG_MAX_BYTES = 4 * 1024 * 1024
+# Wait after a wake-up so a burst of file system events causes one scan
+DEBOUNCE_SECONDS = 0.2
+# Least time between two live_output events
+LIVE_EVENT_INTERVAL = 1.0
+# Seconds between heartbeat lines of ``follow``; a write is how it notices the reader is gone
+HEARTBEAT_INTERVAL = 30
+# Seconds an agent with new code waits for the one it replaces to exit
+TAKEOVER_TIMEOUT = 10
+
+
+def agent_version():
+    """Hash of this agent's code and of the remote_probe.py it imports"""
+    digest = hashlib.sha256()
+    folder = os.path.dirname(os.path.abspath(__file__))
+    for name in (os.path.basename(__file__), 'remote_probe.py'):
+        with open(os.path.join(folder, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class Inotify:
+    """Minimal inotify binding over libc; raises OSError where inotify is unavailable"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self):
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            init = self._libc.inotify_init1
+        except (OSError, AttributeError) as e:
+            raise OSError(f'inotify not available: {e}')
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._paths = {}
+        self._watches = {}
+
+    def add(self, path, mask):
+        if path in self._watches:
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            # Gone already (or watch limit reached): the next scan tries again
+            return
+        self._paths[wd] = path
+        self._watches[path] = wd
+
+    def remove(self, path):
+        wd = self._watches.pop(path, None)
+        if wd is not None:
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout):
+        """Wait up to ``timeout`` seconds for events; [(watched path, name, mask)]"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + self.EVENT.size <= len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            start = offset + self.EVENT.size
+            name = os.fsdecode(data[start:start + length].rstrip(b'\0'))
+            offset = start + length
+            path = self._paths.get(wd, '')
+            if mask & self.IN_IGNORED:
+                # Watched path was deleted: forget it so it can be watched again
+                self._paths.pop(wd, None)
+                self._watches.pop(path, None)
+            events.append((path, name, mask))
+        return events
+
+
+class Poller:
+    """Stand-in for Inotify where it is unavailable: wakes up every ``interval`` seconds"""
+
+    def __init__(self, interval):
+        self.interval = interval
+
+    def add(self, path, mask):
+        pass
+
+    def remove(self, path):
+        pass
+
+    def read(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        return [('', '', 0)]
+
+
+def open_notifier(poll_interval):
+    try:
+        return Inotify()
+    except OSError:
+        return Poller(poll_interval)
+
+
+class EventLog:
+    """Append-only JSON lines event log; past ``max_bytes`` it keeps its newest half"""
+
+    def __init__(self, path, max_bytes=EVENT_LOG_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.seq = last_seq(path)
+
+    def append(self, kind, **fields):
+        self.seq += 1
+        event = dict(fields, seq=self.seq, time=round(time.time(), 3), type=kind)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(event, sort_keys=True) + '\n')
+            size = f.tell()
+        if size > self.max_bytes:
+            self.trim()
+        return event
+
+    def trim(self):
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.writelines(lines[len(lines) // 2:])
+        # A new inode: followers see the switch and reread the file
+        os.replace(tmp_path, self.path)
+
+
+def last_seq(path):
+    """Sequence number of the last complete event in a log (0 if there is none)"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 65536))
+            lines = f.read().splitlines()
+    except OSError:
+        return 0
+    for line in reversed(lines):
+        try:
+            return int(json.loads(line.decode('utf-8'))['seq'])
+        except (ValueError, KeyError, TypeError):
+            continue
+    return 0
+
+
+class ReportState:
+    """What has been reported about one report folder; ``scan`` emits what changed since"""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.operators = set()
+        self.parsers = {}
+        self.results_size = 0
+        self.results_rows = 0
+        self.done = False
+
+    def watch_paths(self):
+        return [self.path] + [path for _, path in shard_dirs(self.path)]
+
+    def log_files(self):
+        # A sharded run logs its operators in the shards' folders, and DONE in its own log
+        logs = [newest(os.path.join(path, 'output_*.log')) for path in self.watch_paths()]
+        return [path for path in logs if path]
+
+    def scan(self, emit):
+        for operator in sorted(set(operator_dirs(self.path)) - self.operators):
+            self.operators.add(operator)
+            emit('operator_started', report=self.name, operator=operator)
+
+        done = False
+        for log_file in self.log_files():
+            parser = self.parsers.setdefault(log_file, LogParser())
+            before = [record['status'] for record in parser.records]
+            try:
+                parser.feed_file(log_file)
+            except OSError:
+                continue
+            for index, record in enumerate(parser.records):
+                status = record['status']
+                if status in ('installed', 'failed') and (index >= len(before) or before[index] != status):
+                    emit(f'operator_{status}', report=self.name, operator=record['name'])
+            if log_file.startswith(os.path.join(self.path, 'output_')):
+                done = parser.done
+        if done and not self.done:
+            emit('run_done', report=self.name)
+        self.done = self.done or done
+
+        results = os.path.join(self.path, 'results.csv')
+        try:
+            size = os.path.getsize(results)
+        except OSError:
+            size = 0
+        if size < self.results_size:
+            # Rewritten (a sharded run merges into a fresh file): count from the start
+            self.results_size = self.results_rows = 0
+        if size > self.results_size:
+            with open(results, 'rb') as f:
+                f.seek(self.results_size)
+                appended = f.read(size - self.results_size)
+            # Newlines minus the header line
+            self.results_rows = max(self.results_rows + appended.count(b'\n') - (1 if not self.results_size else 0), 0)
+            self.results_size = size
+            emit('results_appended', report=self.name, rows=self.results_rows, size=size)
+
+
+class ReportWatcher:
+    """Tracks the newest ``track`` reports of a REPORT_DIR and the live output file"""
+
+    DIR_MASK = (Inotify.IN_CREATE | Inotify.IN_DELETE | Inotify.IN_MOVED_FROM | Inotify.IN_MOVED_TO
+                | Inotify.IN_MODIFY | Inotify.IN_CLOSE_WRITE)
+    FILE_MASK = Inotify.IN_MODIFY | Inotify.IN_DELETE_SELF
+
+    def __init__(self, report_dir, notifier, emit, live_file='', track=3):
+        self.report_dir = report_dir
+        self.notifier = notifier
+        self.emit = emit
+        self.live_file = live_file
+        self.track = track
+        self.known = None
+        self.states = {}
+        self.live_size = None
+        self.live_pending = False
+        self.live_emitted = 0.0
+
+    def scan(self):
+        """Compare REPORT_DIR with what was reported; the first scan only records a baseline"""
+        baseline = self.known is None
+        emit = (lambda kind, **fields: None) if baseline else self.emit
+        self.notifier.add(self.report_dir, self.DIR_MASK)
+        reports = list_report_dirs(self.report_dir)
+        names = [report['name'] for report in reports]
+        if not baseline:
+            for name in names:
+                if name not in self.known:
+                    emit('report_created', report=name)
+            for name in sorted(self.known - set(names)):
+                emit('report_removed', report=name)
+
+        tracked = names[:self.track]
+        for name in list(self.states):
+            if name not in tracked:
+                for path in self.states.pop(name).watch_paths():
+                    self.notifier.remove(path)
+        for name in tracked:
+            state = self.states.get(name)
+            if state is None:
+                state = self.states[name] = ReportState(os.path.join(self.report_dir, name))
+                if name in (self.known or ()) or baseline:
+                    # Existing report that is now tracked: nothing new about it yet
+                    state.scan(lambda kind, **fields: None)
+            state.scan(emit)
+            for path in state.watch_paths():
+                self.notifier.add(path, self.DIR_MASK)
+        self.known = set(names)
+        self.scan_live(baseline)
+
+    def scan_live(self, baseline=False):
+        if not self.live_file:
+            return
+        try:
+            size = os.path.getsize(self.live_file)
+        except OSError:
+            return
+        self.notifier.add(self.live_file, self.FILE_MASK)
+        if self.live_size is not None and size != self.live_size:
+            self.live_pending = True
+        self.live_size = size
+        if baseline:
+            self.live_pending = False
+        if self.live_pending and time.time() - self.live_emitted >= LIVE_EVENT_INTERVAL:
+            self.emit('live_output', size=size)
+            self.live_pending = False
+            self.live_emitted = time.time()
+
+    def next_timeout(self, idle_timeout):
+        """How long the main loop may sleep: a pending live event caps it"""
+        if self.live_pending:
+            return max(LIVE_EVENT_INTERVAL - (time.time() - self.live_emitted), 0)
+        return idle_timeout
+
+    def run(self, rescan_interval):
+        self.scan()
+        while True:
+            events = self.notifier.read(self.next_timeout(rescan_interval))
+            if events:
+                time.sleep(DEBOUNCE_SECONDS)
+                self.notifier.read(0)
+            self.scan()
+
+
+def try_lock(lock_file):
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def read_lock(path):
+    """{'pid': ..., 'version': ...} the lock holder recorded ({} if none)"""
+    try:
+        with open(path) as f:
+            holder = json.loads(f.read() or '{}')
+    except (OSError, ValueError):
+        return {}
+    return holder if isinstance(holder, dict) else {}
+
+
+def lock_holder_pid(path):
+    """Pid holding a flock on ``path`` according to /proc/locks (Linux); None if unknown"""
+    try:
+        inode = os.stat(path).st_ino
+        with open('/proc/locks') as f:
+            for line in f:
+                # 1: FLOCK  ADVISORY  WRITE 1234 08:01:5678 0 EOF (waiters have '->' after the number)
+                fields = line.split()
+                if len(fields) > 5 and fields[1] == 'FLOCK' and fields[5].rsplit(':', 1)[-1] == str(inode):
+                    return int(fields[4])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def acquire_lock(path, version):
+    """Exclusive lock held for the life of the process, recording its pid and ``version``.
+
+    None if an agent running the same version holds it. An agent running
+    other code is sent SIGTERM and its lock taken over once it has exited.
+    """
+    lock_file = open(path, 'a+')
+    if not try_lock(lock_file):
+        holder = read_lock(path)
+        if not holder:
+            # The holder may be about to record itself
+            time.sleep(1)
+            holder = read_lock(path)
+        if holder.get('version') == version:
+            lock_file.close()
+            return None
+        # Agents older than the version check leave the lock file empty
+        pid = holder.get('pid') or lock_holder_pid(path)
+        if pid:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.time() + TAKEOVER_TIMEOUT
+        while not try_lock(lock_file):
+            if time.time() >= deadline:
+                lock_file.close()
+                return None
+            time.sleep(0.1)
+        print('replaced report watcher agent {} (version {})'.format(pid, holder.get('version')))
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(json.dumps({'pid': os.getpid(), 'version': version}))
+    lock_file.flush()
+    return lock_file
+
+
+def watch(args):
+    os.makedirs(os.path.dirname(args.event_log) or '.', exist_ok=True)
+    version = agent_version()
+    lock = acquire_lock(args.event_log + '.lock', version)
+    if lock is None:
+        print('report watcher agent already running')
+        return 0
+    log = EventLog(args.event_log, args.max_log_bytes)
+    notifier = open_notifier(args.poll_interval)
+    watcher = ReportWatcher(args.report_dir, notifier, log.append, live_file=args.live_file, track=args.track)
+    log.append('agent_started', pid=os.getpid(), report_dir=args.report_dir, version=version,
+               notifier='inotify' if isinstance(notifier, Inotify) else 'poll')
+    watcher.run(args.rescan_interval)
+
+
+class EventReader:
+    """Reads the events appended to an event log since the last call, surviving trims"""
+
+    def __init__(self, path):
+        self.path = path
+        self.inode = None
+        self.offset = 0
+        self.partial = b''
+
+    def read(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return []
+        if st.st_ino != self.inode or st.st_size < self.offset:
+            self.inode = st.st_ino
+            self.offset = 0
+            self.partial = b''
+        if st.st_size == self.offset:
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = self.partial + f.read()
+            self.offset = f.tell()
+        lines = data.split(b'\n')
+        self.partial = lines.pop()
+        events = []
+        for line in lines:
+            try:
+                events.append(json.loads(line.decode('utf-8')))
+            except ValueError:
+                continue
+        return events
+
+
+def write_line(event):
+    sys.stdout.write(json.dumps(event, sort_keys=True) + '\n')
+    sys.stdout.flush()
+
+
+def print_events(args, follow):
+    """Print the events after --since; with ``follow`` keep printing new ones as they come"""
+    reader = EventReader(args.event_log)
+    seq = args.since
+    if seq > last_seq(args.event_log):
+        # The log started over (deleted, agent moved): everything in it is new to the reader
+        write_line({'type': 'resync', 'seq': 0})
+        seq = 0
+    first = True
+    notifier = open_notifier(1) if follow else None
+    if notifier:
+        notifier.add(os.path.dirname(args.event_log) or '.',
+                     Inotify.IN_MODIFY | Inotify.IN_CREATE | Inotify.IN_MOVED_TO)
+    deadline = time.time() + args.timeout if args.timeout else None
+    last_write = 0.0
+    try:
+        while True:
+            events = [event for event in reader.read() if event.get('seq', 0) > seq]
+            if first and seq and events and events[0]['seq'] > seq + 1:
+                # Events were trimmed away (or the log was reset): the reader missed some
+                write_line({'type': 'resync', 'seq': seq})
+            first = False
+            for event in events:
+                write_line(event)
+                seq = event['seq']
+                last_write = time.time()
+            if not follow or (deadline and time.time() >= deadline):
+                return 0
+            if time.time() - last_write >= HEARTBEAT_INTERVAL:
+                write_line({'type': 'heartbeat', 'seq': seq})
+                last_write = time.time()
+            timeout = HEARTBEAT_INTERVAL - (time.time() - last_write)
+            if deadline:
+                timeout = min(timeout, deadline - time.time())
+            notifier.read(max(timeout, 0))
+    except BrokenPipeError:
+        # The subscriber went away
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Operator Test Dashboard report watcher agent')
+    parser.add_argument('--event-log', default=EVENT_LOG_FILE)
+    commands = parser.add_subparsers(dest='command')
+    watch_cmd = commands.add_parser('watch', help='watch REPORT_DIR and append events to the log')
+    watch_cmd.add_argument('--report-dir', default='/var/www/html')
+    watch_cmd.add_argument('--live-file', default='', help='tmux pipe-pane capture file')
+    watch_cmd.add_argument('--track', type=int, default=3, help='newest reports to watch')
+    watch_cmd.add_argument('--poll-interval', type=float, default=5,
+                           help='seconds between scans when inotify is unavailable')
+    watch_cmd.add_argument('--rescan-interval', type=float, default=300,
+                           help='seconds between scans when nothing happens')
+    watch_cmd.add_argument('--max-log-bytes', type=int, default=EVENT_LOG_MAX_BYTES)
+    for name, help_text in (('follow', 'print events after --since, then new ones as they come'),
+                            ('events', 'print events after --since and exit')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--since', type=int, default=0, help='last sequence number already seen')
+        command.add_argument('--timeout', type=float, default=0, help='stop following after this many seconds')
+    # Accept --event-log after the command as well
+    for command in commands.choices.values():
+        command.add_argument('--event-log', default=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.command == 'watch':
+        return watch(args)
+    if args.command in ('follow', 'events'):
+        return print_events(args, follow=args.command == 'follow')
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,6 +4,16 @@ set -o nounset -o pipefail
 # Test run timestamp
 TIMESTAMP=$(date +"%Y-%m-%d_%H-%M-%S_%Z")
 
+# Shard of a parallel run (set by run-sharded-batch-operators-test.sh, empty otherwise).
+# A shard tests its part of the operator list into the report folder named by
+# SHARD_REPORT, keeping its log, results and scratch files apart from the other shards.
+SHARD_ID=${SHARD_ID:-}
+SHARD_SUFFIX=${SHARD_ID:+-shard-$SHARD_ID}
+
+# Set on the shard the sharded runner runs alone, before the parallel shards: with no
+# other test on the cluster it cleans up cluster-scoped leftovers like an unsharded run
+SHARD_EXCLUSIVE=${SHARD_EXCLUSIVE:-}
+
 # Base folder
 BASE_DIR=/var/www/html
 
@@ -13,10 +23,10 @@ INDEX_FILE=index2.html
 # INPUTS
 
 # certsuite_config.yaml template file path
-CONFIG_YAML_TEMPLATE="$(pwd)"/certsuite_config.yml.template
+CONFIG_YAML_TEMPLATE="$(pwd)"/certsuite_config"$SHARD_SUFFIX".yml.template
 
 # CatalogSource.yaml template file path
-CATALOG_SOURCE_TEMPLATE="$(pwd)"/CatalogSource.yaml.template
+CATALOG_SOURCE_TEMPLATE="$(pwd)"/CatalogSource"$SHARD_SUFFIX".yaml.template
 
 # Docker config used to pull operator images
 DOCKER_CONFIG=config.json
@@ -33,6 +43,20 @@ OPERATOR_CATALOG_NAMESPACE="openshift-marketplace"
 # Operator from user
 OPERATORS_UNDER_TEST=""
 
+# Label value marking the operator and pods under test; shards use their own so a
+# certsuite run only picks up what its shard installed
+TARGET_LABEL_VALUE="target$SHARD_SUFFIX"
+
+# Namespace for operators without a suggested namespace
+DEFAULT_TEST_NAMESPACE="test-operator$SHARD_SUFFIX"
+
+# Local port of the oc proxy used to force delete namespaces
+PROXY_PORT=$((8001 + ${SHARD_ID:-0}))
+
+# Operators leaving cluster-scoped webhook configurations behind, which cleanup deletes.
+# Only an unsharded run or the exclusive shard tests them (same list in run-sharded-batch-operators-test.sh).
+CLUSTER_WEBHOOK_OPERATORS="devworkspace-operator web-terminal sriov-network-operator"
+
 # Certsuite container image
 CERTSUITE_IMAGE_NAME=quay.io/redhat-best-practices-for-k8s/certsuite
 CERTSUITE_IMAGE_TAG=unstable
@@ -58,20 +82,53 @@ else
 	REPORT_FOLDER_RELATIVE="report_$TIMESTAMP"
 fi
 
+if [ -n "$SHARD_ID" ]; then
+	REPORT_FOLDER_RELATIVE="$SHARD_REPORT"
+fi
+
 # Report results folder
 REPORT_FOLDER="$BASE_DIR"/"$REPORT_FOLDER_RELATIVE"
 
+# Folder for the log, operator list, results and index of this run: the report
+# folder itself, or the shard's own folder inside it
+if [ -n "$SHARD_ID" ]; then
+	RUN_FOLDER="$REPORT_FOLDER"/.shards/"$SHARD_ID"
+else
+	RUN_FOLDER="$REPORT_FOLDER"
+fi
+
 # Operator  file name
 OPERATOR_LIST_FILENAME=operator-list.txt
 
 # Operator list path in the report
-OPERATOR_LIST_PATH="$REPORT_FOLDER"/"$OPERATOR_LIST_FILENAME"
+OPERATOR_LIST_PATH="$RUN_FOLDER"/"$OPERATOR_LIST_FILENAME"
+
+# Results of all operators, one row per test case
+RESULTS_CSV_PATH="$RUN_FOLDER"/results.csv
+
+# Per operator links page
+REPORT_INDEX_PATH="$RUN_FOLDER"/"$INDEX_FILE"
 
 # Log file
 LOG_FILENAME="output_$TIMESTAMP.log"
 
 # Operator list path in the report
-LOG_FILE_PATH="$REPORT_FOLDER"/"$LOG_FILENAME"
+LOG_FILE_PATH="$RUN_FOLDER"/"$LOG_FILENAME"
+
+# Messages with their epoch time, used by the dashboard for phase durations and ETA
+PHASE_TIMES_PATH="$RUN_FOLDER"/phase-times.log
+
+# Duration of every wait ("<epoch>\t<operator>\t<wait>\t<seconds>\t<status>" lines)
+WAITS_PATH="$RUN_FOLDER"/waits.log
+
+# Wait limits in seconds. The pod and MultiClusterEngine waits used to be fixed
+# sleeps, so they never take longer than those did.
+CLUSTER_WAIT_TIMEOUT=600
+PACKAGE_WAIT_TIMEOUT=600
+CSV_CREATED_TIMEOUT=100
+CSV_SUCCEEDED_TIMEOUT=450
+PODS_READY_TIMEOUT=30
+MULTICLUSTER_ENGINE_TIMEOUT=30
 
 echo_color() {
 	local color=$1
@@ -81,6 +138,8 @@ echo_color() {
 	printf "$color$format$ENDCOLOR\n" "$@"
 	# shellcheck disable=SC2059
 	printf "$format\n" "$@" >>"$LOG_FILE_PATH"
+	# shellcheck disable=SC2059
+	printf "%s\t$format\n" "$(date +%s)" "$@" >>"$PHASE_TIMES_PATH"
 }
 
 # VARIABLES
@@ -89,9 +148,11 @@ echo_color() {
 add_headers=-a
 
 # Create report directory
-mkdir "$REPORT_FOLDER"
+mkdir -p "$RUN_FOLDER"
 
-cleanup() {
+# Cluster-scoped leftovers of CLUSTER_WEBHOOK_OPERATORS; a parallel shard must not delete
+# them while another shard may be testing one of these operators
+delete_cluster_webhooks() {
 	# Workaround for cleaning operator leftovers, see https://access.redhat.com/solutions/6971276
 	oc delete mutatingwebhookconfigurations controller.devfile.io || true
 	oc delete validatingwebhookconfigurations controller.devfile.io || true
@@ -99,33 +160,45 @@ cleanup() {
 	# Leftovers specific to certain operators
 	oc delete Validating_webhook_configuration sriov-operator-webhook-config || true
 	oc delete Mutating_webhook_configuration sriov-operator-webhook-config || true
+}
+
+cleanup() {
+	local ns=$1
+	local scope=(--all-namespaces)
+
+	# A parallel shard only touches its own namespace, other shards are testing in theirs
+	if [ -n "$SHARD_ID" ] && [ -z "$SHARD_EXCLUSIVE" ]; then
+		scope=(-n "$ns")
+	else
+		delete_cluster_webhooks
+	fi
 
 	# Remove all test labels from all namespaces
-	echo_color "$BLUE" "Removing test labels from all resources in all namespaces"
+	echo_color "$BLUE" "Removing test labels from all resources in ${scope[*]}"
 
 	# Remove operator labels from CSVs in all namespaces
-	oc get csv --all-namespaces -o json 2>/dev/null |
+	oc get csv "${scope[@]}" -o json 2>/dev/null |
 		jq -r '.items[] | select(.metadata.labels."redhat-best-practices-for-k8s.com/operator" != null) | .metadata.namespace + " " + .metadata.name' 2>/dev/null |
 		while read -r ns name; do
 			[ -n "$ns" ] && [ -n "$name" ] && oc label csv -n "$ns" "$name" redhat-best-practices-for-k8s.com/operator- 2>/dev/null || true
 		done
 
 	# Remove generic labels from deployments in all namespaces
-	oc get deployment --all-namespaces -o json 2>/dev/null |
+	oc get deployment "${scope[@]}" -o json 2>/dev/null |
 		jq -r '.items[] | select(.metadata.labels."redhat-best-practices-for-k8s.com/generic" != null) | .metadata.namespace + " " + .metadata.name' 2>/dev/null |
 		while read -r ns name; do
 			[ -n "$ns" ] && [ -n "$name" ] && oc label deployment -n "$ns" "$name" redhat-best-practices-for-k8s.com/generic- 2>/dev/null || true
 		done
 
 	# Remove generic labels from statefulsets in all namespaces
-	oc get statefulset --all-namespaces -o json 2>/dev/null |
+	oc get statefulset "${scope[@]}" -o json 2>/dev/null |
 		jq -r '.items[] | select(.metadata.labels."redhat-best-practices-for-k8s.com/generic" != null) | .metadata.namespace + " " + .metadata.name' 2>/dev/null |
 		while read -r ns name; do
 			[ -n "$ns" ] && [ -n "$name" ] && oc label statefulset -n "$ns" "$name" redhat-best-practices-for-k8s.com/generic- 2>/dev/null || true
 		done
 
 	# Remove generic labels from pods in all namespaces
-	oc get pods --all-namespaces -o json 2>/dev/null |
+	oc get pods "${scope[@]}" -o json 2>/dev/null |
 		jq -r '.items[] | select(.metadata.labels."redhat-best-practices-for-k8s.com/generic" != null) | .metadata.namespace + " " + .metadata.name' 2>/dev/null |
 		while read -r ns name; do
 			[ -n "$ns" ] && [ -n "$name" ] && oc label pod -n "$ns" "$name" redhat-best-practices-for-k8s.com/generic- 2>/dev/null || true
@@ -138,7 +211,7 @@ wait_delete_namespace() {
 	if [ "$namespace_deleting" != "openshift-operators" ] && [ "$namespace_deleting" != "openshift-storage" ]; then
 
 		echo_color "$BLUE" "non openshift-operators namespace = $namespace_deleting, deleting "
-		with_retry 2 0 oc wait namespace "$namespace_deleting" --for=delete --timeout=60s || true
+		timed_wait namespace_deleted with_retry 2 0 oc wait namespace "$namespace_deleting" --for=delete --timeout=60s || true
 
 		force_delete_namespace_if_present "$namespace_deleting" >>"$LOG_FILE_PATH" 2>&1 || true
 	else
@@ -212,63 +285,82 @@ with_retry() {
 	return 1
 }
 
-wait_cluster_ok() {
-	local \
-		start_time \
-		status \
-		timeout_seconds=600
+# Wait engine: waits return as soon as their condition holds. Conditions of existing
+# objects are watched with `oc wait`, objects that are yet to appear with `oc get
+# --watch`; only what cannot be watched (API reachability, catalog content) is polled,
+# with a short backoff. Every wait is recorded in waits.log.
 
-	start_time=$(date +%s 2>&1) || {
-		echo "date failed with error $?: $start_time" >>"$LOG_FILE_PATH"
-		return 0
-	}
-	while true; do
-		status=0
-		oc get nodes &>/dev/null &&
-			return 0 ||
-			echo "get nodes failed with error $?." >>"$LOG_FILE_PATH"
-		current_time=$(date +%s)
-		elapsed_time=$((current_time - start_time))
-		# If elapsed time is greater than the timeout report failure
-		if [ "$elapsed_time" -ge "$timeout_seconds" ]; then
-			echo_color "$BLUE" "Timeout reached $timeout_seconds seconds waiting for cluster to be reachable."
+# Run a wait command and record how long it took; returns the command's status
+timed_wait() {
+	local name=$1
+	local start
+	local status=0
+	shift
+
+	start=$(date +%s)
+	"$@" || status=$?
+	printf "%s\t%s\t%s\t%s\t%s\n" "$(date +%s)" "${actual_package_name:-}" "$name" "$(($(date +%s) - start))" \
+		"$status" >>"$WAITS_PATH"
+	return $status
+}
+
+# Run a check until it succeeds, retrying after 1, 2, 4 then every 5 seconds
+poll_until() {
+	local timeout_seconds=$1
+	local description=$2
+	local start_time
+	local interval=1
+	shift 2
+
+	start_time=$(date +%s)
+	until "$@" &>/dev/null; do
+		if [ $(($(date +%s) - start_time)) -ge "$timeout_seconds" ]; then
+			echo_color "$BLUE" "Timeout reached $timeout_seconds seconds waiting for $description."
 			return 1
 		fi
-
-		# Otherwise wait a bit
-		echo_color "$BLUE" "Waiting for cluster to be reachable..."
-		sleep 5
+		echo_color "$BLUE" "Waiting for $description..."
+		sleep "$interval"
+		interval=$((interval * 2 > 5 ? 5 : interval * 2))
 	done
 }
 
-wait_package_ok() {
-	local \
-		package_name=$1 \
-		start_time \
-		timeout_seconds=600
+# Name of the operator's CSV as soon as it exists: the subscription's installedCSV or,
+# for + suffix operators whose subscription reports a conflict, a CSV named after
+# the package. Watches the namespace's CSVs and checks again on every change.
+watch_operator_csv() {
+	local timeout_seconds=$1
+	local namespace=$2
+	local package=$3
+	local csv_name=""
+	local installed_csv
 
-	start_time=$(date +%s 2>&1) || {
-		echo "date failed with error $?: $start_time" >>"$LOG_FILE_PATH"
-		return 0
-	}
+	while read -r csv_name; do
+		installed_csv=$(oc get subscription "$package" -n "$namespace" -o jsonpath='{.status.installedCSV}' 2>/dev/null)
+		if [ -n "$installed_csv" ] && [ "$installed_csv" != "<none>" ]; then
+			csv_name=$installed_csv
+			break
+		fi
+		if [[ "${csv_name,,}" == *"${package,,}"* ]]; then
+			break
+		fi
+		csv_name=""
+	done < <(timeout "$timeout_seconds" oc get csv -n "$namespace" --watch -o jsonpath='{.metadata.name}{"\n"}' 2>>"$LOG_FILE_PATH")
+	# Stop the watch, it only ends by itself at the timeout
+	kill $! 2>/dev/null || true
 
-	while true; do
-		(oc get packagemanifests | grep "$package_name") &>/dev/null &&
-			return 0 ||
-			echo "get packagemanifest $package_name failed with error $?." >>"$LOG_FILE_PATH"
+	echo "$csv_name"
+	[ -n "$csv_name" ]
+}
 
-		current_time=$(date +%s)
-		elapsed_time=$((current_time - start_time))
-		# If elapsed time is greater than the timeout report failure
-		if [ "$elapsed_time" -ge "$timeout_seconds" ]; then
-			echo_color "$BLUE" "Timeout reached $timeout_seconds seconds waiting for packagemanifest $package_name to be reachable."
-			return 1
-		fi
+wait_cluster_ok() {
+	timed_wait cluster_reachable poll_until "$CLUSTER_WAIT_TIMEOUT" "cluster to be reachable" oc get --raw /readyz
+}
 
-		# Otherwise wait a bit
-		echo_color "$BLUE" "Waiting for package $package_name to be reachable..."
-		sleep 5
-	done
+wait_package_ok() {
+	local package_name=$1
+
+	timed_wait package_available poll_until "$PACKAGE_WAIT_TIMEOUT" "package $package_name to be reachable" \
+		oc get packagemanifest "$package_name" -n "$OPERATOR_CATALOG_NAMESPACE"
 }
 
 wait_all_packages_ok() {
@@ -319,52 +411,48 @@ get_packages() {
 wait_for_csv_to_appear_and_label() {
 	local csv_namespace=$1
 	local operator_package=$2
-	local timeout_seconds=100
-	local start_time=0
-	local current_time=0
-	local elapsed_time=0
 	local csv_name=""
 	local status=0
 
-	start_time=$(date +%s)
-	while true; do
-		# Wait for the specific operator's CSV (name starts with package name)
-		# Try to get CSV name from subscription status first
-		csv_name=$(oc get subscription "$operator_package" -n "$csv_namespace" -o jsonpath='{.status.installedCSV}' 2>/dev/null)
-		
-		# If subscription.status.installedCSV is empty (e.g., for + operators with conflicts),
-		# fall back to querying CSV directly by pattern matching
-		if [ -z "$csv_name" ] || [ "$csv_name" = "<none>" ]; then
-			csv_name=$(oc get csv -n "$csv_namespace" -o custom-columns=':.metadata.name' --no-headers 2>/dev/null | grep -i "$operator_package" | head -1)
-		fi
-		if [ -n "$csv_name" ]; then
-			# Found the CSV for this operator
-			break
-		else
-			current_time=$(date +%s)
-			elapsed_time=$((current_time - start_time))
-			# If elapsed time is greater than the timeout report failure
-			if [ "$elapsed_time" -ge "$timeout_seconds" ]; then
-				echo_color "$BLUE" "Timeout reached $timeout_seconds seconds waiting for CSV for $operator_package."
-				return 1
-			fi
-
-			# Otherwise wait a bit
-			echo_color "$BLUE" "Waiting for csv for $operator_package to be created in namespace $csv_namespace ..."
-			sleep 5
-		fi
-	done
+	echo_color "$BLUE" "Waiting for csv for $operator_package to be created in namespace $csv_namespace ..."
+	if ! csv_name=$(timed_wait csv_created watch_operator_csv "$CSV_CREATED_TIMEOUT" "$csv_namespace" "$operator_package"); then
+		echo_color "$BLUE" "Timeout reached $CSV_CREATED_TIMEOUT seconds waiting for CSV for $operator_package."
+		return 1
+	fi
 
-	# Label only the specific CSV for this operator with "redhat-best-practices-for-k8s.com/operator=target"
+	# Label only the specific CSV for this operator with "redhat-best-practices-for-k8s.com/operator=$TARGET_LABEL_VALUE"
 	echo_color "$GREY" "Labeling CSV: $csv_name"
-	with_retry 5 10 oc label csv -n "$csv_namespace" "$csv_name" redhat-best-practices-for-k8s.com/operator=target 2>>"$LOG_FILE_PATH" || true
+	with_retry 5 10 oc label csv -n "$csv_namespace" "$csv_name" redhat-best-practices-for-k8s.com/operator="$TARGET_LABEL_VALUE" 2>>"$LOG_FILE_PATH" || true
 
 	# Wait for the CSV to be succeeded
 	echo_color "$BLUE" "Wait for CSV to be succeeded"
-	with_retry 60 5 oc wait csv "$csv_name" -n "$csv_namespace" --for=jsonpath=\{.status.phase\}=Succeeded --timeout=10s || status="$?"
+	timed_wait csv_succeeded with_retry 2 5 oc wait csv "$csv_name" -n "$csv_namespace" \
+		--for=jsonpath=\{.status.phase\}=Succeeded --timeout="$CSV_SUCCEEDED_TIMEOUT"s || status="$?"
 	return $status
 }
 
+# The namespace has pods that are not Completed (job) pods
+pods_exist() {
+	local namespace=$1
+
+	[ -n "$(oc get pods -n "$namespace" --field-selector=status.phase!=Succeeded -o name 2>/dev/null)" ]
+}
+
+# Pods of the operator under test are ready; Completed (job) pods are ignored.
+# `oc wait --all` returns at once while there are no pods, so wait for them to be
+# created first, all within PODS_READY_TIMEOUT.
+wait_pods_ready() {
+	local namespace=$1
+	local start_time
+	local remaining
+
+	start_time=$(date +%s)
+	poll_until "$PODS_READY_TIMEOUT" "pods in $namespace to be created" pods_exist "$namespace" || return 1
+	remaining=$((PODS_READY_TIMEOUT - ($(date +%s) - start_time)))
+	oc wait pods --all -n "$namespace" --field-selector=status.phase!=Succeeded \
+		--for=condition=Ready --timeout="$((remaining > 1 ? remaining : 1))"s >>"$LOG_FILE_PATH" 2>&1
+}
+
 force_delete_namespace_if_present() {
 	local a_namespace=$1
 	local pid=0
@@ -384,7 +472,7 @@ force_delete_namespace_if_present() {
 
 	# Delete namespace
 	oc delete namespace "$a_namespace" --wait=false || true
-	with_retry 2 0 oc wait namespace "$a_namespace" --for=delete --timeout=5s || true
+	timed_wait namespace_deleted with_retry 2 0 oc wait namespace "$a_namespace" --for=delete --timeout=5s || true
 
 	# If a namespace with this name does not exist, all is good, exit
 	if ! oc get namespace "$a_namespace"; then
@@ -392,17 +480,19 @@ force_delete_namespace_if_present() {
 	fi
 	echo_color "$RED" "Namespace cannot be deleted normally, force deleting"
 	# Otherwise force delete namespace
-	with_retry 5 10 oc get namespace "$a_namespace" -ojson | sed '/"kubernetes"/d' >temp.yaml
-	# Kill previous oc proxy command in the background
-	killall "oc"
+	with_retry 5 10 oc get namespace "$a_namespace" -ojson | sed '/"kubernetes"/d' >temp"$SHARD_SUFFIX".yaml
+	# Kill previous oc proxy command in the background; shards run other oc commands concurrently
+	if [ -z "$SHARD_ID" ]; then
+		killall "oc"
+	fi
 	# Start a new proxy
-	oc proxy &
+	oc proxy --port="$PROXY_PORT" &
 	pid=$!
 	echo "PID: $pid"
-	sleep 5
-	curl -H "Content-Type: application/yaml" -X PUT --data-binary @temp.yaml http://127.0.0.1:8001/api/v1/namespaces/"$a_namespace"/finalize >>"$LOG_FILE_PATH"
+	poll_until 5 "oc proxy to listen" curl -sf http://127.0.0.1:"$PROXY_PORT"/version
+	curl -H "Content-Type: application/yaml" -X PUT --data-binary @temp"$SHARD_SUFFIX".yaml http://127.0.0.1:"$PROXY_PORT"/api/v1/namespaces/"$a_namespace"/finalize >>"$LOG_FILE_PATH"
 	kill -9 "$pid"
-	with_retry 2 0 oc wait namespace "$a_namespace" --for=delete --timeout=60s
+	timed_wait namespace_force_deleted with_retry 2 0 oc wait namespace "$a_namespace" --for=delete --timeout=60s
 }
 
 report_failure() {
@@ -431,7 +521,7 @@ report_failure() {
 
 		# New line
 		echo "<br>"
-	} >>"$REPORT_FOLDER"/"$INDEX_FILE"
+	} >>"$REPORT_INDEX_PATH"
 }
 
 get_suggested_namespace() {
@@ -440,6 +530,16 @@ get_suggested_namespace() {
 	oc get packagemanifests -n openshift-marketplace "$package_name" -ojson | jq -r '.status.channels[].currentCSVDesc.annotations."operatorframework.io/suggested-namespace"' 2>/dev/null | grep -v "null" | sed 's/\n//g' | head -1 || true
 }
 
+setup_catalog() {
+	# The sharded runner creates the catalog once for all shards
+	if [ -n "$SHARD_ID" ]; then
+		echo_color "$BLUE" "Shard $SHARD_ID: using catalog source $OPERATOR_CATALOG_NAME"
+		return 0
+	fi
+	echo_color "$BLUE" "Creating Catalog Source"
+	create_catalog
+}
+
 create_catalog() {
 	catalog_source_yaml=catalogSource.yml
 	sed "s|\$CATALOG_INDEX|$CATALOG_INDEX|" "$CATALOG_SOURCE_TEMPLATE" >"$catalog_source_yaml"
@@ -449,41 +549,10 @@ create_catalog() {
 }
 
 wait_pods_ok() {
-	local \
-		start_time \
-		timeout_seconds=100
-	start_time=$(date +%s 2>&1) || {
-		echo "date failed with error $?: $start_time" >>"$LOG_FILE_PATH"
-		return 0
-	}
-
-	while true; do
-		pods=$(oc get pods --no-headers -n openshift-marketplace -o custom-columns=":metadata.name,:status.phase" | grep ^"$OPERATOR_CATALOG_NAME"-)
-		all_pods_running=true
-
-		# Iterate over all necessary pods and check their phases.
-		while IFS= read -r pod; do
-			pod_status=$(echo "$pod" | awk '{print $2}')
-			if [[ $pod_status != "Running" ]]; then
-				all_pods_running=false
-			fi
-		done <<<"$pods"
-
-		if [ "$all_pods_running" = true ]; then
-			break
-		fi
-
-		current_time=$(date +%s)
-		elapsed_time=$((current_time - start_time))
-		# If elapsed time is greater than the timeout report failure
-		if [ "$elapsed_time" -ge "$timeout_seconds" ]; then
-			echo_color "$BLUE" "Timeout reached $timeout_seconds seconds waiting for packagemanifest $package_name to be reachable."
-			return 1
-		fi
-
-		echo_color "$BLUE" "Waiting for necessary pods to be created and reach running state..."
-		sleep 5
-	done
+	# The catalog source reports READY once its registry pod serves the catalog
+	echo_color "$BLUE" "Waiting for catalog source $OPERATOR_CATALOG_NAME to be ready..."
+	timed_wait catalog_ready oc wait catalogsource "$OPERATOR_CATALOG_NAME" -n "$OPERATOR_CATALOG_NAMESPACE" \
+		--for=jsonpath='{.status.connectionState.lastObservedState}'=READY --timeout=100s >>"$LOG_FILE_PATH" 2>&1
 }
 
 remove_all_finalizers() {
@@ -535,16 +604,14 @@ EOF
 # Check if the number of parameters is correct
 if [ "$#" -eq 1 ]; then
 	CATALOG_INDEX=$1
-	echo_color "$BLUE" "Creating Catalog Source"
-	create_catalog
+	setup_catalog
 	# Get all the packages present in the cluster catalog
-	wait_all_packages_ok
+	timed_wait catalog_packages wait_all_packages_ok
 	with_retry 5 10 oc get packagemanifest -o jsonpath='{range .items[*]}{.metadata.name}{",'"$CATALOG_INDEX"'\n"}{end}' | head -n -1 | sort >"$OPERATOR_LIST_PATH"
 
 elif [ "$#" -eq 2 ]; then
 	CATALOG_INDEX=$1
-	echo_color "$BLUE" "Creating Catalog Source"
-	create_catalog
+	setup_catalog
 	OPERATORS_UNDER_TEST=$2
 	echo "$OPERATORS_UNDER_TEST " | sed 's| |,'"$CATALOG_INDEX"'\n|g' >"$OPERATOR_LIST_PATH"
 else
@@ -573,9 +640,9 @@ cat <<EOF >"$CONFIG_YAML_TEMPLATE"
 targetNameSpaces:
   - name: \$ns
 podsUnderTestLabels:
-  - "redhat-best-practices-for-k8s.com/generic: target"
+  - "redhat-best-practices-for-k8s.com/generic: $TARGET_LABEL_VALUE"
 operatorsUnderTestLabels:
-  - "redhat-best-practices-for-k8s.com/operator: target"
+  - "redhat-best-practices-for-k8s.com/operator: $TARGET_LABEL_VALUE"
 EOF
 
 OPERATOR_PAGE='<!DOCTYPE html>
@@ -585,8 +652,8 @@ OPERATOR_PAGE='<!DOCTYPE html>
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>HTTP Link Example</title>'
 
-# Add per test run links
-{
+# Add per test run links (the sharded runner adds them for the whole run)
+[ -n "$SHARD_ID" ] || {
 	# Add per operator details link
 	echo "Time: <b>$TIMESTAMP</b>, Catalog index: <b>$CATALOG_INDEX</b>"
 
@@ -609,7 +676,7 @@ OPERATOR_PAGE='<!DOCTYPE html>
 	echo "<br>"
 } >>"$BASE_DIR"/"$INDEX_FILE"
 
-echo "$OPERATOR_PAGE" >>"$REPORT_FOLDER"/"$INDEX_FILE"
+[ -n "$SHARD_ID" ] || echo "$OPERATOR_PAGE" >>"$REPORT_INDEX_PATH"
 
 # Wait for the cluster to be reachable
 echo_color "$BLUE" "Wait for cluster to be reachable"
@@ -641,6 +708,13 @@ while IFS=, read -r package_name catalog_index; do
 		echo_color "$BLUE" "Package has - suffix: will use test-$actual_package_name namespace"
 	fi
 
+	# The sharded runner tests these on the exclusive shard only
+	if [ -n "$SHARD_ID" ] && [ -z "$SHARD_EXCLUSIVE" ] &&
+		[[ " $CLUSTER_WEBHOOK_OPERATORS " == *" $actual_package_name "* ]]; then
+		echo_color "$RED" "Skipping $actual_package_name: its cluster-scoped webhooks cannot be cleaned up on parallel shard $SHARD_ID"
+		continue
+	fi
+
 	# Wait for the cluster to be reachable
 	echo_color "$BLUE" "Wait for cluster to be reachable"
 	wait_cluster_ok
@@ -671,8 +745,8 @@ while IFS=, read -r package_name catalog_index; do
 				echo_color "$BLUE" "no suggested namespace for $actual_package_name, using: $ns"
 			else
 				# No suffix with no suggested namespace: use test-operator
-				ns="test-operator"
-				echo_color "$BLUE" "no suggested namespace for $actual_package_name, using: test-operator"
+				ns="$DEFAULT_TEST_NAMESPACE"
+				echo_color "$BLUE" "no suggested namespace for $actual_package_name, using: $ns"
 			fi
 		else
 			echo_color "$BLUE" "using suggested namespace for $actual_package_name: $ns"
@@ -681,7 +755,7 @@ while IFS=, read -r package_name catalog_index; do
 	echo_color "$GREY" "namespace= $ns"
 
 	echo_color "$BLUE" "Cluster cleanup"
-	if ! cleanup >>"$LOG_FILE_PATH" 2>&1; then
+	if ! cleanup "$ns" >>"$LOG_FILE_PATH" 2>&1; then
 		echo_color "$RED" "Warning, cluster cleanup failed"
 	fi
 
@@ -777,20 +851,22 @@ spec: {}
 EOF
 			echo_color "$BLUE" "MultiClusterEngine custom resource created successfully"
 			echo_color "$BLUE" "Waiting for MultiClusterEngine to be ready..."
-			sleep 30
+			timed_wait multiclusterengine_available oc wait multiclusterengine multiclusterengine \
+				--for=jsonpath='{.status.phase}'=Available --timeout="$MULTICLUSTER_ENGINE_TIMEOUT"s >>"$LOG_FILE_PATH" 2>&1 || true
 		else
 			echo_color "$RED" "Failed to create MultiClusterEngine CR"
 		fi
 	fi
 
 	echo_color "$BLUE" "Wait to ensure all pods are running"
-	# Extra wait to ensure that all pods are running
-	sleep 30
+	if ! timed_wait pods_ready wait_pods_ready "$ns"; then
+		echo_color "$GREY" "Not all pods in $ns are ready after $PODS_READY_TIMEOUT seconds, continuing"
+	fi
 
 	# CSV-based labeling: label only operator-specific deployments and pods
 	echo_color "$BLUE" "Label operator-specific deployments and pods"
 	# Get the CSV name for the operator under test (already labeled earlier)
-	csv_name=$(oc get csv -n "$ns" -l redhat-best-practices-for-k8s.com/operator=target -o jsonpath='{.items[0].metadata.name}' 2>/dev/null)
+	csv_name=$(oc get csv -n "$ns" -l redhat-best-practices-for-k8s.com/operator="$TARGET_LABEL_VALUE" -o jsonpath='{.items[0].metadata.name}' 2>/dev/null)
 
 	if [ -n "$csv_name" ]; then
 		# Extract deployment names from CSV's spec.install.spec.deployments
@@ -799,26 +875,26 @@ EOF
 		# Label only the deployments defined in the CSV
 		for dep_name in $deployment_names; do
 			echo_color "$GREY" "Labeling deployment: $dep_name"
-			oc label deployment -n "$ns" "$dep_name" redhat-best-practices-for-k8s.com/generic=target 2>>"$LOG_FILE_PATH" || true
+			oc label deployment -n "$ns" "$dep_name" redhat-best-practices-for-k8s.com/generic="$TARGET_LABEL_VALUE" 2>>"$LOG_FILE_PATH" || true
 
 			# Label pods belonging to this deployment (using deployment's selector)
 			selector=$(oc get deployment "$dep_name" -n "$ns" -o jsonpath='{.spec.selector.matchLabels}' 2>/dev/null | jq -r 'to_entries | map("\(.key)=\(.value)") | join(",")' 2>/dev/null)
 			if [ -n "$selector" ]; then
-				oc label pods -n "$ns" -l "$selector" redhat-best-practices-for-k8s.com/generic=target 2>>"$LOG_FILE_PATH" || true
+				oc label pods -n "$ns" -l "$selector" redhat-best-practices-for-k8s.com/generic="$TARGET_LABEL_VALUE" 2>>"$LOG_FILE_PATH" || true
 			fi
 		done
 	else
 		echo_color "$RED" "Warning: Could not find labeled CSV, falling back to namespace-wide labeling"
 		# Fallback to original behavior
-		oc get deployment -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic=target "}' | bash || true
-		oc get statefulset -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic=target "}' | bash || true
-		oc get pods -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic=target "}' | bash || true
+		oc get deployment -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic='"$TARGET_LABEL_VALUE"' "}' | bash || true
+		oc get statefulset -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic='"$TARGET_LABEL_VALUE"' "}' | bash || true
+		oc get pods -n "$ns" -o custom-columns=':.metadata.name,:.metadata.namespace,:.kind' | sed '/^ *$/d' | awk '{print "  oc label " $3  " -n " $2 " " $1  " redhat-best-practices-for-k8s.com/generic='"$TARGET_LABEL_VALUE"' "}' | bash || true
 	fi
 
 	# Run certsuite container
 	echo_color "$BLUE" "run CNF suite"
 
-	config_dir="$(pwd)"/config
+	config_dir="$(pwd)"/config"$SHARD_SUFFIX"
 	mkdir -p "$config_dir"
 	cp "$KUBECONFIG" "$config_dir"/kubeconfig
 	cp "$DOCKER_CONFIG" "$config_dir"/dockerconfig
@@ -881,7 +957,7 @@ EOF
 		-v "${CNF_TYPE_DIR}:/cnftype:Z" \
 		"${CERTSUITE_IMAGE_NAME}:${CERTSUITE_IMAGE_TAG}" \
 		/usr/local/bin/certsuite claim \
-		show csv -t /cnftype/cnf-type.json -c /reports/claim.json -n "$actual_package_name" "$add_headers" >>"$REPORT_FOLDER"/results.csv; then
+		show csv -t /cnftype/cnf-type.json -c /reports/claim.json -n "$actual_package_name" "$add_headers" >>"$RESULTS_CSV_PATH"; then
 		echo_color "$RED" "failed to parse claim file"
 	fi
 
@@ -907,19 +983,22 @@ EOF
 
 		# new line
 		echo "<br>"
-	} >>"$REPORT_FOLDER"/"$INDEX_FILE"
+	} >>"$REPORT_INDEX_PATH"
 
 	# Only print headers once
 	add_headers=""
 
 done <"$OPERATOR_LIST_PATH"
 
-# Delete the catalog
-echo_color "$BLUE" "Remove Catalog"
-if ! oc delete catalogsources -n "$OPERATOR_CATALOG_NAMESPACE" "$OPERATOR_CATALOG_NAME"; then
-	echo_color "$RED" "Error, failed to delete catalog: $OPERATOR_CATALOG_NAME"
-fi
+# The sharded runner removes the catalog and closes the html file once all shards are done
+if [ -z "$SHARD_ID" ]; then
+	# Delete the catalog
+	echo_color "$BLUE" "Remove Catalog"
+	if ! oc delete catalogsources -n "$OPERATOR_CATALOG_NAMESPACE" "$OPERATOR_CATALOG_NAME"; then
+		echo_color "$RED" "Error, failed to delete catalog: $OPERATOR_CATALOG_NAME"
+	fi
 
-# closing html file
-echo '</body></html>' >>"$REPORT_FOLDER"/"$INDEX_FILE"
+	# closing html file
+	echo '</body></html>' >>"$REPORT_INDEX_PATH"
+fi
 echo_color "$GREEN" DONE
@@ -1,3 +1,9 @@
-time ./script/run-basic-batch-operators-test.sh registry.redhat.io/redhat/redhat-operator-index:v4.20 "lvms-operator+ odf-operator+ ocs-operator+ advanced-cluster-management+ multicluster-engine+ topology-aware-lifecycle-manager sriov-network-operator local-storage-operator cluster-logging compliance-operator odf-csi-addons-operator cincinnati-operator nfd ptp-operator rhsso-operator file-integrity-operator mcg-operator openshift-cert-manager-operator openshift-gitops-operator quay-operator servicemeshoperator3 metallb-operator kubevirt-hyperconverged gatekeeper-operator-product ansible-automation-platform-operator mtc-operator redhat-oadp-operator openshift-pipelines-operator-rh kiali-ossm kubernetes-nmstate-operator rhacs-operator  kernel-module-management-hub kernel-module-management mta-operator loki-operator amq-broker-rhel8 amq-streams amq7-interconnect-operator lifecycle-agent numaresources-operator volsync-product rhbk-operator cluster-observability-operator openshift-custom-metrics-autoscaler-operator node-healthcheck-operator self-node-remediation tempo-product"
+# SHARD_COUNT > 1 tests that many operators in parallel
+RUNNER=./script/run-basic-batch-operators-test.sh
+if [ "${SHARD_COUNT:-1}" -gt 1 ]; then
+	RUNNER=./script/run-sharded-batch-operators-test.sh
+fi
 
-time ./script/run-basic-batch-operators-test.sh registry.redhat.io/redhat/certified-operator-index:v4.20 "sriov-fec crunchy-postgres-operator cloud-native-postgresql mongodb-enterprise vault-secrets-operator"
+time $RUNNER registry.redhat.io/redhat/redhat-operator-index:v4.20 "lvms-operator+ odf-operator+ ocs-operator+ advanced-cluster-management+ multicluster-engine+ topology-aware-lifecycle-manager sriov-network-operator local-storage-operator cluster-logging compliance-operator odf-csi-addons-operator cincinnati-operator nfd ptp-operator rhsso-operator file-integrity-operator mcg-operator openshift-cert-manager-operator openshift-gitops-operator quay-operator servicemeshoperator3 metallb-operator kubevirt-hyperconverged gatekeeper-operator-product ansible-automation-platform-operator mtc-operator redhat-oadp-operator openshift-pipelines-operator-rh kiali-ossm kubernetes-nmstate-operator rhacs-operator  kernel-module-management-hub kernel-module-management mta-operator loki-operator amq-broker-rhel8 amq-streams amq7-interconnect-operator lifecycle-agent numaresources-operator volsync-product rhbk-operator cluster-observability-operator openshift-custom-metrics-autoscaler-operator node-healthcheck-operator self-node-remediation tempo-product"
+
+time $RUNNER registry.redhat.io/redhat/certified-operator-index:v4.20 "sriov-fec crunchy-postgres-operator cloud-native-postgresql mongodb-enterprise vault-secrets-operator"
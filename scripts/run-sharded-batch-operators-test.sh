@@ -0,0 +1,428 @@
+#!/bin/bash
+set -o nounset -o pipefail
+
+# Parallel version of run-basic-batch-operators-test.sh: splits the operator list
+# into SHARD_COUNT shards and runs the basic runner on each of them at the same
+# time, in its own tmux session, namespace and .shards/<id> folder of one report.
+#
+# Operators that cannot share the cluster with other tests are tested first, one
+# after another on shard 0, before the parallel shards 1..SHARD_COUNT start: the
+# + suffix (keep installed) operators, lvms/odf/ocs, the operators installed in
+# openshift-storage and those leaving cluster-scoped webhooks behind. Operators
+# with the same suggested namespace stay on the same shard, so they never install
+# into it concurrently.
+
+# Test run timestamp
+TIMESTAMP=$(date +"%Y-%m-%d_%H-%M-%S_%Z")
+
+# Base folder
+BASE_DIR=/var/www/html
+
+# index.html
+INDEX_FILE=index2.html
+
+# INPUTS
+
+# Number of operators tested at the same time
+SHARD_COUNT=${SHARD_COUNT:-2}
+
+# tmux session name of shard N is $SHARD_SESSION_PREFIX<N>
+SHARD_SESSION_PREFIX=operator-test-shard-
+
+# Runner executed by every shard
+BATCH_SCRIPT="$(cd "$(dirname "$0")" && pwd)"/run-basic-batch-operators-test.sh
+
+# CatalogSource.yaml template file path
+CATALOG_SOURCE_TEMPLATE="$(pwd)"/CatalogSource-sharded.yaml.template
+
+# Operator catalog name
+OPERATOR_CATALOG_NAME="operator-catalog"
+
+# Operator catalog namespace
+OPERATOR_CATALOG_NAMESPACE="openshift-marketplace"
+
+# Operators that always run on shard 0
+EXCLUSIVE_OPERATORS="lvms-operator odf-operator ocs-operator odf-csi-addons-operator mcg-operator"
+
+# Operators leaving cluster-scoped webhook configurations behind: run on shard 0 too, as the
+# parallel shards skip them (same list in run-basic-batch-operators-test.sh)
+CLUSTER_WEBHOOK_OPERATORS="devworkspace-operator web-terminal sriov-network-operator"
+
+# OUTPUTS
+
+# Colors
+readonly \
+	RED="\033[31m" \
+	GREEN="\033[32m" \
+	BLUE="\033[36m" \
+	ENDCOLOR="\033[0m"
+
+# Check if DEBUG mode
+if [ -n "${DEBUG_RUN+any}" ]; then
+	REPORT_FOLDER_RELATIVE="debug_$TIMESTAMP"
+else
+	REPORT_FOLDER_RELATIVE="report_$TIMESTAMP"
+fi
+
+# Report results folder
+REPORT_FOLDER="$BASE_DIR"/"$REPORT_FOLDER_RELATIVE"
+
+# Shard folders, one per shard id
+SHARDS_FOLDER="$REPORT_FOLDER"/.shards
+
+# Operator  file name
+OPERATOR_LIST_FILENAME=operator-list.txt
+
+# Operator list path in the report (all shards)
+OPERATOR_LIST_PATH="$REPORT_FOLDER"/"$OPERATOR_LIST_FILENAME"
+
+# Log file of the runner; each shard logs to its own folder
+LOG_FILENAME="output_$TIMESTAMP.log"
+LOG_FILE_PATH="$REPORT_FOLDER"/"$LOG_FILENAME"
+
+echo_color() {
+	local color=$1
+	local format=$2
+	shift 2
+	# shellcheck disable=SC2059
+	printf "$color$format$ENDCOLOR\n" "$@"
+	# shellcheck disable=SC2059
+	printf "$format\n" "$@" >>"$LOG_FILE_PATH"
+}
+
+# VARIABLES
+
+# Operators of each shard, space separated, indexed by shard id
+shard_operators=()
+
+# Operator count of each shard, indexed by shard id
+shard_load=()
+
+# Background jobs showing the shards' progress
+progress_pids=()
+
+# Create report directory
+mkdir -p "$SHARDS_FOLDER"
+
+create_catalog() {
+	sed "s|\$CATALOG_INDEX|$CATALOG_INDEX|" "$CATALOG_SOURCE_TEMPLATE" | oc apply -f - >>"$LOG_FILE_PATH" 2>&1 || return 1
+
+	echo_color "$BLUE" "Wait for catalog source to be ready"
+	oc wait catalogsource "$OPERATOR_CATALOG_NAME" -n "$OPERATOR_CATALOG_NAMESPACE" \
+		--for=jsonpath='{.status.connectionState.lastObservedState}'=READY --timeout=600s >>"$LOG_FILE_PATH" 2>&1
+}
+
+# Package name and suggested namespace of every package in the catalog, tab separated
+catalog_packages() {
+	oc get packagemanifest -n "$OPERATOR_CATALOG_NAMESPACE" -o json |
+		jq -r '.items[] | select(.status.catalogSource == "'"$OPERATOR_CATALOG_NAME"'") |
+			[.metadata.name, ([.status.channels[]?.currentCSVDesc.annotations."operatorframework.io/suggested-namespace" // empty] | first // "")] | @tsv'
+}
+
+wait_all_packages_ok() {
+	local \
+		start_time \
+		prev_count=-1 \
+		curr_count \
+		timeout_seconds=600
+
+	start_time=$(date +%s)
+
+	# wait until package number is stable
+	while true; do
+		curr_count=$(catalog_packages | wc -l)
+		if [ "$curr_count" -gt 0 ] && [ "$curr_count" -eq "$prev_count" ]; then
+			return 0
+		fi
+		prev_count=$curr_count
+
+		if [ $(($(date +%s) - start_time)) -ge "$timeout_seconds" ]; then
+			echo_color "$RED" "Timeout reached $timeout_seconds seconds waiting for packagemanifests to be reachable."
+			return 1
+		fi
+
+		echo_color "$BLUE" "Waiting for packages to be reachable..."
+		sleep 5
+	done
+}
+
+# Parallel shard with the fewest operators
+least_loaded_shard() {
+	local id best=1
+	for ((id = 1; id <= SHARD_COUNT; id++)); do
+		if [ "${shard_load[$id]}" -lt "${shard_load[$best]}" ]; then
+			best=$id
+		fi
+	done
+	echo "$best"
+}
+
+# Fill shard_operators from the operator list, keeping the list order within a shard
+plan_shards() {
+	local \
+		package_name \
+		actual_package_name \
+		ns \
+		key \
+		id \
+		groups=() \
+		exclusive=()
+	local -A suggested_namespace=() group_operators=() group_size=()
+
+	while IFS=$'\t' read -r package_name ns; do
+		suggested_namespace[$package_name]=$ns
+	done < <(catalog_packages)
+
+	while IFS=, read -r package_name _; do
+		if [ "$package_name" = "" ]; then
+			continue
+		fi
+		actual_package_name=${package_name%[+-]}
+		ns=${suggested_namespace[$actual_package_name]:-}
+
+		if [[ "$package_name" == *+ ]] || [[ " $EXCLUSIVE_OPERATORS $CLUSTER_WEBHOOK_OPERATORS " == *" $actual_package_name "* ]] ||
+			[ "$ns" = "openshift-storage" ]; then
+			exclusive+=("$package_name")
+			continue
+		fi
+
+		# Operators without a namespace of their own get a namespace per shard or per operator
+		if [[ "$package_name" == *- ]] || [ "$ns" = "" ] || [ "$ns" = "openshift-operators" ]; then
+			key="operator:$actual_package_name"
+		else
+			key="namespace:$ns"
+		fi
+		if [ -z "${group_size[$key]+any}" ]; then
+			groups+=("$key")
+			group_size[$key]=0
+		fi
+		group_operators[$key]+="$package_name "
+		group_size[$key]=$((group_size[$key] + 1))
+	done <"$OPERATOR_LIST_PATH"
+
+	# Shard 0 runs alone, the parallel shards are 1..SHARD_COUNT
+	shard_operators[0]="${exclusive[*]}"
+	shard_load[0]=${#exclusive[@]}
+	for ((id = 1; id <= SHARD_COUNT; id++)); do
+		shard_operators[id]=""
+		shard_load[id]=0
+	done
+
+	for key in "${groups[@]}"; do
+		id=$(least_loaded_shard)
+		shard_operators[id]+="${shard_operators[id]:+ }${group_operators[$key]% }"
+		shard_load[id]=$((shard_load[id] + group_size[$key]))
+	done
+}
+
+start_shard() {
+	local id=$1
+	local command exclusive=""
+
+	# Shard 0 has the cluster to itself
+	if [ "$id" -eq 0 ]; then
+		exclusive=1
+	fi
+
+	mkdir -p "$SHARDS_FOLDER"/"$id"
+	# The tmux server does not pass this shell's environment on to new sessions
+	command=$(printf '%q ' env SHARD_ID="$id" SHARD_EXCLUSIVE="$exclusive" SHARD_REPORT="$REPORT_FOLDER_RELATIVE" \
+		KUBECONFIG="$KUBECONFIG" "$BATCH_SCRIPT" "$CATALOG_INDEX" "${shard_operators[id]}")
+	if ! tmux new-session -d -s "$SHARD_SESSION_PREFIX$id" -c "$(pwd)" "$command"; then
+		echo_color "$RED" "Error, failed to start shard $id"
+		return 1
+	fi
+	echo_color "$BLUE" "Shard $id started with ${shard_load[id]} operators: ${shard_operators[id]}"
+
+	# Show the shard's progress messages in this session
+	tail -n +1 -F --pid=$$ "$SHARDS_FOLDER"/"$id"/phase-times.log 2>/dev/null | sed -u "s/^[0-9]*\t/[shard $id] /" &
+	progress_pids+=($!)
+}
+
+shard_running() {
+	tmux has-session -t "$SHARD_SESSION_PREFIX$1" 2>/dev/null
+}
+
+# Wait for the given shards to finish, merging results as they come in
+wait_shards() {
+	local id running
+	while true; do
+		running=0
+		for id in "$@"; do
+			if shard_running "$id"; then
+				running=$((running + 1))
+			fi
+		done
+		if [ "$running" -eq 0 ]; then
+			return
+		fi
+		merge_results
+		sleep 10
+	done
+}
+
+# Cluster-scoped leftovers of CLUSTER_WEBHOOK_OPERATORS, deleted once before the parallel shards
+# start (the basic runner's delete_cluster_webhooks; the shards no longer delete them)
+delete_cluster_webhooks() {
+	# Workaround for cleaning operator leftovers, see https://access.redhat.com/solutions/6971276
+	oc delete mutatingwebhookconfigurations controller.devfile.io || true
+	oc delete validatingwebhookconfigurations controller.devfile.io || true
+
+	# Leftovers specific to certain operators
+	oc delete Validating_webhook_configuration sriov-operator-webhook-config || true
+	oc delete Mutating_webhook_configuration sriov-operator-webhook-config || true
+}
+
+# Merge the shards' results.csv into the report's results.csv, keeping the first header only.
+# Skipped while no shard file changed, unless "force" is given.
+merge_results() {
+	local force=${1:-}
+	local merged="$REPORT_FOLDER"/results.csv
+	local shard_results=() results
+
+	for results in "$SHARDS_FOLDER"/*/results.csv; do
+		if [ -s "$results" ]; then
+			shard_results+=("$results")
+		fi
+	done
+	if [ "${#shard_results[@]}" -eq 0 ]; then
+		return 0
+	fi
+
+	# Only rewrite the merged file when a shard added rows
+	for results in "${shard_results[@]}"; do
+		if [ -n "$force" ] || [ ! -e "$merged" ] || [ "$results" -nt "$merged" ]; then
+			awk 'NR == 1 { header = $0 } FNR == 1 && NR != 1 && $0 == header { next } { print }' \
+				"${shard_results[@]}" >"$merged".tmp && mv "$merged".tmp "$merged"
+			return
+		fi
+	done
+}
+
+# Stop shards still running (the runner was stopped) and the progress output
+stop_shards() {
+	local id
+	for id in "${!shard_operators[@]}"; do
+		if shard_running "$id"; then
+			tmux kill-session -t "$SHARD_SESSION_PREFIX$id"
+		fi
+	done
+	if [ "${#progress_pids[@]}" -gt 0 ]; then
+		kill "${progress_pids[@]}" 2>/dev/null || true
+	fi
+}
+
+# Main
+
+# Writing CatalogSource template
+cat <<EOF >"$CATALOG_SOURCE_TEMPLATE"
+apiVersion: operators.coreos.com/v1alpha1
+kind: CatalogSource
+metadata:
+  name: $OPERATOR_CATALOG_NAME
+  namespace: $OPERATOR_CATALOG_NAMESPACE
+spec:
+  sourceType: grpc
+  image: \$CATALOG_INDEX
+  displayName: Operator Catalog
+  publisher: Redhat
+EOF
+
+if [ "$#" -ne 1 ] && [ "$#" -ne 2 ]; then
+	echo 'Wrong parameter count.
+  Usage: [SHARD_COUNT=N] ./run-sharded-batch-operators-test.sh <catalog-index> ["<operator-name 1> <operator-name 2> ... <operator-name N>"]
+  Examples:
+  SHARD_COUNT=4 ./run-sharded-batch-operators-test.sh registry.redhat.io/redhat-operators
+  SHARD_COUNT=2 ./run-sharded-batch-operators-test.sh registry.redhat.io/redhat-operators "file-integrity-operator kiali-ossm"'
+	exit 1
+fi
+CATALOG_INDEX=$1
+
+if ! [[ "$SHARD_COUNT" =~ ^[1-9][0-9]*$ ]]; then
+	echo_color "$RED" "SHARD_COUNT must be a positive number, got: $SHARD_COUNT"
+	exit 1
+fi
+
+# Check KUBECONFIG
+if [[ ! -v "KUBECONFIG" ]]; then
+	echo_color "$RED" "The environment variable KUBECONFIG is not set."
+	exit 1
+fi
+
+# The runner's session ends (stop, failure or done): take the shards down with it
+trap stop_shards EXIT
+trap 'exit 1' HUP INT TERM
+
+echo_color "$BLUE" "Creating Catalog Source"
+if ! create_catalog; then
+	echo_color "$RED" "Error, catalog source $OPERATOR_CATALOG_NAME is not ready"
+	exit 1
+fi
+wait_all_packages_ok
+
+if [ "$#" -eq 1 ]; then
+	# Get all the packages present in the cluster catalog
+	catalog_packages | cut -f1 | sort | sed 's|$|,'"$CATALOG_INDEX"'|' >"$OPERATOR_LIST_PATH"
+else
+	# shellcheck disable=SC2086
+	printf '%s,'"$CATALOG_INDEX"'\n' $2 >"$OPERATOR_LIST_PATH"
+fi
+
+plan_shards
+
+# Add per test run links
+{
+	echo "Time: <b>$TIMESTAMP</b>, Catalog index: <b>$CATALOG_INDEX</b>, shards: <b>$SHARD_COUNT</b>"
+	echo ", detailed results: "'<a href="/'"$REPORT_FOLDER_RELATIVE"'/'"$INDEX_FILE"'">'"link"'</a>'
+	echo ", CSV: "
+	echo '<a href="/'"$REPORT_FOLDER_RELATIVE"'/results.csv">'"link"'</a>'
+	echo ", operator list: "
+	echo '<a href="/'"$REPORT_FOLDER_RELATIVE"'/'"$OPERATOR_LIST_FILENAME"'">'"link"'</a>'
+	echo ", log: "
+	echo '<a href="/'"$REPORT_FOLDER_RELATIVE"'/'"$LOG_FILENAME"'">'"link"'</a>'
+	echo "<br>"
+} >>"$BASE_DIR"/"$INDEX_FILE"
+
+# Exclusive phase: shard 0 alone on the cluster
+if [ -n "${shard_operators[0]}" ]; then
+	echo_color "$BLUE" "Testing ${shard_load[0]} exclusive operators before the parallel shards"
+	start_shard 0
+	wait_shards 0
+fi
+
+echo_color "$BLUE" "Cleaning up cluster-scoped webhooks"
+delete_cluster_webhooks >>"$LOG_FILE_PATH" 2>&1
+
+echo_color "$BLUE" "Starting $SHARD_COUNT shards"
+parallel_shards=()
+for ((id = 1; id <= SHARD_COUNT; id++)); do
+	if [ -n "${shard_operators[id]}" ]; then
+		start_shard "$id"
+		parallel_shards+=("$id")
+	fi
+done
+if [ "${#parallel_shards[@]}" -gt 0 ]; then
+	wait_shards "${parallel_shards[@]}"
+fi
+merge_results force
+echo_color "$BLUE" "All shards finished"
+
+# Per operator links of all shards
+{
+	echo '<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>HTTP Link Example</title>'
+	cat "$SHARDS_FOLDER"/*/"$INDEX_FILE" 2>/dev/null
+	echo '</body></html>'
+} >"$REPORT_FOLDER"/"$INDEX_FILE"
+
+# Delete the catalog
+echo_color "$BLUE" "Remove Catalog"
+if ! oc delete catalogsources -n "$OPERATOR_CATALOG_NAMESPACE" "$OPERATOR_CATALOG_NAME"; then
+	echo_color "$RED" "Error, failed to delete catalog: $OPERATOR_CATALOG_NAME"
+fi
+
+echo_color "$GREEN" DONE
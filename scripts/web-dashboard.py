@@ -6,13 +6,42 @@ Requires: Flask, paramiko
 Install: pip3 install flask paramiko
 """
 
-from flask import Flask, render_template, jsonify, request, Response
-import subprocess
+from flask import Flask, render_template, jsonify, request, Response, g
+import array
+import asyncio
+import base64
+import binascii
+import csv
+import hashlib
+import io
+import itertools
 import json
+import math
 import os
+import shlex
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import uuid
+import zlib
 import logging
+from collections import OrderedDict, deque
+from concurrent.futures import wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from logging.handlers import RotatingFileHandler
-from datetime import datetime
+from datetime import datetime, timedelta
+
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+# Collectors shared with the test host side; the local backend runs them in-process
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import remote_probe  # noqa: E402
 
 app = Flask(__name__)
 
@@ -24,6 +53,14 @@ DASHBOARD_PORT = int(os.environ.get('DASHBOARD_PORT', '5001'))
 SSH_KEY_PATH = os.environ.get('SSH_KEY_PATH', '')  # Optional: path to SSH private key
 SSH_USER = os.environ.get('SSH_USER', '')  # Optional: SSH username
 
+# SSH transport: 'paramiko' keeps one pooled connection per host open across
+# requests, 'subprocess' forks the ssh binary for every command (legacy)
+SSH_TRANSPORT = os.environ.get('SSH_TRANSPORT', 'paramiko').lower()
+# Concurrent exec channels per host (OpenSSH's MaxSessions defaults to 10)
+SSH_MAX_CHANNELS = int(os.environ.get('SSH_MAX_CHANNELS', '8'))
+SSH_KEEPALIVE_INTERVAL = int(os.environ.get('SSH_KEEPALIVE_INTERVAL', '30'))
+SSH_CONNECT_TIMEOUT = int(os.environ.get('SSH_CONNECT_TIMEOUT', '10'))
+
 # Catalog configuration - can be overridden by environment variables
 # If not set, will be auto-discovered from cluster
 REDHAT_CATALOG_INDEX = os.environ.get('REDHAT_CATALOG_INDEX', '')
@@ -36,14 +73,56 @@ DEFAULT_CERTIFIED_INDEX = 'registry.redhat.io/redhat/certified-operator-index:v4
 # KUBECONFIG path for test execution
 KUBECONFIG_PATH = os.environ.get('KUBECONFIG_PATH', '~/.kcli/clusters/cluster1/auth/kubeconfig')
 
+# Interpreter used on the remote host to run remote_probe.py
+REMOTE_PYTHON = os.environ.get('REMOTE_PYTHON', 'python3')
+
+# Append-only capture of the test session output on the remote host (tmux pipe-pane)
+LIVE_OUTPUT_FILE = os.environ.get('LIVE_OUTPUT_FILE', '/tmp/operator-test-output.log')
+LIVE_OUTPUT_LINES = 200
+
+# Background collector: seconds between refreshes of the shared run snapshot,
+# and seconds without any reader after which refreshing pauses
+COLLECTOR_INTERVAL = float(os.environ.get('COLLECTOR_INTERVAL', '5'))
+COLLECTOR_IDLE_TIMEOUT = float(os.environ.get('COLLECTOR_IDLE_TIMEOUT', '120'))
+
+# Follow report-watcher-agent.py on the remote host: the collector refreshes when the
+# agent reports a change, and otherwise only every WATCHER_FALLBACK_INTERVAL seconds
+REPORT_WATCHER = os.environ.get('REPORT_WATCHER', 'false').lower() == 'true'
+WATCHER_FALLBACK_INTERVAL = float(os.environ.get('WATCHER_FALLBACK_INTERVAL', '60'))
+# Folder the agent is installed in on the remote host (relative to the SSH user's home)
+REMOTE_AGENT_DIR = os.environ.get('REMOTE_AGENT_DIR', '.cache/operator-test-dashboard/agent')
+
+# Seconds cluster metadata (cluster panel, discovered catalog indexes) is reused
+CLUSTER_INFO_TTL = int(os.environ.get('CLUSTER_INFO_TTL', '60'))
+CATALOG_INDEX_TTL = int(os.environ.get('CATALOG_INDEX_TTL', '600'))
+# Page size oc uses when listing cluster resources (keeps API server responses bounded)
+INVENTORY_CHUNK_SIZE = int(os.environ.get('INVENTORY_CHUNK_SIZE', '500'))
+
+# Upper bound of the parallel workers a test start may ask for (one tmux session,
+# namespace and report shard each)
+MAX_TEST_WORKERS = int(os.environ.get('MAX_TEST_WORKERS', '4'))
+
+# Longest a control job (cleanup, test start) may run before it is cancelled, in seconds
+JOB_TIMEOUT = int(os.environ.get('JOB_TIMEOUT', '1800'))
+
 # Demo mode - use mock data instead of SSH
 DEMO_MODE = os.environ.get('DEMO_MODE', 'false').lower() == 'true'
 
+# Where facts about the test host come from: 'ssh' (the remote host over SSH), 'local'
+# (REPORT_DIR, tmux and oc on the dashboard's own host, read directly) or 'demo'
+# (generated data). DEMO_MODE=true is the older spelling of BACKEND=demo
+BACKEND = os.environ.get('BACKEND', 'demo' if DEMO_MODE else 'ssh').lower()
+
 # Setup logging
 LOG_DIR = os.environ.get('LOG_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs'))
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, 'dashboard.log')
 
+# Local index of report facts; kept next to the logs so the Helm PVC persists it
+REPORT_INDEX_PATH = os.environ.get('REPORT_INDEX_PATH', os.path.join(LOG_DIR, 'reports.db'))
+# Columnar copies of sealed reports' results.csv for /api/results/query
+RESULTS_CACHE_DIR = os.environ.get('RESULTS_CACHE_DIR', os.path.join(LOG_DIR, 'results-cache'))
+
 # Configure logging format
 log_formatter = logging.Formatter(
     '%(asctime)s | %(levelname)-8s | %(message)s',
@@ -70,11 +149,181 @@ logger.info("=" * 60)
 logger.info("Dashboard started")
 logger.info(f"Log file: {LOG_FILE}")
 logger.info(f"Remote host: {REMOTE_HOST}")
-logger.info(f"Demo mode: {DEMO_MODE}")
+logger.info(f"Backend: {BACKEND}")
+logger.info(f"SSH transport: {SSH_TRANSPORT if paramiko else 'subprocess (paramiko not installed)'}")
 logger.info("=" * 60)
 
+# ============== METRICS ==============
+
+# Latency buckets in seconds; remote calls can take up to the 60s probe timeouts
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+def format_metric_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def escape_label_value(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class Metric:
+    """A metric family rendered in the Prometheus text exposition format.
+
+    Values are kept per label tuple; ``labelnames`` fixes the label order.
+    Every metric registers itself in ``METRICS`` on creation.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        METRICS.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{escape_label_value(value)}"' for name, value in pairs) + '}'
+
+    def items(self):
+        """(label values, value) of every series, sorted; a snapshot taken under the lock"""
+        with self._lock:
+            return sorted(self._values.items())
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        for key, value in self.items():
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value):
+        return [f'{self.name}{self._labels(key)} {format_metric_value(value)}']
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # Cumulative bucket counts, sum
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][index] += 1
+            entry[1] += value
+
+    def _samples(self, key, value):
+        counts, total = value
+        lines = [f'{self.name}_bucket{self._labels(key, [("le", format_metric_value(bound))])} {count}'
+                 for bound, count in zip(self.buckets, counts)]
+        lines.append(f'{self.name}_sum{self._labels(key)} {format_metric_value(total)}')
+        lines.append(f'{self.name}_count{self._labels(key)} {counts[-1]}')
+        return lines
+
+METRICS = []
+
+http_request_duration = Histogram(
+    'dashboard_http_request_duration_seconds', 'Time to build the response of a dashboard route',
+    ['method', 'route', 'status'])
+ssh_commands = Counter(
+    'dashboard_ssh_commands_total',
+    'Remote commands run, by command type and outcome (ok, failed, timeout, cancelled, error)',
+    ['command', 'outcome'])
+ssh_command_duration = Histogram(
+    'dashboard_ssh_command_duration_seconds', 'Duration of remote commands, by command type', ['command'])
+remote_calls_in_flight = Gauge(
+    'dashboard_remote_calls_in_flight', 'Remote commands currently running')
+cache_requests = Counter(
+    'dashboard_cache_requests_total', 'Cache lookups, by cache and result (hit, miss)', ['cache', 'result'])
+cache_hit_ratio = Gauge(
+    'dashboard_cache_hit_ratio', 'Share of cache lookups served from cache since start', ['cache'])
+test_running_gauge = Gauge('dashboard_test_running', '1 while a test run is in progress')
+tests_completed_gauge = Gauge('dashboard_tests_completed', 'Operators tested so far in the current or last run')
+tests_total_gauge = Gauge('dashboard_tests_total', 'Operators in the current or last run')
+tests_failed_gauge = Gauge('dashboard_tests_failed', 'Operators that failed to install in the current or last run')
+snapshot_age_gauge = Gauge('dashboard_snapshot_age_seconds', 'Age of the run snapshot the status routes serve')
+report_watcher_connected = Gauge(
+    'dashboard_report_watcher_connected', '1 while subscribed to the report watcher agent on the remote host')
+jobs_finished = Counter(
+    'dashboard_jobs_total', 'Control jobs finished, by kind and outcome (succeeded, failed)', ['kind', 'outcome'])
+jobs_active = Gauge('dashboard_jobs_active', 'Control jobs queued or running')
+
+def count_cache_lookup(cache, hit):
+    cache_requests.inc(cache=cache, result='hit' if hit else 'miss')
+
+def render_metrics():
+    """All metrics in the Prometheus text format (version 0.0.4)"""
+    lookups = {}
+    for (cache, result), count in cache_requests.items():
+        entry = lookups.setdefault(cache, [0, 0])
+        entry[0] += count
+        if result == 'hit':
+            entry[1] += count
+    for cache, (total, hits) in lookups.items():
+        cache_hit_ratio.set(hits / total if total else 0.0, cache=cache)
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.monotonic()
+
+@app.after_request
+def observe_request(response):
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        # The route pattern, not the path, so labels stay bounded
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        http_request_duration.observe(time.monotonic() - started, method=request.method,
+                                      route=route, status=response.status_code)
+    return response
+
 # ============== DEMO MODE DATA ==============
-# Sample data for demonstration when remote host is not available
+# Sample data for demonstration when remote host is not available.
+# Generated in the shapes remote_probe.py reports, so the demo backend
+# exercises the same code paths as a real test host.
 import random
 from datetime import timedelta
 
@@ -86,49 +335,143 @@ DEMO_OPERATORS = [
     'ocs-operator', 'odf-operator', 'metallb-operator', 'cert-manager-operator'
 ]
 
+# Past runs: how many operators each tested and how many of those failed
 DEMO_REPORTS = [
-    {'name': 'report_2026-02-03_14-30-00_EST', 'total': 47, 'installed': 45, 'failed': 2},
-    {'name': 'report_2026-02-02_10-15-00_EST', 'total': 51, 'installed': 51, 'failed': 0},
-    {'name': 'report_2026-02-01_16-45-00_EST', 'total': 38, 'installed': 36, 'failed': 2},
-    {'name': 'report_2026-01-31_09-00-00_EST', 'total': 42, 'installed': 40, 'failed': 2},
-    {'name': 'report_2026-01-30_14-20-00_EST', 'total': 55, 'installed': 55, 'failed': 0},
-    {'name': 'report_2026-01-29_11-30-00_EST', 'total': 33, 'installed': 31, 'failed': 2},
-    {'name': 'report_2026-01-28_15-45-00_EST', 'total': 48, 'installed': 47, 'failed': 1},
-    {'name': 'report_2026-01-27_08-30-00_EST', 'total': 44, 'installed': 42, 'failed': 2},
-    {'name': 'report_2026-01-26_13-00-00_EST', 'total': 50, 'installed': 50, 'failed': 0},
-    {'name': 'report_2026-01-25_10-45-00_EST', 'total': 39, 'installed': 37, 'failed': 2},
+    {'name': 'report_2026-02-03_14-30-00_EST', 'total': 17, 'failed': 2},
+    {'name': 'report_2026-02-02_10-15-00_EST', 'total': 18, 'failed': 0},
+    {'name': 'report_2026-02-01_16-45-00_EST', 'total': 14, 'failed': 2},
+    {'name': 'report_2026-01-31_09-00-00_EST', 'total': 16, 'failed': 2},
+    {'name': 'report_2026-01-30_14-20-00_EST', 'total': 18, 'failed': 0},
+    {'name': 'report_2026-01-29_11-30-00_EST', 'total': 12, 'failed': 2},
+    {'name': 'report_2026-01-28_15-45-00_EST', 'total': 17, 'failed': 1},
+    {'name': 'report_2026-01-27_08-30-00_EST', 'total': 15, 'failed': 2},
+    {'name': 'report_2026-01-26_13-00-00_EST', 'total': 18, 'failed': 0},
+    {'name': 'report_2026-01-25_10-45-00_EST', 'total': 13, 'failed': 2},
+]
+
+# Operators the simulated run fails to install
+DEMO_RUN_FAILED = {'nvidia-gpu-operator'}
+
+# certsuite test cases of a demo claim.json: (suite, test id, chance it fails)
+DEMO_TEST_CASES = [
+    ('access-control', 'access-control-namespace', 0.02),
+    ('access-control', 'access-control-pod-automount-service-account-token', 0.35),
+    ('access-control', 'access-control-security-context-non-root-user-id-check', 0.2),
+    ('access-control', 'access-control-sys-admin-capability-check', 0.05),
+    ('lifecycle', 'lifecycle-container-poststart', 0.4),
+    ('lifecycle', 'lifecycle-liveness-probe', 0.15),
+    ('lifecycle', 'lifecycle-readiness-probe', 0.1),
+    ('networking', 'networking-icmpv4-connectivity', 0.05),
+    ('observability', 'observability-crd-status', 0.25),
+    ('operator', 'operator-crd-openapi-schema', 0.1),
+    ('operator', 'operator-crd-versioning', 0.02),
+    ('operator', 'operator-install-source', 0.0),
+    ('operator', 'operator-install-status-succeeded', 0.0),
+    ('operator', 'operator-olm-skip-range', 0.3),
+    ('operator', 'operator-single-crd-owner', 0.08),
+    ('platform-alteration', 'platform-alteration-base-image', 0.12),
 ]
 
-# Simulated test state for demo
+# Simulated test state for demo; a stopped run keeps the report as it was at stop_time
 demo_test_state = {
     'running': True,
     'start_time': datetime.now() - timedelta(minutes=random.randint(5, 45)),
-    'current_index': random.randint(5, 15),
-    'total': 20
+    'stop_time': None,
 }
 
-def get_demo_status():
-    """Return demo status data"""
-    elapsed = datetime.now() - demo_test_state['start_time']
-    # Simulate progress
-    progress_rate = elapsed.total_seconds() / 180  # ~3 min per operator
-    current_idx = min(int(progress_rate) + 5, demo_test_state['total'])
-    
+def demo_report_name(start_time):
+    return f"report_{start_time.strftime('%Y-%m-%d_%H-%M-%S')}_EST"
+
+def demo_timings(report_name, operators, failed, started):
+    """Phase timings of a demo run (see remote_probe.collect_phase_times), the same on every call"""
+    rng = random.Random(report_name)
+    timings = []
+    for name in operators:
+        phases = {'prepare': rng.randint(3, 10), 'cleanup': rng.randint(5, 20),
+                  'install': rng.randint(20, 60), 'wait_csv': rng.randint(30, 120)}
+        if name not in failed:
+            phases.update(cnf_suite=rng.randint(60, 240), unlabel=rng.randint(2, 10),
+                          uninstall=rng.randint(10, 30), wait_cleanup=rng.randint(10, 90),
+                          parse_claim=rng.randint(2, 8))
+        timings.append({'name': name, 'status': 'failed' if name in failed else 'installed',
+                        'started': started, 'seconds': sum(phases.values()),
+                        'phase': list(phases)[-1], 'phases': phases})
+        started += timings[-1]['seconds']
+    return timings
+
+def demo_report_facts(report_name, operators, failed, started, now=None):
+    """Probe facts of a demo report (see remote_probe.collect_report).
+
+    Without ``now`` the run is over; otherwise it only got as far as ``now``
+    (epoch seconds), with the operator in progress at that time running.
+    """
+    timings = demo_timings(report_name, operators, failed, started)
+    done = now is None or timings[-1]['started'] + timings[-1]['seconds'] <= now
+    reached = []
+    if not done:
+        timings = [timing for timing in timings if timing['started'] <= now]
+        current = timings[-1]
+        elapsed = now - current['started']
+        for phase, seconds in current['phases'].items():
+            reached.append(phase)
+            if elapsed < seconds:
+                break
+            elapsed -= seconds
+        timings[-1] = dict(current, status='running', seconds=None, phase=reached[-1], phases={})
+    records = []
+    waits = {}
+    for timing in timings:
+        phases = reached if timing['seconds'] is None else list(timing['phases'])
+        records.append({'package': timing['name'], 'name': timing['name'],
+                        'catalog_index': DEFAULT_REDHAT_INDEX, 'namespace': f"test-{timing['name']}",
+                        'phases': [phase for phase in phases if phase != 'prepare'], 'status': timing['status']})
+        for wait, phase in (('csv_succeeded', 'wait_csv'), ('namespace_deleted', 'wait_cleanup')):
+            if phase in timing['phases']:
+                seconds = timing['phases'][phase]
+                entry = waits.setdefault(wait, {'count': 0, 'seconds': 0, 'max_seconds': 0, 'failed': 0})
+                entry['count'] += 1
+                entry['seconds'] += seconds
+                entry['max_seconds'] = max(entry['max_seconds'], seconds)
+                entry['failed'] += int(timing['status'] == 'failed' and wait == 'csv_succeeded')
+    last_event = max(timing['started'] + (timing['seconds'] or 0) for timing in timings)
+    path = f'{REPORT_DIR}/{report_name}'
     return {
-        'running': demo_test_state['running'],
-        'current_operator': DEMO_OPERATORS[current_idx % len(DEMO_OPERATORS)] if demo_test_state['running'] else None,
-        'total': demo_test_state['total'],
-        'completed': current_idx,
-        'installed': current_idx - 1,
-        'remaining': max(0, demo_test_state['total'] - current_idx),
-        'start_time': demo_test_state['start_time'].strftime('%Y-%m-%dT%H:%M:%S'),
-        'report_name': f"report_{demo_test_state['start_time'].strftime('%Y-%m-%d_%H-%M-%S')}_EST"
+        'name': report_name,
+        'path': path,
+        'mtime': timings[-1]['started'],
+        'operators_total': len(operators),
+        'operator_list': list(operators),
+        'operator_dirs': sorted(timing['name'] for timing in timings),
+        'shards': [],
+        'log_file': f'{path}/output_{report_name[7:]}.log',
+        'log_size': 2048 * len(records),
+        'log_mtime': last_event,
+        'log': remote_probe.summarize_records(records, done),
+        'timings': timings,
+        'waits': waits,
     }
 
-def get_demo_live_output():
+def get_demo_report(report_name):
+    """Probe facts of a demo report by name: the simulated run or a past one; None if unknown"""
+    start_time = demo_test_state['start_time']
+    if report_name == demo_report_name(start_time):
+        now = (demo_test_state['stop_time'] or datetime.now()).timestamp()
+        return demo_report_facts(report_name, DEMO_OPERATORS, DEMO_RUN_FAILED, start_time.timestamp(), now)
+    report = next((r for r in DEMO_REPORTS if r['name'] == report_name), None)
+    if report is None:
+        return None
+    rng = random.Random(report_name)
+    operators = rng.sample(DEMO_OPERATORS, report['total'])
+    started = datetime.strptime(report_name[7:26], '%Y-%m-%d_%H-%M-%S').timestamp()
+    return demo_report_facts(report_name, operators, set(rng.sample(operators, report['failed'])), started)
+
+def get_demo_report_names():
+    """Demo reports, newest first"""
+    return [demo_report_name(demo_test_state['start_time'])] + [r['name'] for r in DEMO_REPORTS]
+
+def get_demo_live_output(current_operator, completed, total):
     """Return demo live output"""
-    current = get_demo_status()
-    op = current['current_operator'] or 'cluster-logging'
+    op = current_operator or 'cluster-logging'
     output_lines = [
         "=" * 60,
         f"Operator Certification Test Suite - Demo Mode",
@@ -152,112 +495,416 @@ def get_demo_live_output():
         "  [INFO] Running test: operator-olm-subscription",
         "  [PASS] operator-olm-subscription",
         "",
-        f"Progress: {current['completed']}/{current['total']} operators completed",
+        f"Progress: {completed}/{total} operators completed",
         f"Elapsed: {(datetime.now() - demo_test_state['start_time']).seconds // 60} minutes",
         "",
         "=" * 60,
     ]
     return '\n'.join(output_lines)
 
-def get_demo_reports(limit=10):
-    """Return demo reports data"""
-    reports = []
-    for r in DEMO_REPORTS[:limit]:
-        date_str = r['name'].replace('report_', '')
-        reports.append({
-            'name': r['name'],
-            'path': f"/var/www/html/{r['name']}",
-            'date': date_str,
-            'total': r['total'],
-            'installed': r['installed'],
-            'failed': r['failed']
-        })
-    return reports
+def get_demo_status_facts(live_lines=0):
+    """Status probe facts of the simulated run (see remote_probe.collect_status)"""
+    start_time = demo_test_state['start_time']
+    latest = get_demo_report(demo_report_name(start_time))
+    running = demo_test_state['running'] and not latest['log']['done']
+    current = latest['timings'][-1]
+    current_operator = current['name'] if running else ''
+    recent_output = ''
+    live = None
+    if running:
+        markers = {phase: marker for marker, phase in remote_probe.LogParser.PHASES.items()}
+        recent_output = f"package= {current_operator}\n{markers.get(current['phase'], '')}"
+        if live_lines:
+            live = {'id': f'demo-{int(start_time.timestamp())}', 'offset': 0, 'next': -1, 'reset': True,
+                    'data': get_demo_live_output(current_operator, len(latest['operator_dirs']) - 1,
+                                                 latest['operators_total'])}
+    return {
+        'test_running': running,
+        'current_operator': current_operator,
+        'recent_output': recent_output,
+        'live': live,
+        'latest_report': latest,
+        'report_dir_mtime': start_time.timestamp(),
+        'now': time.time(),
+    }
 
-def get_demo_report_summary(report_name):
-    """Return demo report summary"""
-    # Find matching report or use defaults
-    report_data = next((r for r in DEMO_REPORTS if r['name'] == report_name), DEMO_REPORTS[0])
-    
-    total = report_data['total']
-    installed = report_data['installed']
-    failed = report_data['failed']
-    
-    # Generate operator lists
-    all_ops = DEMO_OPERATORS * 3  # Expand list
-    random.seed(hash(report_name))  # Consistent results per report
-    tested_ops = random.sample(all_ops, min(total, len(all_ops)))
-    installed_ops = tested_ops[:installed]
-    failed_ops = tested_ops[installed:installed+failed] if failed > 0 else []
-    other_ops = tested_ops[installed+failed:]
-    
+def get_demo_inventory():
+    """Inventory probe facts of a small demo cluster (see remote_probe.collect_inventory)"""
     return {
-        'report_name': report_name,
-        'tested': len(tested_ops),
-        'installed': len(installed_ops),
-        'failed': len(failed_ops),
-        'other': len(other_ops),
-        'tested_operators': tested_ops,
-        'installed_operators': installed_ops,
-        'failed_operators': failed_ops,
-        'other_operators': other_ops
+        'user': 'demo-user',
+        'api_url': 'https://api.demo-cluster.example.com:6443',
+        'cluster_versions': [{'name': 'version', 'version': '4.21.0', 'available': True, 'progressing': False}],
+        'nodes': [{'name': f'master-{i}', 'ready': True, 'roles': ['control-plane', 'master', 'worker'],
+                   'kubelet_version': 'v1.34.2'} for i in range(3)],
+        'catalog_sources': [
+            {'namespace': 'openshift-marketplace', 'name': 'certified-operators', 'image': DEFAULT_CERTIFIED_INDEX,
+             'display_name': 'Certified Operators', 'status': 'READY'},
+            {'namespace': 'openshift-marketplace', 'name': 'community-operators',
+             'image': 'registry.redhat.io/redhat/community-operator-index:v4.21',
+             'display_name': 'Community Operators', 'status': 'READY'},
+            {'namespace': 'openshift-marketplace', 'name': 'redhat-operators', 'image': DEFAULT_REDHAT_INDEX,
+             'display_name': 'Red Hat Operators', 'status': 'READY'},
+        ],
+        'operators': [
+            {'namespace': 'openshift-logging', 'name': 'cluster-logging.v5.8.0',
+             'display_name': 'Red Hat OpenShift Logging', 'version': '5.8.0', 'status': 'Succeeded'},
+            {'namespace': 'openshift-operators-redhat', 'name': 'elasticsearch-operator.v5.8.0',
+             'display_name': 'OpenShift Elasticsearch Operator', 'version': '5.8.0', 'status': 'Succeeded'},
+        ],
+        'subscriptions': [
+            {'namespace': 'openshift-logging', 'name': 'cluster-logging', 'package': 'cluster-logging',
+             'channel': 'stable-5.8', 'source': 'redhat-operators', 'installed_csv': 'cluster-logging.v5.8.0',
+             'state': 'AtLatestKnown'},
+            {'namespace': 'openshift-operators-redhat', 'name': 'elasticsearch-operator',
+             'package': 'elasticsearch-operator', 'channel': 'stable-5.8', 'source': 'redhat-operators',
+             'installed_csv': 'elasticsearch-operator.v5.8.0', 'state': 'AtLatestKnown'},
+        ],
+        'errors': [],
     }
 
 def get_demo_csv(report_name):
-    """Return demo CSV data"""
-    summary = get_demo_report_summary(report_name)
-    lines = ['operator,status,install_time,test_result']
-    for op in summary['installed_operators']:
-        lines.append(f'{op},installed,45s,PASS')
-    for op in summary['failed_operators']:
-        lines.append(f'{op},failed,0s,FAIL')
-    for op in summary['other_operators']:
-        lines.append(f'{op},unknown,0s,SKIP')
+    """Return demo results.csv content, as certsuite writes it ('' for an unknown report)"""
+    claims = get_demo_claims([report_name])['reports']
+    if not claims:
+        return ''
+    lines = ['CNFName,OperatorVersion,testID,Suite,Description,State,StartTime,EndTime,SkipReason,CheckDetails,CNFType']
+    for operator, rows in claims[0]['operators'].items():
+        for test_id, suite, state, duration in rows:
+            skip_reason = 'no resources under test' if state == 'skipped' else ''
+            lines.append(f'{operator},v1.0.0,{test_id},{suite},"Checks {test_id}",{state},,,{skip_reason},,non-telco')
     return '\n'.join(lines)
 
+def get_demo_claims(names):
+    """Test case results of the installed operators of demo reports (see remote_probe.collect_claims)"""
+    reports = []
+    for name in names:
+        report = get_demo_report(name)
+        if report is None:
+            continue
+        operators = {}
+        for timing in report['timings']:
+            if timing['status'] != 'installed':
+                continue
+            rng = random.Random(f"{name}/{timing['name']}")
+            operators[timing['name']] = [
+                [test_id, suite, 'skipped' if rng.random() < 0.1 else 'failed' if rng.random() < fail else 'passed',
+                 round(rng.uniform(0.1, 30), 3)]
+                for suite, test_id, fail in DEMO_TEST_CASES]
+        reports.append({'name': name, 'operators': operators, 'errors': []})
+    return {'reports': reports}
+
 # ============== END DEMO MODE DATA ==============
 
-def ssh_command(cmd, log_cmd=False, timeout=30):
-    """Execute SSH command and return output"""
+# ============== SSH TRANSPORT ==============
+
+class SSHConnectionPool:
+    """Long-lived SSH connection to a single host, shared by all requests.
+
+    One paramiko transport multiplexes the exec channels of all concurrent
+    commands (capped per host by the remote execution core). Keepalives stop idle
+    NAT/firewall timeouts, and a dropped transport is re-established on the
+    next call, so a handshake is only paid once per connection.
+    """
+
+    def __init__(self, host, user='', key_path='', keepalive=30, connect_timeout=10):
+        self.host = host
+        self.user = user
+        self.key_path = key_path
+        self.keepalive = keepalive
+        self.connect_timeout = connect_timeout
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _connect_params(self):
+        """Resolve connection parameters, honouring ~/.ssh/config like the ssh binary"""
+        params = {
+            'hostname': self.host,
+            'timeout': self.connect_timeout,
+            'banner_timeout': self.connect_timeout,
+            'auth_timeout': self.connect_timeout,
+        }
+        config_path = os.path.expanduser('~/.ssh/config')
+        if os.path.exists(config_path):
+            host_config = paramiko.SSHConfig.from_path(config_path).lookup(self.host)
+            params['hostname'] = host_config.get('hostname', self.host)
+            if 'port' in host_config:
+                params['port'] = int(host_config['port'])
+            if 'user' in host_config:
+                params['username'] = host_config['user']
+            if 'identityfile' in host_config:
+                params['key_filename'] = host_config['identityfile']
+            if 'proxycommand' in host_config:
+                params['sock'] = paramiko.ProxyCommand(host_config['proxycommand'])
+        if self.user:
+            params['username'] = self.user
+        if self.key_path:
+            params['key_filename'] = self.key_path
+        return params
+
+    def _get_transport(self):
+        """Return the active transport, (re)connecting if needed"""
+        with self._lock:
+            transport = self._client.get_transport() if self._client else None
+            if transport is None or not transport.is_active():
+                if self._client:
+                    logger.warning(f"SSH connection to {self.host} lost, reconnecting")
+                    self._client.close()
+                    self._client = None
+                client = paramiko.SSHClient()
+                # Same behaviour as StrictHostKeyChecking=no / UserKnownHostsFile=/dev/null
+                client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                client.connect(**self._connect_params())
+                transport = client.get_transport()
+                transport.set_keepalive(self.keepalive)
+                self._client = client
+                logger.info(f"SSH connection established to {self.host}")
+            return transport
+
+    def _reset(self):
+        """Drop the current connection so the next call reconnects"""
+        with self._lock:
+            if self._client:
+                self._client.close()
+                self._client = None
+
+    async def exec_command(self, cmd, input=None):
+        """Run a command on the host and return (exit_status, stdout, stderr).
+
+        paramiko only offers blocking calls, so opening the channel and
+        sending ``input`` run in the loop's default executor; the output is
+        then awaited on the channel's file descriptor. Cancelling the task
+        (deadline or caller gone) closes the channel.
+        """
+        loop = asyncio.get_running_loop()
+        channel = await loop.run_in_executor(None, self._start_channel, cmd, input)
+        try:
+            return await self._collect(channel)
+        finally:
+            channel.close()
+
+    def _start_channel(self, cmd, input):
+        # Opening a channel is safe to retry: the command has not run yet
+        for attempt in range(2):
+            try:
+                channel = self._get_transport().open_session(timeout=self.connect_timeout)
+                break
+            except (paramiko.SSHException, EOFError, OSError):
+                self._reset()
+                if attempt:
+                    raise
+        try:
+            channel.exec_command(cmd)
+            if input is not None:
+                channel.sendall(input.encode('utf-8'))
+            channel.shutdown_write()
+        except BaseException:
+            channel.close()
+            raise
+        return channel
+
+    async def exec_lines(self, cmd):
+        """Yield the stdout lines of a command as they arrive; the channel closes when iteration stops"""
+        loop = asyncio.get_running_loop()
+        channel = await loop.run_in_executor(None, self._start_channel, cmd, None)
+        try:
+            pending = b''
+            async for stream, data in self._output(channel):
+                if stream == 'stdout':
+                    *lines, pending = (pending + data).split(b'\n')
+                    for line in lines:
+                        yield line.decode('utf-8', errors='replace')
+            if pending:
+                yield pending.decode('utf-8', errors='replace')
+        finally:
+            channel.close()
+
+    @classmethod
+    async def _collect(cls, channel):
+        stdout = []
+        stderr = []
+        async for stream, data in cls._output(channel):
+            (stdout if stream == 'stdout' else stderr).append(data)
+        return (
+            channel.recv_exit_status(),
+            b''.join(stdout).decode('utf-8', errors='replace'),
+            b''.join(stderr).decode('utf-8', errors='replace'),
+        )
+
+    @staticmethod
+    async def _output(channel):
+        """Yield ('stdout' | 'stderr', bytes) as the channel receives them, until the command exits"""
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        fd = channel.fileno()
+        loop.add_reader(fd, readable.set)
+        try:
+            while True:
+                readable.clear()
+                while channel.recv_ready():
+                    yield 'stdout', channel.recv(65536)
+                while channel.recv_stderr_ready():
+                    yield 'stderr', channel.recv_stderr(65536)
+                if channel.exit_status_ready() and not channel.recv_ready() and not channel.recv_stderr_ready():
+                    break
+                # Only stdout signals the descriptor: look at stderr and the
+                # exit status at least once a second
+                try:
+                    await asyncio.wait_for(readable.wait(), 1.0)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            loop.remove_reader(fd)
+
+    def close(self):
+        self._reset()
+
+
+_ssh_pools = {}
+_ssh_pools_lock = threading.Lock()
+
+def get_ssh_pool(host=None):
+    """Return the shared connection pool for a host (one pool per host)"""
+    host = host or REMOTE_HOST
+    with _ssh_pools_lock:
+        pool = _ssh_pools.get(host)
+        if pool is None:
+            pool = SSHConnectionPool(
+                host,
+                user=SSH_USER,
+                key_path=SSH_KEY_PATH,
+                keepalive=SSH_KEEPALIVE_INTERVAL,
+                connect_timeout=SSH_CONNECT_TIMEOUT,
+            )
+            _ssh_pools[host] = pool
+        return pool
+
+def build_ssh_argv(cmd):
+    """Build the argv for the ssh binary (subprocess transport)"""
+    ssh_cmd = ['ssh']
+    if SSH_KEY_PATH:
+        ssh_cmd.extend(['-i', SSH_KEY_PATH])
+    # Suppress known_hosts warnings with LogLevel=ERROR
+    ssh_cmd.extend([
+        '-o', 'StrictHostKeyChecking=no',
+        '-o', 'UserKnownHostsFile=/dev/null',
+        '-o', 'LogLevel=ERROR'
+    ])
+
+    # Add user@host or just host
+    if SSH_USER:
+        ssh_cmd.append(f'{SSH_USER}@{REMOTE_HOST}')
+    else:
+        ssh_cmd.append(REMOTE_HOST)
+
+    ssh_cmd.append(cmd)
+    return ssh_cmd
+
+def command_type(cmd):
+    """Metrics label of a remote command: its program name"""
+    program = cmd.split(None, 1)[0] if cmd.strip() else ''
+    return os.path.basename(program) or 'empty'
+
+async def run_subprocess(argv, input=None, cwd=None):
+    """Run a program (the ssh binary, or a local shell) and return (exit_status, stdout, stderr);
+    killed if cancelled"""
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    try:
+        stdout, stderr = await process.communicate(input.encode('utf-8') if input is not None else None)
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+        raise
+    return (
+        process.returncode,
+        stdout.decode('utf-8', errors='replace'),
+        stderr.decode('utf-8', errors='replace'),
+    )
+
+async def ssh_command_async(cmd, log_cmd=False, timeout=30, input=None, kind=None):
+    """Execute SSH command on the remote loop and return output.
+
+    ``timeout`` is a deadline for the whole call, including the wait for one
+    of the host's SSH_MAX_CHANNELS slots. ``kind`` labels the call in the
+    metrics (default: the program name).
+    """
+    kind = kind or command_type(cmd)
+    outcome = 'error'
+    started = time.monotonic()
+    remote_calls_in_flight.inc()
     try:
         if log_cmd:
             logger.debug(f"SSH command: {cmd[:100]}...")
-        
-        # Build SSH command with optional key and user
-        ssh_cmd = ['ssh']
-        if SSH_KEY_PATH:
-            ssh_cmd.extend(['-i', SSH_KEY_PATH])
-        # Suppress known_hosts warnings with LogLevel=ERROR
-        ssh_cmd.extend([
-            '-o', 'StrictHostKeyChecking=no',
-            '-o', 'UserKnownHostsFile=/dev/null',
-            '-o', 'LogLevel=ERROR'
-        ])
-        
-        # Add user@host or just host
-        if SSH_USER:
-            ssh_cmd.append(f'{SSH_USER}@{REMOTE_HOST}')
-        else:
-            ssh_cmd.append(REMOTE_HOST)
-        
-        ssh_cmd.append(cmd)
-        
-        result = subprocess.run(
-            ssh_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+
+        async def run():
+            async with remote_loop.host_slot(REMOTE_HOST):
+                if SSH_TRANSPORT == 'paramiko' and paramiko:
+                    return await get_ssh_pool().exec_command(cmd, input=input)
+                return await run_subprocess(build_ssh_argv(cmd), input=input)
+
+        returncode, stdout, stderr = await asyncio.wait_for(run(), timeout)
+        outcome = 'ok' if returncode == 0 else 'failed'
         # Only log real errors, not SSH warnings about known hosts
-        if result.returncode != 0 and result.stderr and 'Warning:' not in result.stderr:
-            logger.warning(f"SSH command failed (exit {result.returncode}): {result.stderr[:200]}")
-        return result.stdout
-    except subprocess.TimeoutExpired:
+        if returncode != 0 and stderr and 'Warning:' not in stderr:
+            logger.warning(f"SSH command failed (exit {returncode}): {stderr[:200]}")
+        return stdout
+    except asyncio.TimeoutError:
+        outcome = 'timeout'
         logger.error(f"SSH command timed out after {timeout}s: {cmd[:100]}...")
         return "Error: Command timed out"
+    except asyncio.CancelledError:
+        outcome = 'cancelled'
+        raise
     except Exception as e:
         logger.error(f"SSH command failed: {str(e)}")
         return f"Error: {str(e)}"
+    finally:
+        remote_calls_in_flight.dec()
+        ssh_commands.inc(command=kind, outcome=outcome)
+        ssh_command_duration.observe(time.monotonic() - started, command=kind)
+
+async def ssh_lines_async(cmd):
+    """Yield the stdout lines of a long-running remote command as they arrive.
+
+    There is no deadline and no channel slot: the command runs until it exits
+    or the caller stops iterating, which kills its ssh process or closes its
+    channel.
+    """
+    if SSH_TRANSPORT == 'paramiko' and paramiko:
+        async for line in get_ssh_pool().exec_lines(cmd):
+            yield line
+        return
+    lines = subprocess_lines(build_ssh_argv(cmd))
+    try:
+        async for line in lines:
+            yield line
+    finally:
+        await lines.aclose()
+
+async def subprocess_lines(argv, cwd=None):
+    """Yield the stdout lines of a program as they arrive; it is killed when the caller stops"""
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=cwd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        limit=1024 * 1024,
+    )
+    try:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            yield line.decode('utf-8', errors='replace').rstrip('\n')
+    finally:
+        if process.returncode is None:
+            process.kill()
 
 def safe_int(value, default=0):
     """Safely convert a string to int, handling multi-line output"""
@@ -268,6 +915,569 @@ def safe_int(value, default=0):
     except (ValueError, IndexError):
         return default
 
+# Probe script shipped to the remote host over stdin; see remote_probe.py
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(SCRIPT_DIR, 'remote_probe.py')) as probe_file:
+    REMOTE_PROBE_SOURCE = probe_file.read()
+
+async def run_remote_probe_async(*args, timeout=30):
+    """Run remote_probe.py on the remote host in one round trip and return its JSON result"""
+    cmd = ' '.join([REMOTE_PYTHON, '-'] + [shlex.quote(str(arg)) for arg in args])
+    output = await ssh_command_async(cmd, timeout=timeout, input=REMOTE_PROBE_SOURCE, kind=f'probe_{args[0]}')
+    try:
+        return json.loads(output)
+    except ValueError:
+        logger.warning(f"Remote probe '{args[0]}' returned invalid output: {output[:200]}")
+        return None
+
+# ============== REMOTE EXECUTION CORE ==============
+
+class RemoteLoop:
+    """Asyncio event loop on a daemon thread that runs all remote I/O.
+
+    Remote commands are coroutines awaiting ssh subprocess pipes or SSH
+    channel descriptors, so hundreds can be in flight without a thread each.
+    Request threads hand work over with ``submit`` (a concurrent.futures
+    Future whose cancel() cancels the coroutine) or block on one result with
+    ``run``. The loop starts on first use.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._host_slots = {}
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='remote-loop', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro):
+        """Schedule a coroutine on the loop and return a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+
+    def run(self, coro, timeout=None):
+        """Block until a coroutine finishes; it is cancelled if ``timeout`` expires first"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('blocking remote call on the remote loop; await the async variant')
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def host_slot(self, host):
+        """Semaphore bounding concurrent commands to a host (use on the loop only)"""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(SSH_MAX_CHANNELS)
+        return slot
+
+
+remote_loop = RemoteLoop()
+
+def submit_remote(func, *args, **kwargs):
+    """Start ``func(*args, **kwargs)``, a coroutine function, on the remote loop.
+
+    Returns a concurrent.futures.Future. The per-host SSH_MAX_CHANNELS cap is
+    applied by ssh_command_async, and cancelling the future stops the call
+    (its ssh process is killed or its channel closed).
+    """
+    return remote_loop.submit(func(*args, **kwargs))
+
+class FanOut:
+    """Independent remote calls run concurrently, collected with a deadline.
+
+        fan = FanOut()
+        fan.submit('version', ssh_command_async, 'oc version')
+        results, errors = fan.results(timeout=30)
+
+    Calls still running at the deadline are cancelled; they and the calls
+    that raised are left out of ``results`` and reported in ``errors`` so
+    callers can answer with what they have.
+    """
+
+    def __init__(self):
+        self._futures = {}
+
+    def submit(self, name, func, *args, **kwargs):
+        self._futures[submit_remote(func, *args, **kwargs)] = name
+
+    def results(self, timeout):
+        done, not_done = wait(self._futures, timeout=timeout)
+        results = {}
+        errors = {}
+        for future in done:
+            try:
+                results[self._futures[future]] = future.result()
+            except Exception as e:
+                errors[self._futures[future]] = str(e)
+        for future in not_done:
+            future.cancel()
+            errors[self._futures[future]] = f'Timed out after {timeout}s'
+        if errors:
+            logger.warning(f"Remote fan-out: {len(errors)}/{len(self._futures)} call(s) incomplete: {errors}")
+        return results, errors
+
+# ============== BACKENDS ==============
+
+def tmux_start_command(command):
+    """Start the operator-test session with its output piped to LIVE_OUTPUT_FILE.
+
+    pipe-pane runs in the same tmux invocation as new-session so no output is
+    missed; the capture file is recreated so every run gets a new file id.
+    """
+    return (f'rm -f {LIVE_OUTPUT_FILE} && tmux new-session -d -s operator-test "{command}" '
+            f"\\; pipe-pane -o -t operator-test 'cat >> {LIVE_OUTPUT_FILE}'")
+
+# Printed after a streamed command, so its exit status comes back over any transport
+STREAM_EXIT_MARKER = '__operator_test_dashboard_exit_status='
+# Last lines of SSHBackend.read_csv's output: results.csv was read (then cat's exit status) or does not exist
+CSV_READ_MARKER = '__operator_test_dashboard_csv_read='
+CSV_MISSING_MARKER = '__operator_test_dashboard_csv_missing'
+
+class Backend:
+    """Everything the dashboard reads from or does on the test host.
+
+    Methods are coroutines run on the remote loop. Facts come back in the
+    shapes of remote_probe.py's subcommands (``status``, ``reports``,
+    ``tail``, ``inventory``), or None when the host could not be asked, so
+    routes and the collector work the same whichever backend is selected
+    with BACKEND.
+    """
+
+    name = ''
+    # Whether the report watcher agent can be started through ``run`` and followed with ``lines``
+    supports_watcher = True
+
+    async def status(self, live_since=-1, live_id='', live_lines=0):
+        """Test session state and facts of the newest report"""
+        raise NotImplementedError
+
+    async def reports(self, names=(), newest=False, timeout=30):
+        """Listing of all reports, plus facts of the named ones (and of the newest if asked)"""
+        raise NotImplementedError
+
+    async def tail(self, since=-1, file_id='', lines=LIVE_OUTPUT_LINES):
+        """Live output appended after byte offset ``since`` of capture file ``file_id``"""
+        raise NotImplementedError
+
+    async def inventory(self):
+        """Cluster identity and resources"""
+        raise NotImplementedError
+
+    async def read_csv(self, report_name):
+        """Content of a report's results.csv, '' if it has none; raises if it could not be read"""
+        raise NotImplementedError
+
+    async def claims(self, names, timeout=120):
+        """Test case results parsed from the claim.json files of the named reports"""
+        raise NotImplementedError
+
+    async def run(self, cmd, timeout=30, input=None, kind=None):
+        """Run a shell command on the test host and return its output ('Error: ...' on failure)"""
+        raise NotImplementedError
+
+    def lines(self, cmd):
+        """Async iterator over the output lines of a long-running shell command"""
+        raise NotImplementedError
+
+    async def stream(self, cmd, on_line):
+        """Run a shell command, passing each line of its output (stdout and stderr) to ``on_line``
+        as it arrives; returns its exit status, None if the connection ended before it did"""
+        status = None
+        lines = self.lines(f'{{ {cmd}\n}} 2>&1; echo "{STREAM_EXIT_MARKER}$?"')
+        try:
+            async for line in lines:
+                if line.startswith(STREAM_EXIT_MARKER):
+                    status = safe_int(line[len(STREAM_EXIT_MARKER):], None)
+                else:
+                    on_line(line)
+        finally:
+            # Stops the command when the job is cancelled (JOB_TIMEOUT)
+            await lines.aclose()
+        return status
+
+    async def write_script(self, path, content):
+        """Create an executable script on the test host"""
+        quoted = shlex.quote(path)
+        await self.run(f'cat > {quoted} && chmod +x {quoted}', input=content)
+
+    async def session_running(self):
+        output = await self.run('tmux has-session -t operator-test 2>/dev/null && echo "true" || echo "false"')
+        return output.strip() == 'true'
+
+    async def start_session(self, command):
+        await self.run(tmux_start_command(command))
+
+    async def stop_sessions(self):
+        """Kill the test session and the shard sessions of a parallel run"""
+        await self.run('tmux kill-session -t operator-test 2>/dev/null; '
+                       "tmux list-sessions -F '#{session_name}' 2>/dev/null | grep '^operator-test-shard-' | "
+                       'xargs -r -n1 tmux kill-session -t')
+
+
+class SSHBackend(Backend):
+    """Test host reached over SSH: every read is one remote_probe.py round trip"""
+
+    name = 'ssh'
+
+    async def status(self, live_since=-1, live_id='', live_lines=0):
+        return await run_remote_probe_async('status', '--report-dir', REPORT_DIR, '--session', 'operator-test',
+                                            '--live-file', LIVE_OUTPUT_FILE, '--live-since', live_since,
+                                            '--live-id', live_id, '--live-lines', live_lines)
+
+    async def reports(self, names=(), newest=False, timeout=30):
+        return await run_remote_probe_async('reports', '--report-dir', REPORT_DIR,
+                                            *(['--newest'] if newest else []), '--names', *names,
+                                            timeout=timeout)
+
+    async def tail(self, since=-1, file_id='', lines=LIVE_OUTPUT_LINES):
+        return await run_remote_probe_async('tail', '--file', LIVE_OUTPUT_FILE, '--session', 'operator-test',
+                                            '--since', since, '--id', file_id, '--lines', lines)
+
+    async def inventory(self):
+        return await run_remote_probe_async('inventory', '--chunk-size', INVENTORY_CHUNK_SIZE, timeout=60)
+
+    async def read_csv(self, report_name):
+        csv_path = shlex.quote(f"{REPORT_DIR}/{report_name}/results.csv")
+        # ssh's output is all there is to go on (a failed connection also prints nothing):
+        # a marker follows a complete read, and another one says the file does not exist
+        output = await ssh_command_async(
+            f'if [ -e {csv_path} ]; then cat {csv_path} && echo; echo {CSV_READ_MARKER}$?; '
+            f'else echo {CSV_MISSING_MARKER}; fi', timeout=120)
+        if output == f'{CSV_MISSING_MARKER}\n':
+            return ''
+        content, marker, status = output.rpartition(f'\n{CSV_READ_MARKER}')
+        if not marker or status != '0\n':
+            raise RuntimeError(output if output.startswith('Error:') else f'Could not read {csv_path}')
+        return content
+
+    async def claims(self, names, timeout=120):
+        return await run_remote_probe_async('claims', '--report-dir', REPORT_DIR, '--names', *names,
+                                            timeout=timeout)
+
+    async def run(self, cmd, timeout=30, input=None, kind=None):
+        return await ssh_command_async(cmd, timeout=timeout, input=input, kind=kind)
+
+    def lines(self, cmd):
+        return ssh_lines_async(cmd)
+
+
+class LocalBackend(Backend):
+    """Test host is the dashboard's own host (REPORT_DIR mounted or local).
+
+    The remote_probe.py collectors run in-process on the default executor:
+    reports are scanned with os.scandir and logs read directly, without an
+    ssh round trip or a subprocess. Only tmux, oc and the control commands
+    (run through a local shell in the home directory, as over SSH) start
+    processes.
+    """
+
+    name = 'local'
+
+    async def _collect(self, kind, func, *args):
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+        except Exception as e:
+            logger.warning(f"Local probe '{kind}' failed: {e}")
+            return None
+
+    async def status(self, live_since=-1, live_id='', live_lines=0):
+        return await self._collect('status', remote_probe.collect_status, REPORT_DIR, 'operator-test',
+                                   LIVE_OUTPUT_FILE, live_since, live_id, live_lines)
+
+    async def reports(self, names=(), newest=False, timeout=30):
+        return await self._collect('reports', remote_probe.collect_reports, REPORT_DIR, list(names), newest)
+
+    async def tail(self, since=-1, file_id='', lines=LIVE_OUTPUT_LINES):
+        return await self._collect('tail', remote_probe.tail_live_output, LIVE_OUTPUT_FILE, 'operator-test',
+                                   since, file_id, lines)
+
+    async def inventory(self):
+        return await self._collect('inventory', remote_probe.collect_inventory, INVENTORY_CHUNK_SIZE)
+
+    async def read_csv(self, report_name):
+        def read():
+            try:
+                with open(os.path.join(REPORT_DIR, report_name, 'results.csv'), 'rb') as f:
+                    return f.read().decode('utf-8', errors='replace')
+            except (FileNotFoundError, NotADirectoryError):
+                return ''
+        return await asyncio.get_running_loop().run_in_executor(None, read)
+
+    async def claims(self, names, timeout=120):
+        return await self._collect('claims', remote_probe.collect_claims, REPORT_DIR, list(names))
+
+    async def session_running(self):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, remote_probe.tmux_session_running, 'operator-test')
+
+    async def run(self, cmd, timeout=30, input=None, kind=None):
+        try:
+            returncode, stdout, stderr = await asyncio.wait_for(
+                run_subprocess(['bash', '-c', cmd], input=input, cwd=os.path.expanduser('~')), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Local command timed out after {timeout}s: {cmd[:100]}...")
+            return "Error: Command timed out"
+        except OSError as e:
+            logger.error(f"Local command failed: {e}")
+            return f"Error: {e}"
+        if returncode != 0 and stderr:
+            logger.warning(f"Local command failed (exit {returncode}): {stderr[:200]}")
+        return stdout
+
+    def lines(self, cmd):
+        return subprocess_lines(['bash', '-c', cmd], cwd=os.path.expanduser('~'))
+
+
+class DemoBackend(Backend):
+    """Generated data (see DEMO MODE DATA); starting and stopping drive the simulated run"""
+
+    name = 'demo'
+    supports_watcher = False
+
+    async def status(self, live_since=-1, live_id='', live_lines=0):
+        return get_demo_status_facts(live_lines)
+
+    async def reports(self, names=(), newest=False, timeout=30):
+        listed = get_demo_report_names()
+        wanted = [name for name in names if name in listed]
+        if newest and listed[0] not in wanted:
+            wanted.append(listed[0])
+        details = [get_demo_report(name) for name in wanted]
+        mtimes = {name: get_demo_report(name)['mtime'] for name in listed}
+        return {
+            'report_dir_mtime': demo_test_state['start_time'].timestamp(),
+            'reports': [{'name': name, 'mtime': mtimes[name]} for name in listed],
+            'details': details,
+        }
+
+    async def tail(self, since=-1, file_id='', lines=LIVE_OUTPUT_LINES):
+        return get_demo_status_facts(lines)['live']
+
+    async def inventory(self):
+        return get_demo_inventory()
+
+    async def read_csv(self, report_name):
+        return get_demo_csv(report_name)
+
+    async def claims(self, names, timeout=120):
+        return get_demo_claims(names)
+
+    async def run(self, cmd, timeout=30, input=None, kind=None):
+        logger.info(f"Demo mode: not running {cmd[:100]}")
+        return ''
+
+    async def write_script(self, path, content):
+        pass
+
+    async def stream(self, cmd, on_line):
+        on_line(f"Demo mode: not running {cmd[:100]}")
+        await asyncio.sleep(1)
+        return 0
+
+    async def session_running(self):
+        return get_demo_status_facts()['test_running']
+
+    async def start_session(self, command):
+        demo_test_state.update(running=True, start_time=datetime.now(), stop_time=None)
+        logger.info("Demo mode: Simulated test start")
+
+    async def stop_sessions(self):
+        demo_test_state.update(running=False, stop_time=datetime.now())
+        logger.info("Demo mode: Simulated test stop")
+
+
+BACKENDS = {backend.name: backend for backend in (SSHBackend, LocalBackend, DemoBackend)}
+if BACKEND not in BACKENDS:
+    raise SystemExit(f"BACKEND must be one of {', '.join(BACKENDS)}, not '{BACKEND}'")
+backend = BACKENDS[BACKEND]()
+
+# ============== CACHE ==============
+
+class TTLCache:
+    """Keyed cache with a TTL per entry and an LRU bound on the number of entries.
+
+    ``get_or_compute`` is single-flight per key: concurrent misses wait for
+    one computation instead of all going to the remote host.
+    """
+
+    def __init__(self, name, max_entries=64):
+        self.name = name
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get(self, key):
+        """(value, seconds of freshness left), or (None, 0) on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, 0
+            remaining = entry[0] - time.monotonic()
+            if remaining <= 0:
+                del self._entries[key]
+                return None, 0
+            self._entries.move_to_end(key)
+            return entry[1], remaining
+
+    def set(self, key, value, ttl):
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix=''):
+        """Drop every entry whose key starts with ``prefix`` (all entries by default)"""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def get_or_compute(self, key, compute):
+        """Return (value, hit, seconds of freshness left).
+
+        On a miss ``compute()`` returns ``(value, ttl)``; a ttl of 0 hands the
+        value out without caching it (e.g. partial results).
+        """
+        value, remaining = self.get(key)
+        if remaining > 0:
+            count_cache_lookup(self.name, True)
+            return value, True, remaining
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another request may have filled it while we waited
+            value, remaining = self.get(key)
+            count_cache_lookup(self.name, remaining > 0)
+            if remaining > 0:
+                return value, True, remaining
+            value, ttl = compute()
+            self.set(key, value, ttl)
+            return value, False, ttl
+
+# Cluster metadata; keys under "cluster:" are dropped when a test starts or the cluster is cleaned
+cluster_cache = TTLCache('cluster')
+
+def cached_response(payload, hit, remaining):
+    """JSON response telling the client whether it came from cache and how long it stays fresh"""
+    response = jsonify(payload)
+    response.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+    response.headers['Cache-Control'] = f'private, max-age={max(0, int(remaining))}'
+    return response
+
+def not_modified(etag):
+    """304 response if the client's copy (If-None-Match) is still current, else None"""
+    if request.if_none_match.contains(etag):
+        count_cache_lookup('etag', True)
+        return with_etag(Response(status=304), etag)
+    count_cache_lookup('etag', False)
+    return None
+
+def json_with_etag(payload, etag):
+    return with_etag(jsonify(payload), etag)
+
+def with_etag(response, etag):
+    response.set_etag(etag)
+    # Let browsers keep the body but revalidate it (If-None-Match) on every poll
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def payload_etag(payload):
+    """Strong ETag for a payload that is cheap to build locally"""
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+# ============== CLUSTER INVENTORY ==============
+
+@dataclass
+class NodeInfo:
+    name: str
+    ready: bool
+    roles: list
+    kubelet_version: str
+
+@dataclass
+class CatalogSourceInfo:
+    namespace: str
+    name: str
+    image: str
+    display_name: str
+    status: str
+
+@dataclass
+class OperatorInfo:
+    namespace: str
+    name: str
+    display_name: str
+    version: str
+    status: str
+
+@dataclass
+class SubscriptionInfo:
+    namespace: str
+    name: str
+    package: str
+    channel: str
+    source: str
+    installed_csv: str
+    state: str
+
+@dataclass
+class ClusterInventory:
+    """Cluster identity and resources, as collected by the remote probe's ``inventory``"""
+    user: str
+    api_url: str
+    version: str
+    nodes: list = field(default_factory=list)
+    catalog_sources: list = field(default_factory=list)
+    operators: list = field(default_factory=list)
+    subscriptions: list = field(default_factory=list)
+    # Resource kinds that could not be listed
+    errors: list = field(default_factory=list)
+
+    @classmethod
+    def from_probe(cls, facts):
+        versions = facts['cluster_versions']
+        return cls(
+            user=facts['user'],
+            api_url=facts['api_url'],
+            version=versions[0]['version'] if versions else '',
+            nodes=[NodeInfo(**node) for node in facts['nodes']],
+            catalog_sources=[CatalogSourceInfo(**source) for source in facts['catalog_sources']],
+            operators=[OperatorInfo(**operator) for operator in facts['operators']],
+            subscriptions=[SubscriptionInfo(**subscription) for subscription in facts['subscriptions']],
+            errors=facts['errors'],
+        )
+
+    def catalog_image(self, name, namespace='openshift-marketplace'):
+        for source in self.catalog_sources:
+            if source.name == name and source.namespace == namespace:
+                return source.image
+        return ''
+
+def fetch_cluster_inventory():
+    """Cluster inventory in one remote call, and how long to cache it"""
+    facts = remote_loop.run(backend.inventory())
+    if facts is None:
+        raise RuntimeError('Cluster inventory unavailable')
+    inventory = ClusterInventory.from_probe(facts)
+    # Partial inventories (a kind was not listable, not logged in) are served but not cached
+    return inventory, 0 if inventory.errors or not inventory.user else CLUSTER_INFO_TTL
+
+def get_cluster_inventory():
+    """Return (inventory, cache hit, seconds of freshness left)"""
+    return cluster_cache.get_or_compute('cluster:inventory', fetch_cluster_inventory)
+
 def discover_catalog_indexes():
     """Discover catalog index images from the cluster's catalogsources"""
     redhat_index = REDHAT_CATALOG_INDEX
@@ -278,10 +1488,25 @@ def discover_catalog_indexes():
         logger.info(f"Using catalog indexes from environment: redhat={redhat_index}, certified={certified_index}")
         return redhat_index, certified_index
     
-    # Try to discover from cluster
+    indexes, _, _ = cluster_cache.get_or_compute('cluster:catalog_indexes', lookup_catalog_indexes)
+    return indexes
+
+def lookup_catalog_indexes():
+    """Catalog index images from the cluster, and how long to cache them"""
+    redhat_index = REDHAT_CATALOG_INDEX
+    certified_index = CERTIFIED_CATALOG_INDEX
+    ttl = CATALOG_INDEX_TTL
+    
+    # Try to discover from the cluster inventory
     try:
+        inventory, _, _ = get_cluster_inventory()
+        discovered_images = {name: inventory.catalog_image(name) for name in ('redhat-operators', 'certified-operators')}
+        # Do not hold on to defaults picked because the cluster did not answer
+        if 'catalogsource' in inventory.errors:
+            ttl = 0
+        
         if not redhat_index:
-            discovered = ssh_command("oc get catalogsource redhat-operators -n openshift-marketplace -o jsonpath='{.spec.image}'").strip()
+            discovered = discovered_images.get('redhat-operators', '').strip()
             if discovered and 'registry.redhat.io' in discovered:
                 redhat_index = discovered
                 logger.info(f"Discovered Red Hat catalog index from cluster: {redhat_index}")
@@ -290,7 +1515,7 @@ def discover_catalog_indexes():
                 logger.info(f"Using default Red Hat catalog index: {redhat_index}")
         
         if not certified_index:
-            discovered = ssh_command("oc get catalogsource certified-operators -n openshift-marketplace -o jsonpath='{.spec.image}'").strip()
+            discovered = discovered_images.get('certified-operators', '').strip()
             if discovered and 'registry.redhat.io' in discovered:
                 certified_index = discovered
                 logger.info(f"Discovered Certified catalog index from cluster: {certified_index}")
@@ -301,22 +1526,16 @@ def discover_catalog_indexes():
         logger.warning(f"Failed to discover catalog indexes: {e}")
         redhat_index = redhat_index or DEFAULT_REDHAT_INDEX
         certified_index = certified_index or DEFAULT_CERTIFIED_INDEX
+        ttl = 0
     
-    return redhat_index, certified_index
+    return (redhat_index, certified_index), ttl
 
-@app.route('/')
-def index():
-    return render_template('dashboard.html')
+def build_status(facts):
+    """Build the /api/status payload from status probe facts"""
+    latest_report = facts.get('latest_report')
 
-@app.route('/api/status')
-def get_status():
-    """Get current test status"""
-    # Return demo data if in demo mode
-    if DEMO_MODE:
-        return jsonify(get_demo_status())
-    
     # Check if test is running (tmux session exists = test running)
-    is_running = ssh_command('tmux has-session -t operator-test 2>/dev/null && echo "true" || echo "false"').strip() == 'true'
+    is_running = facts.get('test_running', False)
     
     # Test progress tracking
     current_op = ''
@@ -328,11 +1547,11 @@ def get_status():
     start_time = ''
     
     if is_running:
-        # Get current operator from tmux output (handle wrapped lines)
-        current_op = ssh_command('tmux capture-pane -t operator-test -p -S -100 2>/dev/null | grep "package=" | tail -1 | sed "s/.*package= //" | awk \'{print $1}\'').strip()
+        # Current operator from the last "package=" line in the tmux output
+        current_op = facts.get('current_operator', '')
         
-        # Get current state from the last few lines of tmux output
-        recent_output = ssh_command('tmux capture-pane -t operator-test -p -S -20 2>/dev/null | tail -15').strip()
+        # Current state from the last few lines of tmux output
+        recent_output = facts.get('recent_output', '')
         
         # Detect current state from output
         if 'run CNF suite' in recent_output or 'Running' in recent_output:
@@ -354,10 +1573,9 @@ def get_status():
         else:
             current_state = 'Processing'
         
-        # Find the latest report directory in /var/www/html
-        latest_report_dir = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -1').strip()
-        if latest_report_dir:
-            report_name = os.path.basename(latest_report_dir)
+        # Latest report directory in /var/www/html
+        if latest_report:
+            report_name = latest_report['name']
             
             # Extract start time from report name (report_2026-02-03_11-43-57_EST)
             # Format: report_YYYY-MM-DD_HH-MM-SS_TZ
@@ -372,20 +1590,14 @@ def get_status():
             except:
                 start_time = ''
             
-            # Get total operators from operator-list.txt (filter empty lines)
-            total_raw = ssh_command(f'grep -c "." "{latest_report_dir}/operator-list.txt" 2>/dev/null || echo 0')
-            tests_total = safe_int(total_raw)
+            # Total operators from operator-list.txt (non-empty lines)
+            tests_total = latest_report['operators_total']
             
-            # Count completed tests by counting subdirectories (each operator gets a folder)
-            completed_raw = ssh_command(f'find "{latest_report_dir}" -maxdepth 1 -type d | wc -l')
-            # Subtract 1 for the parent directory itself
-            tests_completed = max(0, safe_int(completed_raw) - 1)
+            # Completed tests = operator subdirectories (each operator gets a folder)
+            tests_completed = len(latest_report['operator_dirs'])
             tests_remaining = max(0, tests_total - tests_completed)
         
-        if current_op:
-            logger.info(f"Test running - {current_op} [{current_state}] ({tests_completed}/{tests_total}) - {report_name}")
-    
-    return jsonify({
+    return {
         'test_running': is_running,
         'current_operator': current_op,
         'current_state': current_state,
@@ -393,151 +1605,1171 @@ def get_status():
         'tests_total': tests_total,
         'tests_remaining': tests_remaining,
         'report_name': report_name,
-        'start_time': start_time,
-        'timestamp': datetime.now().isoformat()
-    })
+        'start_time': start_time
+    }
 
-@app.route('/api/results/latest')
-def get_latest_results():
-    """Get latest test results"""
-    # Find the latest report directory in /var/www/html
-    latest_report_dir = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -1').strip()
+def build_latest_results(facts):
+    """Build the /api/results/latest payload from status probe facts"""
+    latest_report = facts.get('latest_report')
     
-    if not latest_report_dir:
-        logger.debug("No report directories found")
-        return jsonify({'error': 'No test reports found'})
+    if not latest_report:
+        return {'error': 'No test reports found'}
     
-    report_name = os.path.basename(latest_report_dir)
+    report_name = latest_report['name']
     
-    # Find the log file inside the report directory (output_*.log)
-    latest_log = ssh_command(f'ls -t "{latest_report_dir}"/output_*.log 2>/dev/null | head -1').strip()
+    # Log file inside the report directory (output_*.log)
+    latest_log = latest_report['log_file']
     
     if not latest_log:
-        return jsonify({'error': 'No log file found in report', 'report': report_name})
-    
-    # Count from the log file
-    total_raw = ssh_command(f'grep -c "^\\*\\*\\*\\*\\*\\*\\*\\*\\*" "{latest_log}" 2>/dev/null || echo 0')
-    success_raw = ssh_command(f'grep -c "operator .* installed" "{latest_log}" 2>/dev/null || echo 0')
-    failed_raw = ssh_command(f'grep -c "Operator failed to install" "{latest_log}" 2>/dev/null || echo 0')
+        return {'error': 'No log file found in report', 'report': report_name}
     
-    total = safe_int(total_raw)
-    success = safe_int(success_raw)
-    failed = safe_int(failed_raw)
+    # Counts from the log file
+    total = latest_report['log']['total']
+    success = latest_report['log']['installed']
+    failed = latest_report['log']['failed']
     success_rate = round((success / total * 100) if total > 0 else 0, 1)
     
-    # Log results periodically (only when there are results)
-    if total > 0:
-        logger.info(f"Results: {success}/{total} passed ({success_rate}%), {failed} failed - {report_name}")
-    
-    return jsonify({
+    return {
         'report_name': report_name,
         'log_file': latest_log,
         'total': total,
         'success': success,
         'failed': failed,
         'success_rate': success_rate
-    })
+    }
 
-@app.route('/api/cluster/info')
-def get_cluster_info():
-    """Get comprehensive cluster information"""
-    if DEMO_MODE:
-        return jsonify({
-            'version': '4.21.0',
-            'status': 'demo',
-            'user': 'demo-user',
-            'api_url': 'https://api.demo-cluster.example.com:6443',
-            'redhat_catalog': DEFAULT_REDHAT_INDEX,
-            'certified_catalog': DEFAULT_CERTIFIED_INDEX,
-            'nodes': {'total': 3, 'ready': 3, 'not_ready': 0},
-            'catalog_sources': [
-                {'name': 'redhat-operators', 'status': 'READY'},
-                {'name': 'certified-operators', 'status': 'READY'},
-                {'name': 'community-operators', 'status': 'READY'}
-            ],
-            'installed_operators': [
-                {'namespace': 'openshift-logging', 'name': 'cluster-logging.v5.8.0', 'status': 'Succeeded'},
-                {'namespace': 'openshift-operators-redhat', 'name': 'elasticsearch-operator.v5.8.0', 'status': 'Succeeded'}
-            ],
-            'subscriptions': [
-                {'name': 'cluster-logging', 'namespace': 'openshift-logging'},
-                {'name': 'elasticsearch-operator', 'namespace': 'openshift-operators-redhat'}
-            ]
-        })
+def build_completed_tests(facts):
+    """Build the /api/completed-tests payload from status probe facts"""
+    latest_report = facts.get('latest_report')
     
-    try:
-        # Get cluster version
-        version = ssh_command("oc get clusterversion -o jsonpath='{.items[0].status.desired.version}'").strip()
-        
-        # Get API URL
-        api_url = ssh_command("oc whoami --show-server").strip()
-        
-        # Get current user
-        whoami = ssh_command("oc whoami").strip()
-        status = 'connected' if whoami else 'disconnected'
-        
-        # Get catalog indexes
-        redhat_index, certified_index = discover_catalog_indexes()
-        
-        # Get node status
-        nodes_total = safe_int(ssh_command("oc get nodes --no-headers 2>/dev/null | wc -l"))
-        nodes_ready = safe_int(ssh_command("oc get nodes --no-headers 2>/dev/null | grep ' Ready' | wc -l"))
-        
-        # Get catalog sources
-        catalog_raw = ssh_command("oc get catalogsource -n openshift-marketplace --no-headers 2>/dev/null")
-        catalog_sources = []
-        if catalog_raw:
-            for line in catalog_raw.strip().split('\n'):
-                if line:
-                    parts = line.split()
-                    if len(parts) >= 1:
-                        name = parts[0]
-                        status = parts[-1] if len(parts) > 1 else 'Unknown'
-                        catalog_sources.append({'name': name, 'status': status})
-        
-        # Get installed operators (CSVs) with details
-        csv_raw = ssh_command("oc get csv -A --no-headers 2>/dev/null | grep Succeeded")
-        installed_operators = []
-        if csv_raw:
-            for line in csv_raw.strip().split('\n'):
-                if line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        installed_operators.append({
-                            'namespace': parts[0],
-                            'name': parts[1],
-                            'status': 'Succeeded'
-                        })
-        
-        # Get subscriptions
-        subs_raw = ssh_command("oc get subscriptions -A --no-headers 2>/dev/null")
-        subscriptions = []
-        if subs_raw:
-            for line in subs_raw.strip().split('\n')[:20]:  # Limit to 20
-                if line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        subscriptions.append({'namespace': parts[0], 'name': parts[1]})
-        
-        return jsonify({
-            'version': version or 'unknown',
-            'status': status,
-            'user': whoami,
-            'api_url': api_url,
-            'redhat_catalog': redhat_index,
-            'certified_catalog': certified_index,
-            'nodes': {
-                'total': nodes_total,
-                'ready': nodes_ready,
-                'not_ready': nodes_total - nodes_ready
-            },
-            'catalog_sources': catalog_sources,
-            'installed_operators': installed_operators,
-            'subscriptions': subscriptions
+    if not latest_report:
+        return {'error': 'No reports found', 'tests': []}
+    
+    report_name = latest_report['name']
+    
+    # Completed operator folders
+    completed_operators = latest_report['operator_dirs']
+    
+    # Pass/fail status from log file
+    status_map = {}
+    if latest_report['log']:
+        for op in latest_report['log']['installed_operators']:
+            status_map[op] = 'passed'
+        for op in latest_report['log']['failed_operators']:
+            status_map[op] = 'failed'
+    
+    # Build test list with status
+    tests = []
+    for op in completed_operators:
+        tests.append({
+            'name': op,
+            'status': status_map.get(op, 'completed')
+        })
+    
+    # Sort: failed first, then by name
+    tests.sort(key=lambda x: (0 if x['status'] == 'failed' else 1, x['name']))
+    
+    return {
+        'report': report_name,
+        'tests': tests,
+        'total': len(tests),
+        'passed': sum(1 for t in tests if t['status'] == 'passed'),
+        'failed': sum(1 for t in tests if t['status'] == 'failed')
+    }
+
+# ============== BACKGROUND COLLECTOR ==============
+
+class SnapshotCollector:
+    """Keeps a shared, versioned snapshot of the test run in memory.
+
+    A single background thread refreshes the snapshot every ``interval``
+    seconds, so remote load stays constant no matter how many browsers are
+    polling. Concurrent refresh requests are coalesced: callers that arrive
+    while a refresh is in flight wait for it instead of starting another.
+    The thread pauses after ``idle_timeout`` seconds without readers.
+
+    ``tick`` may be raised above ``interval`` when something else says when
+    the remote state changed (see ReportWatcherClient): ``wake`` then
+    triggers the refresh, still never sooner than ``interval`` after the
+    previous one.
+    """
+
+    def __init__(self, collect, interval=5, idle_timeout=120, on_change=None):
+        self._collect = collect
+        self._on_change = on_change
+        self.interval = interval
+        self.tick = interval
+        self.idle_timeout = idle_timeout
+        self._woken = False
+        self._cond = threading.Condition()
+        self._snapshot = None
+        self._version = 0
+        self._generation = 0
+        self._refreshing = False
+        self._last_read = 0.0
+        self._last_attempt = 0.0
+        self._thread = None
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='snapshot-collector', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # Sleep until the next tick, or until a reader shows up again
+                while time.monotonic() - self._last_read > self.idle_timeout:
+                    self._cond.wait()
+            self.refresh()
+            with self._cond:
+                earliest = time.monotonic() + self.interval
+                deadline = time.monotonic() + self.tick
+                while True:
+                    now = time.monotonic()
+                    if now >= deadline or (self._woken and now >= earliest):
+                        break
+                    self._cond.wait((earliest if self._woken else deadline) - now)
+                self._woken = False
+
+    def wake(self):
+        """Refresh as soon as ``interval`` allows: the remote state has changed"""
+        with self._cond:
+            self._woken = True
+            self._cond.notify_all()
+
+    def refresh(self):
+        """Refresh the snapshot now, joining an in-flight refresh if there is one"""
+        with self._cond:
+            if self._refreshing:
+                generation = self._generation
+                while self._generation == generation:
+                    self._cond.wait()
+                return self._snapshot
+            self._refreshing = True
+        data = None
+        changed = False
+        try:
+            data = self._collect()
+        except Exception as e:
+            logger.error(f"Snapshot refresh failed: {e}")
+        with self._cond:
+            self._refreshing = False
+            self._generation += 1
+            self._last_attempt = time.monotonic()
+            # Keep the previous snapshot when the remote host could not be reached
+            if data is not None:
+                previous = self._snapshot['data'] if self._snapshot else None
+                changed = data != previous
+                if changed:
+                    self._version += 1
+                self._snapshot = {
+                    'version': self._version,
+                    'updated_at': datetime.now().isoformat(),
+                    'data': data,
+                }
+            self._cond.notify_all()
+            snapshot = self._snapshot
+        if changed and self._on_change:
+            self._on_change(data)
+        return snapshot
+
+    def snapshot(self):
+        """Return the current snapshot, refreshing first if it is missing or stale"""
+        with self._cond:
+            self._last_read = time.monotonic()
+            self._cond.notify_all()
+            self._ensure_thread()
+            snapshot = self._snapshot
+        # Only block on the remote host when the collector has fallen behind,
+        # e.g. the first read or the first read after an idle pause
+        if snapshot is None or time.monotonic() - self._last_attempt > self.tick * 3:
+            snapshot = self.refresh() or snapshot
+        return snapshot
+
+    def wait_for_change(self, version, timeout):
+        """Block until the snapshot version differs from ``version`` or ``timeout`` expires"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._ensure_thread()
+            while True:
+                # A blocked waiter is a reader too: keep the collector awake
+                self._last_read = time.monotonic()
+                self._cond.notify_all()
+                remaining = deadline - time.monotonic()
+                if self._version != version or remaining <= 0:
+                    return self._snapshot
+                self._cond.wait(remaining)
+
+
+class LiveOutputTail:
+    """Last lines of the test session output, advanced by byte offset.
+
+    Each refresh only transfers what was appended to LIVE_OUTPUT_FILE since
+    the previous one. Only touched from the collector thread.
+    """
+
+    def __init__(self, max_lines=LIVE_OUTPUT_LINES):
+        self.max_lines = max_lines
+        self.file_id = ''
+        self.offset = -1
+        self.lines = []
+
+    def update(self, live):
+        # No session: keep showing the output of the last run
+        if live is None:
+            return
+        if live['reset']:
+            self.lines = []
+        if live['data']:
+            self.lines = (self.lines + live['data'].split('\n'))[-self.max_lines:]
+        self.file_id = live['id']
+        self.offset = live['next']
+
+    def cursor(self):
+        return {'id': self.file_id, 'offset': self.offset}
+
+    def text(self):
+        return '\n'.join(self.lines)
+
+live_output_tail = LiveOutputTail()
+
+def collect_run_state():
+    """Gather everything the read endpoints serve, in a single status probe"""
+    if REPORT_WATCHER and backend.supports_watcher:
+        report_watcher.ensure_started()
+    facts = remote_loop.run(backend.status(live_output_tail.offset, live_output_tail.file_id,
+                                           live_output_tail.max_lines))
+    if facts is None:
+        return None
+    live_output_tail.update(facts.get('live'))
+    if facts.get('latest_report'):
+        report_index.update_latest(facts['latest_report'], sealed=not facts.get('test_running', False))
+    status = build_status(facts)
+    status.update(build_run_timing(facts, report_index.timing_stats()))
+    return {
+        'status': status,
+        'latest_results': build_latest_results(facts),
+        'completed_tests': build_completed_tests(facts),
+        'live_output': live_output_tail.text(),
+        'live_cursor': live_output_tail.cursor(),
+        'report_dir_mtime': facts.get('report_dir_mtime'),
+        'latest_report': facts.get('latest_report'),
+    }
+
+def log_run_state(data):
+    """Log progress lines when the run state changes"""
+    status = data['status']
+    if status['test_running'] and status['current_operator']:
+        logger.info(f"Test running - {status['current_operator']} [{status['current_state']}] "
+                    f"({status['tests_completed']}/{status['tests_total']}) - {status['report_name']}")
+    results = data['latest_results']
+    if results.get('total', 0) > 0:
+        logger.info(f"Results: {results['success']}/{results['total']} passed ({results['success_rate']}%), "
+                    f"{results['failed']} failed - {results['report_name']}")
+
+run_state = SnapshotCollector(collect_run_state, interval=COLLECTOR_INTERVAL,
+                              idle_timeout=COLLECTOR_IDLE_TIMEOUT, on_change=log_run_state)
+
+# ============== REPORT WATCHER ==============
+
+with open(os.path.join(SCRIPT_DIR, 'report-watcher-agent.py')) as agent_file:
+    REPORT_WATCHER_AGENT_SOURCE = agent_file.read()
+
+class ReportWatcherClient:
+    """Subscription to report-watcher-agent.py on the test host.
+
+    Copies the agent (and the remote_probe.py it imports) to REMOTE_AGENT_DIR
+    and starts it, which is a no-op when it already runs, then follows its
+    event log over one long-lived backend command (an SSH command, or a local
+    process with BACKEND=local) on the remote loop. While
+    subscribed, every event wakes the collector, which otherwise refreshes
+    only every WATCHER_FALLBACK_INTERVAL seconds; when the subscription drops,
+    polling every COLLECTOR_INTERVAL resumes until it is back.
+    """
+
+    def __init__(self, collector, recent_events=200):
+        self.collector = collector
+        self.connected = False
+        self.last_seq = 0
+        self.error = ''
+        self._events = deque(maxlen=recent_events)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def ensure_started(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        remote_loop.submit(self._run())
+
+    def status(self, since=0):
+        with self._lock:
+            events = [event for event in self._events if event.get('seq', 0) > since]
+        return {'enabled': REPORT_WATCHER and backend.supports_watcher, 'connected': self.connected, 'last_seq': self.last_seq,
+                'error': self.error, 'events': events}
+
+    async def _install(self):
+        """Copy the agent to the test host and start it; False if that failed"""
+        agent_dir = shlex.quote(REMOTE_AGENT_DIR)
+        for name, source in (('remote_probe.py', REMOTE_PROBE_SOURCE),
+                             ('report-watcher-agent.py', REPORT_WATCHER_AGENT_SOURCE)):
+            output = await backend.run(f'mkdir -p {agent_dir} && cat > {agent_dir}/{name} && echo ok',
+                                       input=source, kind='watcher_install')
+            if output.strip() != 'ok':
+                self.error = f'could not install the agent: {output.strip()[:200]}'
+                return False
+        # Detached so it outlives this command; a second agent exits right away
+        output = await backend.run(
+            f'nohup {REMOTE_PYTHON} {agent_dir}/report-watcher-agent.py watch '
+            f'--report-dir {shlex.quote(REPORT_DIR)} --live-file {shlex.quote(LIVE_OUTPUT_FILE)} '
+            f'>/dev/null 2>&1 </dev/null & echo ok', kind='watcher_install')
+        if output.strip() != 'ok':
+            self.error = f'could not start the agent: {output.strip()[:200]}'
+            return False
+        return True
+
+    async def _run(self):
+        backoff = 1
+        while True:
+            try:
+                if await self._install():
+                    agent = shlex.quote(f'{REMOTE_AGENT_DIR}/report-watcher-agent.py')
+                    lines = backend.lines(f'exec {REMOTE_PYTHON} {agent} follow --since {self.last_seq}')
+                    try:
+                        async for line in lines:
+                            self._handle(line)
+                            backoff = 1
+                    finally:
+                        await lines.aclose()
+                    self.error = 'subscription ended'
+            except Exception as e:
+                self.error = str(e)
+            self._set_connected(False)
+            logger.warning(f"Report watcher: {self.error}, retrying in {backoff}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+    def _handle(self, line):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+        self._set_connected(True)
+        if event.get('type') == 'heartbeat':
+            return
+        with self._lock:
+            if event.get('type') == 'resync':
+                # The agent's log was trimmed or started over: continue from its numbering
+                self.last_seq = event.get('seq', 0)
+            else:
+                self._events.append(event)
+                self.last_seq = max(self.last_seq, event.get('seq', 0))
+        self.collector.wake()
+
+    def _set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        report_watcher_connected.set(int(connected))
+        self.collector.tick = WATCHER_FALLBACK_INTERVAL if connected else self.collector.interval
+        if connected:
+            self.error = ''
+        # Also ends the collector's longer wait when falling back to polling
+        self.collector.wake()
+        logger.info(f"Report watcher {'connected' if connected else 'disconnected'}")
+
+report_watcher = ReportWatcherClient(run_state)
+
+# ============== REPORT INDEX ==============
+
+class ReportIndex:
+    """Local SQLite index of per-report facts.
+
+    A report directory stops changing once its run is over, so its facts are
+    stored once the report is sealed and never fetched again; only the report
+    still being written is rescanned. The index is a cache of the remote
+    REPORT_DIR: it is rebuilt from scratch whenever the schema changes.
+    """
+
+    SCHEMA_VERSION = 6
+    SCHEMA = '''
+        CREATE TABLE reports (
+            name TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            sealed INTEGER NOT NULL,
+            tested INTEGER NOT NULL,
+            installed INTEGER NOT NULL,
+            failed INTEGER NOT NULL,
+            facts TEXT NOT NULL,
+            kind TEXT NOT NULL,      -- 'report' or 'debug' (DEBUG_RUN) run
+            started TEXT NOT NULL    -- run start from the folder name, ISO 8601
+        );
+        CREATE INDEX reports_by_mtime ON reports (mtime DESC, name DESC);
+        -- Durations of finished operators in sealed reports; phase '' is the whole operator
+        CREATE TABLE operator_timings (
+            report TEXT NOT NULL,
+            operator TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            seconds REAL NOT NULL
+        );
+        CREATE INDEX operator_timings_by_report ON operator_timings (report);
+        -- Outcome of every operator a report tested: 'pass', 'fail' or 'other'
+        CREATE TABLE operator_results (
+            report TEXT NOT NULL,
+            operator TEXT NOT NULL,
+            status TEXT NOT NULL,
+            PRIMARY KEY (report, operator)
+        );
+        -- Sealed reports whose claim.json files were ingested, and the operators whose claim was unreadable
+        CREATE TABLE test_reports (
+            report TEXT PRIMARY KEY,
+            operators INTEGER NOT NULL,
+            errors TEXT NOT NULL
+        );
+        -- certsuite test case names, stored once and referred to by id
+        CREATE TABLE test_cases (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            suite TEXT NOT NULL
+        );
+        -- One row per report, operator and test case: 'passed', 'failed', 'skipped', ...
+        CREATE TABLE test_results (
+            report TEXT NOT NULL,
+            operator TEXT NOT NULL,
+            test_case INTEGER NOT NULL,
+            result TEXT NOT NULL,
+            duration REAL,
+            PRIMARY KEY (report, operator, test_case)
+        ) WITHOUT ROWID;
+        CREATE INDEX test_results_by_case ON test_results (test_case);
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._latest = None
+        self._timing_stats = None
+        # Test case stats per (report window, ingested count, operators, suite); claims never change once ingested
+        self._test_case_stats = {}
+        with self._db() as db:
+            if db.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                for (table,) in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                    db.execute(f'DROP TABLE {table}')
+                db.executescript(self.SCHEMA)
+                db.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+    @contextmanager
+    def _db(self):
+        """Serialized connection, committed and closed on exit"""
+        with self._lock:
+            db = sqlite3.connect(self.path, timeout=10)
+            try:
+                yield db
+                db.commit()
+            finally:
+                db.close()
+
+    def get_meta(self, key):
+        with self._db() as db:
+            row = db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._db() as db:
+            db.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
+
+    def unsealed_names(self):
+        with self._db() as db:
+            return [row[0] for row in db.execute('SELECT name FROM reports WHERE sealed = 0')]
+
+    def names(self):
+        with self._db() as db:
+            return set(row[0] for row in db.execute('SELECT name FROM reports'))
+
+    def store(self, reports, sealed_names):
+        """Insert or refresh reports collected by the remote probe"""
+        rows = []
+        for report in reports:
+            log = report['log'] or {}
+            rows.append((
+                report['name'], report['mtime'] or 0, int(report['name'] in sealed_names),
+                len(report['operator_dirs']), log.get('installed', 0), log.get('failed', 0),
+                json.dumps(report), report_kind(report['name']),
+                report_started(report['name'], report['mtime'] or 0),
+            ))
+        results = [(report['name'], operator, status)
+                   for report in reports for operator, status in report_operator_results(report).items()]
+        timings = []
+        for report in reports:
+            if report['name'] not in sealed_names:
+                continue
+            for timing in report.get('timings') or []:
+                if timing['seconds'] is None:
+                    continue
+                timings.append((report['name'], timing['name'], '', timing['seconds']))
+                timings.extend((report['name'], timing['name'], phase, seconds)
+                               for phase, seconds in timing['phases'].items())
+        with self._db() as db:
+            db.executemany('INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            db.executemany('DELETE FROM operator_results WHERE report = ?', [(report['name'],) for report in reports])
+            db.executemany('INSERT INTO operator_results VALUES (?, ?, ?)', results)
+            db.executemany('DELETE FROM operator_timings WHERE report = ?',
+                           [(report['name'],) for report in reports if report['name'] in sealed_names])
+            db.executemany('INSERT INTO operator_timings VALUES (?, ?, ?, ?)', timings)
+        if timings:
+            self._timing_stats = None
+
+    def get(self, name):
+        """Stored probe facts of a report and whether it is sealed, or (None, False)"""
+        with self._db() as db:
+            row = db.execute('SELECT facts, sealed FROM reports WHERE name = ?', (name,)).fetchone()
+        return (json.loads(row[0]), bool(row[1])) if row else (None, False)
+
+    def remove(self, names):
+        with self._db() as db:
+            db.executemany('DELETE FROM reports WHERE name = ?', [(name,) for name in names])
+            db.executemany('DELETE FROM operator_timings WHERE report = ?', [(name,) for name in names])
+            db.executemany('DELETE FROM operator_results WHERE report = ?', [(name,) for name in names])
+            db.executemany('DELETE FROM test_reports WHERE report = ?', [(name,) for name in names])
+            db.executemany('DELETE FROM test_results WHERE report = ?', [(name,) for name in names])
+        self._timing_stats = None
+        self._test_case_stats = {}
+
+    def timing_stats(self):
+        """Duration percentiles per operator and phase over all sealed reports (see summarize_timings)"""
+        stats = self._timing_stats
+        if stats is None:
+            with self._db() as db:
+                rows = db.execute('SELECT t.operator, t.phase, t.seconds FROM operator_timings t '
+                                  'JOIN reports r ON r.name = t.report ORDER BY r.mtime').fetchall()
+            stats = self._timing_stats = summarize_timings(rows)
+        return stats
+
+    def update_latest(self, report, sealed):
+        """Record the newest report from a status probe; only writes when its facts changed"""
+        log = report['log'] or {}
+        key = (report['name'], sealed, len(report['operator_dirs']), log.get('installed'), log.get('failed'))
+        if key == self._latest:
+            return
+        self.store([report], {report['name']} if sealed else set())
+        self._latest = key
+
+    def page(self, limit, after=None, kind='report', since=None, until=None, min_failed=0,
+             operator=None, failed_operator=None):
+        """One page of reports, newest first, and the key to pass as ``after`` for the next one.
+
+        ``after`` is the (mtime, name) key of the previous page's last report:
+        the query seeks to it in the mtime index, so a page deep in the history
+        costs the same as the first. The next key is None on the last page.
+        """
+        where = []
+        params = []
+        if kind:
+            where.append('r.kind = ?')
+            params.append(kind)
+        if since:
+            where.append('r.started >= ?')
+            params.append(since)
+        if until:
+            where.append('r.started < ?')
+            params.append(until)
+        if min_failed:
+            where.append('r.failed >= ?')
+            params.append(min_failed)
+        if operator:
+            where.append('EXISTS (SELECT 1 FROM operator_results o WHERE o.report = r.name AND o.operator = ?)')
+            params.append(operator)
+        if failed_operator:
+            where.append("EXISTS (SELECT 1 FROM operator_results o WHERE o.report = r.name "
+                         "AND o.operator = ? AND o.status = 'fail')")
+            params.append(failed_operator)
+        if after:
+            where.append('(r.mtime, r.name) < (?, ?)')
+            params.extend(after)
+        query = 'SELECT r.name, r.kind, r.started, r.mtime, r.tested, r.installed, r.failed FROM reports r'
+        if where:
+            query += ' WHERE ' + ' AND '.join(where)
+        query += ' ORDER BY r.mtime DESC, r.name DESC LIMIT ?'
+        with self._db() as db:
+            rows = db.execute(query, params + [limit + 1]).fetchall()
+        next_key = (rows[limit - 1][3], rows[limit - 1][0]) if len(rows) > limit else None
+        return [{'name': name, 'kind': kind, 'started': started, 'total': tested,
+                 'installed': installed, 'failed': failed}
+                for name, kind, started, _, tested, installed, failed in rows[:limit]], next_key
+
+    def operator_results(self, limit, operators=None):
+        """The newest ``limit`` report runs and their {report: {operator: status}} outcomes"""
+        with self._db() as db:
+            newest = "SELECT name FROM reports WHERE kind = 'report' ORDER BY mtime DESC, name DESC LIMIT ?"
+            names = [row[0] for row in db.execute(newest, (limit,))]
+            rows = db.execute(f'SELECT o.report, o.operator, o.status FROM operator_results o '
+                              f'JOIN ({newest}) r ON r.name = o.report', (limit,)).fetchall()
+        results = {name: {} for name in names}
+        for report, operator, status in rows:
+            if operators is None or operator in operators:
+                results[report][operator] = status
+        return names, results
+
+    def sealed_names(self, limit, since=None, until=None):
+        """The newest ``limit`` sealed report runs started in [since, until), newest first"""
+        where = ["kind = 'report'", 'sealed = 1']
+        params = []
+        if since:
+            where.append('started >= ?')
+            params.append(since)
+        if until:
+            where.append('started < ?')
+            params.append(until)
+        with self._db() as db:
+            return [row[0] for row in db.execute(
+                f"SELECT name FROM reports WHERE {' AND '.join(where)} ORDER BY mtime DESC, name DESC LIMIT ?",
+                params + [limit])]
+
+    # The newest sealed report runs: the window test case queries cover
+    RECENT_SEALED = ("SELECT name, mtime FROM reports WHERE kind = 'report' AND sealed = 1 "
+                     "ORDER BY mtime DESC, name DESC LIMIT ?")
+
+    def unclaimed_names(self, limit):
+        """Reports among the newest ``limit`` sealed runs whose claims were not ingested yet"""
+        with self._db() as db:
+            return [row[0] for row in db.execute(
+                f'SELECT r.name FROM ({self.RECENT_SEALED}) r '
+                f'WHERE NOT EXISTS (SELECT 1 FROM test_reports t WHERE t.report = r.name) '
+                f'ORDER BY r.mtime DESC, r.name DESC', (limit,))]
+
+    def store_claims(self, reports):
+        """Ingest the test case results of reports collected by the claims probe"""
+        cases = {}
+        for report in reports:
+            for rows in report['operators'].values():
+                for test_id, suite, _, _ in rows:
+                    cases.setdefault(test_id, suite)
+        with self._db() as db:
+            db.executemany('INSERT OR IGNORE INTO test_cases (name, suite) VALUES (?, ?)', cases.items())
+            ids = dict(db.execute('SELECT name, id FROM test_cases'))
+            for report in reports:
+                db.execute('DELETE FROM test_results WHERE report = ?', (report['name'],))
+                # A test case listed twice (older claims) keeps its last result
+                db.executemany('INSERT OR REPLACE INTO test_results VALUES (?, ?, ?, ?, ?)',
+                               [(report['name'], operator, ids[test_id], state, duration)
+                                for operator, rows in report['operators'].items()
+                                for test_id, _, state, duration in rows])
+                db.execute('INSERT OR REPLACE INTO test_reports VALUES (?, ?, ?)',
+                           (report['name'], len(report['operators']), json.dumps(report['errors'])))
+        self._test_case_stats = {}
+
+    def _test_results_filter(self, operators, suite):
+        where = []
+        params = []
+        if operators:
+            where.append(f"t.operator IN ({', '.join('?' * len(operators))})")
+            params.extend(sorted(operators))
+        if suite:
+            where.append('c.suite = ?')
+            params.append(suite)
+        return ''.join(f' AND {clause}' for clause in where), params
+
+    def test_case_stats(self, limit, operators=None, suite=None):
+        """Newest ``limit`` sealed runs, how many of them are ingested, and per-test-case result counts"""
+        where, params = self._test_results_filter(operators, suite)
+        with self._db() as db:
+            names = [row[0] for row in db.execute(self.RECENT_SEALED, (limit,))]
+            ingested = db.execute(f'SELECT COUNT(*) FROM ({self.RECENT_SEALED}) r '
+                                  f'JOIN test_reports t ON t.report = r.name', (limit,)).fetchone()[0]
+            key = (tuple(names), ingested, frozenset(operators or ()), suite)
+            if key in self._test_case_stats:
+                return names, ingested, list(self._test_case_stats[key])
+            rows = db.execute(
+                f"SELECT c.name, c.suite, COUNT(*), SUM(t.result = 'passed'), SUM(t.result = 'failed'), "
+                f"SUM(t.result = 'skipped'), COUNT(DISTINCT CASE WHEN t.result = 'failed' THEN t.operator END), "
+                f"COUNT(DISTINCT CASE WHEN t.result = 'failed' THEN t.report END), AVG(t.duration), MAX(t.duration) "
+                f"FROM ({self.RECENT_SEALED}) r JOIN test_results t ON t.report = r.name "
+                f"JOIN test_cases c ON c.id = t.test_case WHERE 1{where} GROUP BY t.test_case",
+                [limit] + params).fetchall()
+        stats = []
+        for name, suite, runs, passed, failed, skipped, failed_operators, failed_reports, avg, longest in rows:
+            stats.append({
+                'name': name, 'suite': suite, 'runs': runs, 'passed': passed, 'failed': failed,
+                'skipped': skipped, 'other': runs - passed - failed - skipped,
+                # Share of the runs that decided pass or fail
+                'fail_rate': round(failed / (passed + failed), 3) if passed + failed else 0.0,
+                'failed_operators': failed_operators, 'failed_reports': failed_reports,
+                'avg_seconds': round(avg, 3) if avg is not None else None, 'max_seconds': longest,
+            })
+        if len(self._test_case_stats) >= 64:
+            self._test_case_stats = {}
+        self._test_case_stats[key] = stats
+        return names, ingested, list(stats)
+
+    def test_case_results(self, test, limit, operators=None):
+        """Suite and results of one test case over the newest ``limit`` sealed runs, newest first"""
+        where, params = self._test_results_filter(operators, None)
+        with self._db() as db:
+            case = db.execute('SELECT id, suite FROM test_cases WHERE name = ?', (test,)).fetchone()
+            if case is None:
+                return None, []
+            rows = db.execute(
+                f'SELECT t.report, t.operator, t.result, t.duration FROM ({self.RECENT_SEALED}) r '
+                f'JOIN test_results t ON t.report = r.name WHERE t.test_case = ?{where} '
+                f'ORDER BY r.mtime DESC, r.name DESC, t.operator', [limit, case[0]] + params).fetchall()
+        return case[1], [{'report': report, 'operator': operator, 'result': result, 'duration': duration}
+                         for report, operator, result, duration in rows]
+
+
+def report_kind(name):
+    """'report' or 'debug', from the run folder's prefix"""
+    return name.split('_', 1)[0]
+
+def report_started(name, mtime):
+    """Start of a run as an ISO 8601 string, from its folder name (report_2026-02-03_11-43-57_EST)"""
+    try:
+        return datetime.strptime(name.split('_', 1)[1][:19], '%Y-%m-%d_%H-%M-%S').isoformat()
+    except (IndexError, ValueError):
+        return datetime.fromtimestamp(mtime).isoformat(timespec='seconds')
+
+def encode_cursor(key):
+    """Opaque pagination cursor of a ReportIndex.page key"""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """ReportIndex.page key of a cursor; raises ValueError if it is malformed"""
+    try:
+        mtime, name = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (TypeError, ValueError, binascii.Error):
+        raise ValueError(f'invalid cursor: {cursor}')
+    if not isinstance(mtime, (int, float)) or not isinstance(name, str):
+        raise ValueError(f'invalid cursor: {cursor}')
+    return mtime, name
+
+def parse_date_bound(value, end=False):
+    """ISO 8601 bound for the ``started`` column ('' if unset); a date-only ``end`` covers the whole day"""
+    if not value:
+        return ''
+    try:
+        bound = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'invalid date: {value} (expected YYYY-MM-DD or YYYY-MM-DDTHH:MM[:SS])')
+    if end:
+        bound += timedelta(days=1) if len(value) == 10 else timedelta(seconds=1)
+    return bound.isoformat()
+
+def report_operator_results(report):
+    """Outcome per tested operator of a report, classified like /api/report-summary"""
+    log = report['log'] or {}
+    results = {operator: 'other' for operator in report['operator_dirs']}
+    results.update((operator, 'pass') for operator in log.get('installed_operators', []))
+    results.update((operator, 'fail') for operator in log.get('failed_operators', []))
+    return results
+
+def build_operator_history(report_names, results):
+    """Operator x report matrix of /api/operators/history.
+
+    ``report_names`` is newest first and every operator's ``results`` list
+    follows that order (None: not tested in that report). Flakiness is the
+    share of consecutive pass/fail runs that flipped; ``failing_since`` is the
+    first report of the failure streak the operator is currently in.
+    """
+    operators = sorted(set(operator for outcomes in results.values() for operator in outcomes))
+    history = []
+    for operator in operators:
+        cells = [results[name].get(operator) for name in report_names]
+        # Oldest first, only the runs that decided pass or fail
+        decided = [(name, status) for name, status in reversed(list(zip(report_names, cells)))
+                   if status in ('pass', 'fail')]
+        flips = sum(1 for (_, a), (_, b) in zip(decided, decided[1:]) if a != b)
+        failing_since = None
+        for name, status in reversed(decided):
+            if status != 'fail':
+                break
+            failing_since = name
+        history.append({
+            'name': operator,
+            'results': cells,
+            'runs': sum(1 for status in cells if status is not None),
+            'passed': cells.count('pass'),
+            'failed': cells.count('fail'),
+            'other': cells.count('other'),
+            'flips': flips,
+            'flakiness': round(flips / (len(decided) - 1), 2) if len(decided) > 1 else 0.0,
+            'flaky': flips >= FLAKY_MIN_FLIPS,
+            'failing_since': failing_since,
+            'last_passed': next((name for name, status in reversed(decided) if status == 'pass'), None),
         })
+    return {'reports': report_names, 'operators': history}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+def duration_stats(values):
+    """p50/p90 of durations in seconds; ``last`` is the most recent one"""
+    return {'p50': percentile(values, 50), 'p90': percentile(values, 90),
+            'samples': len(values), 'last': values[-1]}
+
+def summarize_timings(rows):
+    """Per-operator and per-phase duration stats from (operator, phase, seconds) rows, oldest first"""
+    by_operator = {}
+    by_phase = {}
+    totals = []
+    for operator, phase, seconds in rows:
+        by_operator.setdefault(operator, {}).setdefault(phase, []).append(seconds)
+        if phase:
+            by_phase.setdefault(phase, []).append(seconds)
+        else:
+            totals.append(seconds)
+    operators = {}
+    for operator, phases in by_operator.items():
+        entry = {'phases': {phase: duration_stats(values) for phase, values in phases.items() if phase}}
+        if '' in phases:
+            total = entry['total'] = duration_stats(phases[''])
+            # Latest run took much longer than this operator usually does
+            entry['regressed'] = total['samples'] >= 3 and total['last'] > 1.5 * total['p50']
+        operators[operator] = entry
+    return {
+        'operators': operators,
+        'phases': {phase: duration_stats(values) for phase, values in by_phase.items()},
+        'total': duration_stats(totals) if totals else None,
+    }
+
+def build_run_timing(facts, stats):
+    """ETA fields of /api/status: remaining operators priced at their historical p50.
+
+    Shards of a parallel run work through their own lists side by side, so the
+    run finishes with the shard that has the most work left. Shard 0 tests the
+    exclusive operators alone, before the others start.
+    """
+    timing = {'eta_seconds': None, 'estimated_finish': None, 'current_phase': '', 'current_operator_timing': None}
+    report = facts.get('latest_report')
+    if not facts.get('test_running') or not report:
+        return timing
+    timings = report.get('timings') or []
+    running = [entry for entry in timings if entry['seconds'] is None]
+    if running:
+        current = max(running, key=lambda entry: entry['started'])
+        timing['current_phase'] = current['phase']
+        timing['current_operator_timing'] = stats['operators'].get(current['name'])
+    if stats['total'] is None:
+        return timing
+    
+    def expected(name):
+        # Operators never timed before count as a typical operator
+        history = stats['operators'].get(name, {}).get('total') or stats['total']
+        return history['p50']
+    
+    now = facts.get('now', time.time())
+    started = {entry['name'] for entry in timings} | set(report['operator_dirs'])
+    lanes = report.get('shards') or [{'id': '', 'operators': report.get('operator_list', [])}]
+    remaining = 0
+    exclusive = 0
+    for lane in lanes:
+        lane_remaining = sum(expected(name) for name in lane['operators'] if name not in started)
+        for entry in running:
+            if entry.get('shard', '') == lane['id']:
+                lane_remaining += max(expected(entry['name']) - (now - entry['started']), 0)
+        if lane['id'] == '0':
+            exclusive = lane_remaining
+        else:
+            remaining = max(remaining, lane_remaining)
+    remaining += exclusive
+    timing['eta_seconds'] = int(remaining)
+    timing['estimated_finish'] = (datetime.now() + timedelta(seconds=remaining)).isoformat()
+    return timing
+
+report_index = ReportIndex(REPORT_INDEX_PATH)
+report_sync_lock = threading.Lock()
+
+# Reports collected per remote probe call while backfilling the index
+REPORT_SYNC_BATCH = 100
+
+# Largest page /api/reports serves
+MAX_REPORTS_PAGE = 200
+
+# Operator history: most reports one request can span, and pass/fail flips that make an operator flaky
+MAX_HISTORY_REPORTS = 200
+FLAKY_MIN_FLIPS = 2
+
+claims_sync_lock = threading.Lock()
+
+# Reports whose claim.json files one probe call parses while ingesting test case results
+CLAIMS_SYNC_BATCH = 5
+
+# Test case queries: most sealed reports one request can span, and how each ranks test cases
+MAX_TESTCASE_REPORTS = 100
+TESTCASE_SORTS = {
+    'failed': lambda case: (case['failed'], case['fail_rate']),
+    'fail_rate': lambda case: (case['fail_rate'], case['failed']),
+    'skipped': lambda case: (case['skipped'], case['runs']),
+    'duration': lambda case: (case['avg_seconds'] or 0, case['max_seconds'] or 0),
+}
+
+def sealed_report_names(names, snapshot):
+    """Every listed report (newest first) is finished, except the newest run of each
+    kind while a test is running: that may be the one it is writing to"""
+    sealed = set(names)
+    if snapshot is not None and snapshot['data']['status'].get('test_running', False):
+        newest = {}
+        for name in names:
+            newest.setdefault(report_kind(name), name)
+        sealed -= set(newest.values())
+    return sealed
+
+def report_etag(report):
+    """ETag of everything derived from a report: its operator folders and log file state"""
+    if report is None:
+        return 'no-report'
+    return (f"{report['name']}-{len(report['operator_dirs'])}-"
+            f"{report.get('log_size', 0)}-{report.get('log_mtime', 0)}")
+
+def get_report_facts(report_name):
+    """Probe facts of one report.
+
+    Sealed reports come from the index and the newest one from the collector
+    snapshot, without a remote call; anything else is rescanned remotely.
+    """
+    report, sealed = report_index.get(report_name)
+    if sealed:
+        count_cache_lookup('report_index', True)
+        return report
+    snapshot = run_state.snapshot()
+    latest = snapshot['data']['latest_report'] if snapshot else None
+    if latest and latest['name'] == report_name:
+        count_cache_lookup('report_index', True)
+        return latest
+    count_cache_lookup('report_index', False)
+    result = remote_loop.run(backend.reports([report_name]))
+    if result is None or not result['details']:
+        return None
+    names = [report['name'] for report in result['reports']]
+    report_index.store(result['details'], sealed_report_names(names, run_state.snapshot()))
+    return result['details'][0]
+
+def sync_report_index():
+    """Bring the report index in line with REPORT_DIR.
+
+    Every status probe reports REPORT_DIR's mtime, which only moves when a
+    report directory is created or removed; until it does this is a local
+    no-op. Otherwise one probe lists the reports and rescans the unsealed
+    and newest ones; reports never seen before are backfilled in batches.
+    """
+    snapshot = run_state.snapshot()
+    if snapshot is None:
+        # Remote host unreachable: serve what is indexed
+        return
+    report_dir_mtime = str(snapshot['data']['report_dir_mtime'])
+    if report_index.get_meta('report_dir_mtime') == report_dir_mtime:
+        return
+    with report_sync_lock:
+        if report_index.get_meta('report_dir_mtime') == report_dir_mtime:
+            return
+        listing = remote_loop.run(backend.reports(report_index.unsealed_names(), newest=True))
+        if listing is None:
+            return
+        names = [report['name'] for report in listing['reports']]
+        sealed = sealed_report_names(names, snapshot)
+        report_index.store(listing['details'], sealed)
+        removed = report_index.names() - set(names)
+        report_index.remove(removed)
+        results_cache.remove(removed)
+        
+        known = report_index.names()
+        missing = [name for name in names if name not in known]
+        fan = FanOut()
+        for i in range(0, len(missing), REPORT_SYNC_BATCH):
+            fan.submit(i, backend.reports, missing[i:i + REPORT_SYNC_BATCH], timeout=120)
+        batches, errors = fan.results(timeout=150)
+        for batch in batches.values():
+            if batch is not None:
+                report_index.store(batch['details'], sealed)
+        if missing:
+            logger.info(f"Report index: backfilled {len(missing)} report(s)")
+        # Anything not backfilled is retried on the next request
+        if not errors and None not in batches.values():
+            report_index.set_meta('report_dir_mtime', report_dir_mtime)
+
+def sync_test_results(limit):
+    """Ingest the claim.json files of the newest ``limit`` sealed reports not ingested yet.
+
+    A sealed report's claims never change, so each one is parsed once, on
+    the test host, and only its (operator, test case, result, duration) rows
+    cross the wire; queries then run against the local index.
+    """
+    sync_report_index()
+    if not report_index.unclaimed_names(limit):
+        return
+    with claims_sync_lock:
+        names = report_index.unclaimed_names(limit)
+        fan = FanOut()
+        for i in range(0, len(names), CLAIMS_SYNC_BATCH):
+            fan.submit(i, backend.claims, names[i:i + CLAIMS_SYNC_BATCH], timeout=300)
+        # Batches that failed or timed out are retried on the next request
+        batches, _ = fan.results(timeout=330)
+        for batch in batches.values():
+            if batch is not None:
+                report_index.store_claims(batch['reports'])
+        if names:
+            logger.info(f"Report index: ingested claims of {len(names)} report(s)")
+
+# ============== END REPORT INDEX ==============
+
+@app.route('/')
+def index():
+    return render_template('dashboard.html')
+
+@app.route('/api/status')
+def get_status():
+    """Get current test status"""
+    snapshot = run_state.snapshot()
+    if snapshot is None:
+        return jsonify({'test_running': False, 'error': 'Remote host unreachable',
+                        'timestamp': datetime.now().isoformat()})
+    return jsonify(dict(snapshot['data']['status'], timestamp=snapshot['updated_at']))
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus metrics: route and remote call latency, cache efficiency, run progress"""
+    # Run-level gauges come from the same snapshot as /api/status
+    snapshot = run_state.snapshot()
+    if snapshot is not None:
+        status = snapshot['data']['status']
+        latest_results = snapshot['data']['latest_results']
+        test_running_gauge.set(1 if status['test_running'] else 0)
+        tests_completed_gauge.set(status['tests_completed'])
+        tests_total_gauge.set(status['tests_total'])
+        tests_failed_gauge.set(latest_results.get('failed', 0))
+        age = datetime.now() - datetime.fromisoformat(snapshot['updated_at'])
+        snapshot_age_gauge.set(round(age.total_seconds(), 3))
+    return Response(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/results/latest')
+def get_latest_results():
+    """Get latest test results"""
+    snapshot = run_state.snapshot()
+    if snapshot is None:
+        return jsonify({'error': 'Remote host unreachable'})
+    etag = 'latest-' + report_etag(snapshot['data']['latest_report'])
+    return not_modified(etag) or json_with_etag(snapshot['data']['latest_results'], etag)
+
+# ============== EVENT STREAM ==============
+
+# Seconds between SSE keepalive comments; keeps proxies (e.g. the OpenShift
+# router, 30s idle timeout by default) from closing quiet streams
+STREAM_KEEPALIVE = 15
+
+def format_sse(event, data):
+    """Serialize one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def output_delta(previous, current):
+    """Describe how the live output changed: lines to append, or a full replacement"""
+    previous_lines = previous.split('\n') if previous else []
+    current_lines = current.split('\n') if current else []
+    # Longest tail of the previous output that the current output starts with
+    for overlap in range(min(len(previous_lines), len(current_lines)), 0, -1):
+        if previous_lines[-overlap:] == current_lines[:overlap]:
+            return {'append': '\n'.join(current_lines[overlap:])}
+    return {'replace': current}
+
+def snapshot_events(previous, current, timestamp):
+    """Typed events for whatever changed between two snapshots' data"""
+    events = []
+    if previous is None or current['status'] != previous['status']:
+        events.append(('status', dict(current['status'], timestamp=timestamp)))
+
+    report = current['completed_tests'].get('report')
+    known = {}
+    if previous and previous['completed_tests'].get('report') == report:
+        known = {t['name']: t['status'] for t in previous['completed_tests'].get('tests', [])}
+    for test in current['completed_tests'].get('tests', []):
+        if known.get(test['name']) != test['status']:
+            events.append(('operator_completed', {'report': report, 'name': test['name'], 'status': test['status']}))
+
+    if previous is None or current['latest_results'] != previous['latest_results']:
+        events.append(('results', current['latest_results']))
+
+    previous_output = previous['live_output'] if previous else ''
+    if previous is None or current['live_output'] != previous_output:
+        events.append(('output_delta', output_delta(previous_output, current['live_output'])))
+    return events
+
+@app.route('/api/stream')
+def stream_events():
+    """Push run progress to the browser as Server-Sent Events"""
+    def generate():
+        yield f"retry: {int(COLLECTOR_INTERVAL * 1000)}\n\n"
+        previous = None
+        version = None
+        snapshot = run_state.snapshot()
+        while True:
+            if snapshot is not None and snapshot['version'] != version:
+                for event, data in snapshot_events(previous, snapshot['data'], snapshot['updated_at']):
+                    yield format_sse(event, data)
+                previous = snapshot['data']
+                version = snapshot['version']
+            else:
+                yield ': keepalive\n\n'
+            snapshot = run_state.wait_for_change(version, STREAM_KEEPALIVE)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+# List sections of /api/cluster/info that ?limit=&offset= page through
+CLUSTER_INFO_LISTS = ('catalog_sources', 'installed_operators', 'subscriptions')
+
+def build_cluster_info(inventory):
+    """The /api/cluster/info payload for an inventory"""
+    redhat_index, certified_index = discover_catalog_indexes()
+    nodes_ready = sum(1 for node in inventory.nodes if node.ready)
+    return {
+        'version': inventory.version or 'unknown',
+        'status': 'connected' if inventory.user else 'disconnected',
+        'user': inventory.user,
+        'api_url': inventory.api_url,
+        'redhat_catalog': redhat_index,
+        'certified_catalog': certified_index,
+        'nodes': {
+            'total': len(inventory.nodes),
+            'ready': nodes_ready,
+            'not_ready': len(inventory.nodes) - nodes_ready,
+            'items': [asdict(node) for node in inventory.nodes]
+        },
+        'catalog_sources': [asdict(source) for source in inventory.catalog_sources],
+        'installed_operators': [asdict(operator) for operator in inventory.operators
+                                if operator.status == 'Succeeded'],
+        'subscriptions': [asdict(subscription) for subscription in inventory.subscriptions],
+        'incomplete': inventory.errors
+    }
+
+@app.route('/api/cluster/info')
+def get_cluster_info():
+    """Get comprehensive cluster information"""
+    try:
+        inventory, hit, remaining = get_cluster_inventory()
+        info = build_cluster_info(inventory)
     except Exception as e:
         logger.error(f"Cluster info error: {e}")
         return jsonify({'error': str(e), 'status': 'error'}), 500
+    
+    # Optional paging through the long lists (?limit=N&offset=M); totals tell the client how far to go
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        info['totals'] = {name: len(info[name]) for name in CLUSTER_INFO_LISTS}
+        for name in CLUSTER_INFO_LISTS:
+            info[name] = info[name][offset:offset + max(limit, 0)]
+    
+    # Optional projection (?fields=version,nodes): only the requested top-level fields
+    fields = [name for name in request.args.get('fields', '').split(',') if name]
+    if fields:
+        info = {name: info[name] for name in fields if name in info}
+    
+    return cached_response(info, hit, remaining)
 
 @app.route('/api/test/config')
 def get_test_config():
@@ -575,11 +2807,7 @@ def get_test_config():
         ]
     
     # Auto-discover catalog indexes from cluster (or use env vars/defaults)
-    if DEMO_MODE:
-        redhat_index = DEFAULT_REDHAT_INDEX
-        certified_index = DEFAULT_CERTIFIED_INDEX
-    else:
-        redhat_index, certified_index = discover_catalog_indexes()
+    redhat_index, certified_index = discover_catalog_indexes()
     
     return jsonify({
         'catalogs': [
@@ -596,34 +2824,259 @@ def get_test_config():
         ]
     })
 
+# ============== JOBS ==============
+
+# Output lines a job keeps (the oldest are dropped first), and finished jobs kept for /api/jobs
+JOB_OUTPUT_LINES = 5000
+JOBS_KEPT = 50
+
+class Job:
+    """A control operation running in the background: its current step, output and outcome.
+
+    Fields change on the remote loop and are read by request threads, always
+    under the manager's condition; every change bumps ``version`` and wakes
+    the streams following the job.
+    """
+
+    def __init__(self, kind, key, description, cond):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.key = key
+        self.description = description
+        self.status = 'queued'  # queued, running, succeeded or failed
+        self.step = ''
+        self.output = deque(maxlen=JOB_OUTPUT_LINES)
+        self.output_end = 0  # lines ever written; the deque holds the newest ones
+        self.error = None
+        self.result = None
+        self.created = datetime.now().isoformat()
+        self.started = None
+        self.finished = None
+        self.version = 0
+        self._cond = cond
+
+    @property
+    def done(self):
+        return self.status in ('succeeded', 'failed')
+
+    def update(self, **fields):
+        with self._cond:
+            for name, value in fields.items():
+                setattr(self, name, value)
+            self.version += 1
+            self._cond.notify_all()
+
+    def set_step(self, step):
+        logger.info(f"Job {self.id} ({self.kind}): {step}")
+        self.update(step=step)
+
+    def log(self, line):
+        with self._cond:
+            self.output.append(line)
+            self.output_end += 1
+            self.version += 1
+            self._cond.notify_all()
+
+    def to_dict(self, since=None):
+        """State of the job, with the output lines after line number ``since`` (none if None)"""
+        with self._cond:
+            job = {
+                'id': self.id, 'kind': self.kind, 'description': self.description, 'status': self.status,
+                'step': self.step, 'error': self.error, 'result': self.result, 'created': self.created,
+                'started': self.started, 'finished': self.finished, 'output_lines': self.output_end,
+            }
+            if since is not None:
+                first = self.output_end - len(self.output)
+                # Lines already dropped from the buffer are skipped
+                job['output'] = list(itertools.islice(self.output, max(since - first, 0), None))
+                job['output_offset'] = max(since, first)
+            return job
+
+
+class JobManager:
+    """Runs control operations (cleanup, test start) on the remote loop, one at a time.
+
+    ``submit`` returns at once: request threads never wait on the cluster.
+    A job identical to one still queued or running (same key) is not started
+    again; the existing job is returned instead. Jobs run in submission order
+    so two cluster-changing operations never overlap, and each is cancelled
+    after JOB_TIMEOUT seconds, which also stops its remote command.
+    """
+
+    def __init__(self, timeout=JOB_TIMEOUT, keep=JOBS_KEPT):
+        self.timeout = timeout
+        self.keep = keep
+        self._cond = threading.Condition()
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._turn = None
+
+    def submit(self, kind, key, description, func, *args):
+        """Queue coroutine function ``func(job, *args)``; returns (job, whether it is a new one)"""
+        with self._cond:
+            job = self._active.get(key)
+            if job is not None:
+                return job, False
+            job = Job(kind, key, description, self._cond)
+            self._jobs[job.id] = job
+            self._active[key] = job
+            finished = [old.id for old in self._jobs.values() if old.done]
+            for job_id in finished[:max(len(self._jobs) - self.keep, 0)]:
+                del self._jobs[job_id]
+        jobs_active.inc()
+        logger.info(f"Job {job.id} ({kind}) queued: {description}")
+        remote_loop.submit(self._run(job, func, *args))
+        return job, True
+
+    async def _run(self, job, func, *args):
+        if self._turn is None:
+            self._turn = asyncio.Lock()
+        outcome = 'failed'
+        try:
+            async with self._turn:
+                job.update(status='running', started=datetime.now().isoformat())
+                try:
+                    result = await asyncio.wait_for(func(job, *args), self.timeout)
+                    job.update(status='succeeded', result=result, finished=datetime.now().isoformat())
+                    outcome = 'succeeded'
+                except asyncio.TimeoutError:
+                    job.update(status='failed', error=f'Timed out after {self.timeout}s',
+                               finished=datetime.now().isoformat())
+                except Exception as e:
+                    job.update(status='failed', error=str(e), finished=datetime.now().isoformat())
+        finally:
+            with self._cond:
+                if self._active.get(job.key) is job:
+                    del self._active[job.key]
+            jobs_active.dec()
+            jobs_finished.inc(kind=job.kind, outcome=outcome)
+            logger.info(f"Job {job.id} ({job.kind}) {job.status}" + (f": {job.error}" if job.error else ''))
+
+    def get(self, job_id):
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """Known jobs, newest first"""
+        with self._cond:
+            return list(reversed(self._jobs.values()))
+
+    def wait_for_change(self, job, version, timeout):
+        """Block until the job's version differs from ``version`` or ``timeout`` expires"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while job.version == version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+
+job_manager = JobManager()
+
+async def cleanup_job(job):
+    """Run the cleanup script, streaming its output into the job"""
+    job.set_step('Running cleanup-all-test-operators-v2.sh')
+    status = await backend.stream('bash /tmp/cleanup-all-test-operators-v2.sh', job.log)
+    cluster_cache.invalidate('cluster:')
+    if status is None:
+        raise RuntimeError('Connection to the test host ended before the cleanup finished')
+    if status != 0:
+        raise RuntimeError(f'Cleanup script exited with status {status}')
+    return {'status': 'Cleanup complete'}
+
+async def start_test_job(job, script, command):
+    """Disable the default catalogs, then start the test session (writing ``script`` first if given)"""
+    job.set_step('Checking for a running test')
+    if await backend.session_running():
+        raise RuntimeError('Test already running')
+    
+    disable_catalog_script = os.environ.get('DISABLE_CATALOG_SCRIPT', '/root/test-rose/kcli-platform/disable-catalog.sh')
+    job.set_step(f'Disabling default catalogs ({disable_catalog_script})')
+    status = await backend.stream(f'bash {disable_catalog_script}', job.log)
+    if status != 0:
+        # As before jobs, the test still starts: the catalogs may already be disabled
+        job.log(f'disable-catalog exited with status {status}; starting the test anyway')
+    
+    if script:
+        job.set_step('Writing the test script')
+        # Temporary test script, written as-is so the quotes are preserved
+        await backend.write_script(f'{REMOTE_BASE_DIR}/run-custom-test.sh', script)
+    job.set_step('Starting the test session')
+    await backend.start_session(command)
+    # Catalogs were disabled and operators are about to come and go
+    cluster_cache.invalidate('cluster:')
+    return {'status': 'Test started', 'timestamp': datetime.now().isoformat()}
+
+def job_accepted(job, created):
+    """202 answer of a route that queued (or joined) a job"""
+    return jsonify({'job': job.to_dict(), 'deduplicated': not created, 'url': f'/api/jobs/{job.id}'}), 202
+
+@app.route('/api/jobs')
+def list_jobs():
+    """Recent control jobs, newest first"""
+    return jsonify({'jobs': [job.to_dict() for job in job_manager.jobs()]})
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """State and output of a job; ``since`` is the ``output_offset`` + len(output) of the previous poll"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict(since=request.args.get('since', 0, type=int)))
+
+@app.route('/api/jobs/<job_id>/stream')
+def stream_job(job_id):
+    """Follow a job as Server-Sent Events: 'output' lines and 'job' state changes, until it is done"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    def generate():
+        since = 0
+        version = None
+        state = None
+        while True:
+            current = job.to_dict(since=since)
+            lines = current.pop('output')
+            since = current.pop('output_offset') + len(lines)
+            if lines:
+                yield format_sse('output', {'lines': lines})
+            # Output is sent as 'output' events; 'job' only when the status or step changes
+            changed = {key: value for key, value in current.items() if key != 'output_lines'}
+            if changed != state:
+                yield format_sse('job', current)
+                state = changed
+            if current['status'] in ('succeeded', 'failed'):
+                return
+            if version == job.version:
+                yield ': keepalive\n\n'
+            version = job.version
+            job_manager.wait_for_change(job, version, STREAM_KEEPALIVE)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
 @app.route('/api/test/start', methods=['POST'])
 def start_test():
-    """Start test execution with optional custom configuration"""
+    """Queue a test start with optional custom configuration; answers with the job at once"""
     logger.info(">>> TEST START requested")
     
-    if DEMO_MODE:
-        # Reset demo test state to simulate a new test starting
-        demo_test_state['running'] = True
-        demo_test_state['start_time'] = datetime.now()
-        demo_test_state['current_index'] = 0
-        logger.info("Demo mode: Simulated test start")
-        return jsonify({'status': 'Test started (demo mode)', 'message': 'Demo test simulation started'})
-    
-    # Check if test is already running (tmux session exists)
-    is_running = ssh_command('tmux has-session -t operator-test 2>/dev/null && echo "true" || echo "false"').strip() == 'true'
-    if is_running:
-        logger.warning("Test start rejected - test already running")
-        return jsonify({'error': 'Test already running'}), 400
-    
-    # Run pre-test setup: disable default catalogs
-    disable_catalog_script = os.environ.get('DISABLE_CATALOG_SCRIPT', '/root/test-rose/kcli-platform/disable-catalog.sh')
-    logger.info(f"Running pre-test setup: {disable_catalog_script}")
-    disable_result = ssh_command(f'bash {disable_catalog_script} 2>&1')
-    logger.info(f"Disable catalog result: {disable_result[:200] if disable_result else 'OK'}")
-    
     # Get custom configuration if provided
     data = request.get_json() or {}
     
+    # Operators tested in parallel; more than one runs the sharded runner
+    try:
+        workers = int(data.get('workers') or 1)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'workers must be a number'}), 400
+    if not 1 <= workers <= MAX_TEST_WORKERS:
+        return jsonify({'error': f'workers must be between 1 and {MAX_TEST_WORKERS}'}), 400
+    runner = (f'SHARD_COUNT={workers} ./script/run-sharded-batch-operators-test.sh' if workers > 1
+              else './script/run-basic-batch-operators-test.sh')
+    
     if 'catalogs' in data and data['catalogs']:
         # Build custom test script
         commands = ['#!/bin/bash', 'set -e']  # Add shebang and exit on error
@@ -631,164 +3084,179 @@ def start_test():
             if catalog.get('operators'):
                 operators_str = ' '.join(catalog['operators'])
                 index = catalog.get('index', 'registry.redhat.io/redhat/redhat-operator-index:v4.20')
-                # Quotes are preserved by heredoc
-                commands.append(f'time ./script/run-basic-batch-operators-test.sh {index} "{operators_str}"')
-        
-        if len(commands) > 2:  # More than just shebang and set -e
-            # Create a temporary test script using heredoc to preserve quotes
-            script_lines = '\n'.join(commands)
-            create_script_cmd = f'''cat > {REMOTE_BASE_DIR}/run-custom-test.sh << 'EOFSCRIPT'
-{script_lines}
-EOFSCRIPT
-chmod +x {REMOTE_BASE_DIR}/run-custom-test.sh'''
-            ssh_command(create_script_cmd)
-            ssh_command(f'tmux new-session -d -s operator-test "export KUBECONFIG={KUBECONFIG_PATH} && cd {REMOTE_BASE_DIR} && ./run-custom-test.sh"')
-            logger.info(f"Custom test started with {len(commands) - 2} catalog(s)")
-        else:
+                commands.append(f'time {runner} {index} "{operators_str}"')
+        if len(commands) <= 2:  # Just shebang and set -e
             return jsonify({'error': 'No operators specified'}), 400
+        script = '\n'.join(commands) + '\n'
+        command = f'export KUBECONFIG={KUBECONFIG_PATH} && cd {REMOTE_BASE_DIR} && ./run-custom-test.sh'
+        description = f'Custom test with {len(commands) - 2} catalog(s), {workers} worker(s)'
     else:
         # Use default test script
-        ssh_command(f'tmux new-session -d -s operator-test "export KUBECONFIG={KUBECONFIG_PATH} && cd {REMOTE_BASE_DIR} && ./run-ocp-4.20-test-v2.sh"')
-        logger.info("Default test started")
-    
-    return jsonify({'status': 'Test started', 'timestamp': datetime.now().isoformat()})
+        script = None
+        command = (f'export KUBECONFIG={KUBECONFIG_PATH} SHARD_COUNT={workers} && cd {REMOTE_BASE_DIR} '
+                   f'&& ./run-ocp-4.20-test-v2.sh')
+        description = f'Default test with {workers} worker(s)'
+    
+    # The same start submitted twice (double click, second browser) joins the first job
+    key = ('test-start', script, command)
+    return job_accepted(*job_manager.submit('test-start', key, description, start_test_job, script, command))
 
 @app.route('/api/test/stop', methods=['POST'])
 def stop_test():
     """Stop test execution"""
     logger.info(">>> TEST STOP requested")
     
-    if DEMO_MODE:
-        demo_test_state['running'] = False
-        logger.info("Demo mode: Simulated test stop")
-        return jsonify({'status': 'Test stopped (demo mode)'})
-    
-    # Kill the tmux session to stop the test
-    ssh_command('tmux kill-session -t operator-test 2>/dev/null')
+    # Kill the tmux session to stop the test, and the shard sessions of a parallel run
+    remote_loop.run(backend.stop_sessions())
     logger.info("Test stopped (killed tmux session)")
     return jsonify({'status': 'Test stopped'})
 
 @app.route('/api/cleanup', methods=['POST'])
 def cleanup_cluster():
-    """Clean cluster"""
+    """Queue a cluster cleanup; answers with the job at once"""
     logger.info(">>> CLEANUP requested")
-    
-    if DEMO_MODE:
-        logger.info("Demo mode: Simulated cleanup")
-        return jsonify({'status': 'Cleanup completed (demo mode)'})
-    logger.info("Starting cluster cleanup...")
-    output = ssh_command('bash /tmp/cleanup-all-test-operators-v2.sh')
-    logger.info("Cleanup completed")
-    return jsonify({'status': 'Cleanup complete', 'output': output})
+    return job_accepted(*job_manager.submit('cleanup', ('cleanup',), 'Cluster cleanup', cleanup_job))
 
 @app.route('/api/live-output')
 def get_live_output():
-    """Get live test output - capture full scrollback buffer"""
-    if DEMO_MODE:
-        return jsonify({'output': get_demo_live_output()})
-    
-    # Use -S - to capture entire scrollback history, then get last 200 lines
-    output = ssh_command('tmux capture-pane -t operator-test -p -S - 2>/dev/null | tail -200').strip()
-    return jsonify({'output': output})
+    """Get live test output.
+
+    Without parameters: the last 200 lines. With ``since=<offset>&id=<id>``
+    (the ``offset``/``id`` of the previous response): only the lines appended
+    since, or the last 200 lines again with ``reset`` set if the run changed.
+    """
+    snapshot = run_state.snapshot()
+    cursor = snapshot['data']['live_cursor'] if snapshot else {'id': '', 'offset': -1}
+    since = request.args.get('since', type=int)
+    file_id = request.args.get('id', '')
+    if since is None or since < 0:
+        return jsonify({'output': snapshot['data']['live_output'] if snapshot else '',
+                        'offset': cursor['offset'], 'id': cursor['id'], 'reset': True})
+    
+    # Caught up with the collector: nothing new without going to the remote host
+    if file_id == cursor['id'] and since == cursor['offset']:
+        return jsonify({'output': '', 'offset': since, 'id': file_id, 'reset': False})
+    
+    live = remote_loop.run(backend.tail(since, file_id))
+    if live is None:
+        return jsonify({'output': '', 'offset': since, 'id': file_id, 'reset': False})
+    return jsonify({'output': live['data'], 'offset': live['next'], 'id': live['id'],
+                    'reset': live['reset']})
+
+@app.route('/api/timing')
+def get_timing():
+    """Historical duration percentiles per operator and per phase"""
+    sync_report_index()
+    stats = report_index.timing_stats()
+    etag = payload_etag(stats)
+    return not_modified(etag) or json_with_etag(stats, etag)
+
+@app.route('/api/watcher')
+def get_watcher_status():
+    """Report watcher subscription state and its recent events (after ?since=SEQ)"""
+    since = request.args.get('since', 0, type=int)
+    return jsonify(report_watcher.status(since))
 
 @app.route('/api/completed-tests')
 def get_completed_tests():
     """Get list of completed tests with status"""
-    # Get latest report directory
-    latest_report_dir = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -1').strip()
-    
-    if not latest_report_dir:
-        return jsonify({'error': 'No reports found', 'tests': []})
-    
-    report_name = os.path.basename(latest_report_dir)
-    
-    # Get list of completed operator folders
-    folders_raw = ssh_command(f'ls -d "{latest_report_dir}"/*/ 2>/dev/null | xargs -I {{}} basename {{}}')
-    completed_operators = [f.strip() for f in folders_raw.strip().split('\n') if f.strip()]
-    
-    # Get pass/fail status from log file
-    log_file = ssh_command(f'ls -t "{latest_report_dir}"/output_*.log 2>/dev/null | head -1').strip()
-    
-    status_map = {}
-    if log_file:
-        # Get installed operators (success)
-        installed_raw = ssh_command(f'grep "operator .* installed" "{log_file}" 2>/dev/null | sed "s/operator \\(.*\\) installed/\\1/"')
-        for op in installed_raw.strip().split('\n'):
-            op = op.strip()
-            if op:
-                status_map[op] = 'passed'
-        
-        # Get failed operators
-        failed_raw = ssh_command(f'grep "Operator failed to install" "{log_file}" 2>/dev/null')
-        # Parse context to find which operator failed
-        failed_context = ssh_command(f'grep -B5 "Operator failed to install" "{log_file}" 2>/dev/null | grep "package=" | sed "s/.*package= \\([^ ]*\\).*/\\1/"')
-        for op in failed_context.strip().split('\n'):
-            op = op.strip()
-            if op:
-                status_map[op] = 'failed'
-    
-    # Build test list with status
-    tests = []
-    for op in completed_operators:
-        tests.append({
-            'name': op,
-            'status': status_map.get(op, 'completed')
-        })
-    
-    # Sort: failed first, then by name
-    tests.sort(key=lambda x: (0 if x['status'] == 'failed' else 1, x['name']))
-    
-    return jsonify({
-        'report': report_name,
-        'tests': tests,
-        'total': len(tests),
-        'passed': sum(1 for t in tests if t['status'] == 'passed'),
-        'failed': sum(1 for t in tests if t['status'] == 'failed')
-    })
+    snapshot = run_state.snapshot()
+    if snapshot is None:
+        return jsonify({'error': 'Remote host unreachable', 'tests': []})
+    etag = 'completed-' + report_etag(snapshot['data']['latest_report'])
+    return not_modified(etag) or json_with_etag(snapshot['data']['completed_tests'], etag)
 
 @app.route('/api/reports')
 def list_reports():
-    """List available report directories with summary stats"""
+    """List report directories with summary stats, one page at a time.
+
+    Query parameters (all optional):
+      limit            page size (default 10, max MAX_REPORTS_PAGE)
+      cursor           ``next_cursor`` of the previous page
+      kind             'report' (default), 'debug' or 'all'
+      since, until     run start date range, YYYY-MM-DD or YYYY-MM-DDTHH:MM[:SS]; a date-only
+                       ``until`` includes that day
+      min_failed       only runs with at least this many failed operators
+      operator         only runs that tested this operator
+      failed_operator  only runs in which this operator failed
+    """
     # Default to 10 reports, can be overridden with ?limit=N parameter
     limit = request.args.get('limit', 10, type=int)
-    limit = min(max(limit, 1), 50)  # Clamp between 1 and 50
+    limit = min(max(limit, 1), MAX_REPORTS_PAGE)
     
-    if DEMO_MODE:
-        return jsonify({'reports': get_demo_reports(limit)})
-    
-    reports_raw = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -{limit}')
-    report_names = [os.path.basename(r) for r in reports_raw.strip().split('\n') if r]
-    
-    # Build report list with summary stats
-    reports = []
-    for report_name in report_names:
-        report_dir = f"{REPORT_DIR}/{report_name}"
-        
-        # Get total tested operators by counting subdirectories (matches View modal)
-        # This counts operators that actually ran, not just planned
-        total_raw = ssh_command(f'find "{report_dir}" -maxdepth 1 -type d | wc -l')
-        total = max(0, safe_int(total_raw) - 1)  # Subtract 1 for parent dir
-        
-        # Get installed count from log
-        log_file = ssh_command(f'ls -t "{report_dir}"/output_*.log 2>/dev/null | head -1').strip()
-        installed = 0
-        failed = 0
-        
-        if log_file:
-            installed_raw = ssh_command(f'grep -c "operator .* installed" "{log_file}" 2>/dev/null || echo 0')
-            installed = safe_int(installed_raw)
-            
-            failed_raw = ssh_command(f'grep -c "Operator failed to install" "{log_file}" 2>/dev/null || echo 0')
-            failed = safe_int(failed_raw)
-        
-        reports.append({
-            'name': report_name,
-            'total': total,
-            'installed': installed,
-            'failed': failed
-        })
-    
-    return jsonify({'reports': reports})
+    kind = request.args.get('kind', 'report')
+    if kind not in ('report', 'debug', 'all'):
+        return jsonify({'error': "kind must be 'report', 'debug' or 'all'"}), 400
+    try:
+        after = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        since = parse_date_bound(request.args.get('since', ''))
+        until = parse_date_bound(request.args.get('until', ''), end=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Totals come from the local index ('total' = operator folders, i.e. operators that actually ran)
+    sync_report_index()
+    reports, next_key = report_index.page(
+        limit, after=after, kind=None if kind == 'all' else kind, since=since, until=until,
+        min_failed=request.args.get('min_failed', 0, type=int),
+        operator=request.args.get('operator') or None,
+        failed_operator=request.args.get('failed_operator') or None,
+    )
+    payload = {'reports': reports, 'next_cursor': encode_cursor(next_key) if next_key else None}
+    etag = payload_etag(payload)
+    return not_modified(etag) or json_with_etag(payload, etag)
+
+@app.route('/api/operators/history')
+def get_operator_history():
+    """Pass/fail matrix of operators over the last N reports, with flakiness and failure streaks"""
+    limit = request.args.get('limit', 20, type=int)
+    limit = min(max(limit, 1), MAX_HISTORY_REPORTS)
+    operator_param = request.args.get('operator', '')
+    operators = set(op.strip() for op in operator_param.split(',') if op.strip()) or None
+
+    # Built from the index: each report's outcomes were stored once, when it was indexed
+    sync_report_index()
+    payload = build_operator_history(*report_index.operator_results(limit, operators))
+    etag = payload_etag(payload)
+    return not_modified(etag) or json_with_etag(payload, etag)
+
+@app.route('/api/testcases')
+def get_test_cases():
+    """certsuite test case results over the last N sealed reports, from their claim.json files.
+
+    Query parameters (all optional):
+      limit     reports to cover (default 30, max MAX_TESTCASE_REPORTS)
+      operator  comma-separated operators to count results of
+      suite     only test cases of this suite (access-control, lifecycle, ...)
+      sort      'failed' (default), 'fail_rate', 'skipped' or 'duration'
+      top       test cases to return (default 20, 0 for all)
+      test      a single test case's result per report and operator instead
+    """
+    limit = request.args.get('limit', 30, type=int)
+    limit = min(max(limit, 1), MAX_TESTCASE_REPORTS)
+    operator_param = request.args.get('operator', '')
+    operators = set(op.strip() for op in operator_param.split(',') if op.strip()) or None
+    sort = request.args.get('sort', 'failed')
+    if sort not in TESTCASE_SORTS:
+        return jsonify({'error': f"sort must be one of {', '.join(TESTCASE_SORTS)}"}), 400
+    top = max(request.args.get('top', 20, type=int), 0)
+
+    # Claims are parsed once per report; the index answers every query after that
+    sync_test_results(limit)
+    test = request.args.get('test')
+    if test:
+        suite, results = report_index.test_case_results(test, limit, operators)
+        if suite is None:
+            return jsonify({'error': f'Unknown test case: {test}'}), 404
+        payload = {'name': test, 'suite': suite, 'results': results}
+    else:
+        reports, ingested, cases = report_index.test_case_stats(limit, operators, request.args.get('suite'))
+        cases.sort(key=lambda case: case['name'])
+        cases.sort(key=TESTCASE_SORTS[sort], reverse=True)
+        payload = {'reports': reports, 'ingested': ingested, 'total': len(cases),
+                   'test_cases': cases[:top] if top else cases}
+    etag = payload_etag(payload)
+    return not_modified(etag) or json_with_etag(payload, etag)
 
 @app.route('/api/report-summary')
 def get_report_summary():
@@ -798,44 +3266,21 @@ def get_report_summary():
     if not report_name:
         return jsonify({'error': 'Report name required'}), 400
     
-    if DEMO_MODE:
-        return jsonify(get_demo_report_summary(report_name))
-    
-    report_dir = f"{REPORT_DIR}/{report_name}"
-    
-    # Check if report exists
-    exists = ssh_command(f'test -d "{report_dir}" && echo "yes" || echo "no"').strip()
-    if exists != 'yes':
+    report = get_report_facts(report_name)
+    if report is None:
         return jsonify({'error': 'Report not found'}), 404
+    etag = 'summary-' + report_etag(report)
+    cached = not_modified(etag)
+    if cached:
+        return cached
     
-    # Get list of completed operator folders (operators that have been tested)
-    folders_raw = ssh_command(f'ls -d "{report_dir}"/*/ 2>/dev/null | xargs -I {{}} basename {{}}')
-    tested_operators = set(f.strip() for f in folders_raw.strip().split('\n') if f.strip())
-    
-    # Get pass/fail status from log file
-    log_file = ssh_command(f'ls -t "{report_dir}"/output_*.log 2>/dev/null | head -1').strip()
+    # Completed operator folders (operators that have been tested)
+    tested_operators = set(report['operator_dirs'])
     
-    installed_list = []
-    failed_list = []
-    
-    if log_file:
-        # Get installed operators (success) - "operator X installed"
-        installed_raw = ssh_command(f'grep "operator .* installed" "{log_file}" 2>/dev/null | sed "s/operator \\(.*\\) installed/\\1/"')
-        for op in installed_raw.strip().split('\n'):
-            op = op.strip()
-            if op:
-                installed_list.append(op)
-        
-        # Get failed operators - "Operator failed to install"
-        failed_context = ssh_command(f'grep -B5 "Operator failed to install" "{log_file}" 2>/dev/null | grep "package=" | sed "s/.*package= \\([^ ]*\\).*/\\1/"')
-        for op in failed_context.strip().split('\n'):
-            op = op.strip()
-            if op:
-                failed_list.append(op)
-    
-    # Make lists unique
-    installed_list = sorted(set(installed_list))
-    failed_list = sorted(set(failed_list))
+    # Pass/fail status from the parsed log
+    log = report['log'] or {}
+    installed_list = sorted(set(log.get('installed_operators', [])))
+    failed_list = sorted(set(log.get('failed_operators', [])))
     
     # Find operators that are in tested but not in installed or failed (in progress or other)
     installed_set = set(installed_list)
@@ -854,7 +3299,7 @@ def get_report_summary():
         time_str = ''
         tz = ''
     
-    return jsonify({
+    return json_with_etag({
         'report': report_name,
         'date': date_str,
         'time': time_str,
@@ -867,50 +3312,101 @@ def get_report_summary():
         'installed_list': installed_list,
         'failed_list': failed_list,
         'other_list': other_list,
+        'operators': log.get('operators', []),
+        # Time spent per kind of wait (CSV created, pods ready, namespace deleted, ...)
+        'waits': report.get('waits', {}),
         'url': f'http://10.1.24.2/{report_name}/'
-    })
+    }, etag)
+
+# ============== CSV EXPORT ==============
+
+# Reports fetched concurrently ahead of the one being streamed; bounds export memory
+CSV_PREFETCH = 4
+# Bytes collected before a chunk is handed to the WSGI server
+CSV_CHUNK_SIZE = 64 * 1024
+
+async def fetch_results_csv(report_name):
+    """Content of a report's results.csv ('' if it has none or could not be read)"""
+    try:
+        return await backend.read_csv(report_name)
+    except Exception as e:
+        logger.warning(f"Skipping results.csv of {report_name}: {e}")
+        return ''
+
+def prefetch_in_order(func, items, window):
+    """Yield the result of coroutine function func(item) for each item in order,
+    running up to ``window`` calls concurrently"""
+    items = iter(items)
+    pending = deque(submit_remote(func, item) for item in itertools.islice(items, window))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(items, 1):
+                pending.append(submit_remote(func, item))
+            yield result
+    finally:
+        # Client went away: cancel the fetches still in flight
+        for future in pending:
+            future.cancel()
+
+def combined_csv_lines(contents):
+    """Lines of several CSV documents merged into one, keeping only the first header"""
+    header = None
+    for content in contents:
+        lines = io.StringIO(content.strip())
+        if header is None:
+            header = next(lines, '').rstrip('\n')
+            yield header + '\n'
+        else:
+            next(lines, None)
+        for line in lines:
+            line = line.rstrip('\n')
+            if line and line != header:
+                yield line + '\n'
+
+def encode_chunks(lines, compress=False):
+    """Join lines into CSV_CHUNK_SIZE byte chunks, gzip-compressed on the fly if requested"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buffer = []
+    size = 0
+    for line in itertools.chain(lines, [None]):
+        if line is not None:
+            data = line.encode('utf-8')
+            buffer.append(data)
+            size += len(data)
+            if size < CSV_CHUNK_SIZE:
+                continue
+        chunk = b''.join(buffer)
+        buffer, size = [], 0
+        if compressor:
+            chunk = compressor.compress(chunk) + (compressor.flush() if line is None else b'')
+        if chunk:
+            yield chunk
 
 @app.route('/api/download/csv')
 def download_csv():
     """Download results.csv from the latest or specified report"""
     report_name = request.args.get('report', None)
     
-    if DEMO_MODE:
-        if not report_name:
-            report_name = DEMO_REPORTS[0]['name']
-        csv_content = get_demo_csv(report_name)
-        return Response(
-            csv_content,
-            mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment; filename={report_name}_results.csv'}
-        )
-    
-    # Get the report directory
-    if report_name:
-        report_dir = f"{REPORT_DIR}/{report_name}"
-    else:
+    if not report_name:
         # Get latest report
-        report_dir = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -1').strip()
-    
-    if not report_dir:
-        return jsonify({'error': 'No reports found'}), 404
-    
-    report_name = os.path.basename(report_dir)
-    csv_path = f"{report_dir}/results.csv"
+        sync_report_index()
+        latest = report_index.page(1)[0]
+        if not latest:
+            return jsonify({'error': 'No reports found'}), 404
+        report_name = latest[0]['name']
+    elif '/' in report_name or report_name in ('.', '..'):
+        return jsonify({'error': 'Invalid report name'}), 400
     
-    logger.info(f">>> CSV DOWNLOAD requested: {csv_path}")
+    logger.info(f">>> CSV DOWNLOAD requested: {report_name}/results.csv")
     
-    # Check if file exists
-    exists = ssh_command(f'test -f "{csv_path}" && echo "yes" || echo "no"').strip()
-    if exists != 'yes':
+    try:
+        csv_content = remote_loop.run(backend.read_csv(report_name))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    if not csv_content:
         return jsonify({'error': 'CSV file not found'}), 404
     
-    # Fetch the CSV content (longer timeout for large files)
-    csv_content = ssh_command(f'cat "{csv_path}"', log_cmd=False, timeout=120)
-    
-    if csv_content.startswith('Error:'):
-        return jsonify({'error': csv_content}), 500
-    
     logger.info(f"CSV download complete: {len(csv_content)} bytes")
     
     # Return as downloadable file
@@ -926,71 +3422,340 @@ def download_combined_csv():
     # Get list of reports to combine (comma-separated) or default to latest 5
     reports_param = request.args.get('reports', None)
     
-    if DEMO_MODE:
-        if reports_param:
-            report_names = reports_param.split(',')
-        else:
-            report_names = [DEMO_REPORTS[0]['name']]
-        
-        combined_csv = []
-        header_added = False
-        for rn in report_names:
-            csv_content = get_demo_csv(rn)
-            lines = csv_content.split('\n')
-            if not header_added:
-                combined_csv.extend(lines)
-                header_added = True
-            else:
-                combined_csv.extend(lines[1:])  # Skip header
-        
-        return Response(
-            '\n'.join(combined_csv),
-            mimetype='text/csv',
-            headers={'Content-Disposition': 'attachment; filename=combined_results.csv'}
-        )
-    
     if reports_param:
-        report_names = reports_param.split(',')
+        report_names = [name for name in reports_param.split(',') if name]
     else:
         # Get latest report only by default
-        latest = ssh_command(f'ls -td {REPORT_DIR}/report_* 2>/dev/null | head -1').strip()
-        report_names = [os.path.basename(latest)] if latest else []
+        sync_report_index()
+        report_names = [report['name'] for report in report_index.page(1)[0]]
     
     if not report_names:
         return jsonify({'error': 'No reports found'}), 404
     
-    logger.info(f">>> COMBINED CSV DOWNLOAD requested: {report_names}")
+    # Names end up in a path on the remote host
+    if any('/' in name or name in ('.', '..') for name in report_names):
+        return jsonify({'error': 'Invalid report name'}), 400
     
-    combined_csv = []
-    header_added = False
+    logger.info(f">>> COMBINED CSV DOWNLOAD requested: {report_names}")
     
-    for report_name in report_names:
-        csv_path = f"{REPORT_DIR}/{report_name}/results.csv"
-        exists = ssh_command(f'test -f "{csv_path}" && echo "yes" || echo "no"').strip()
-        
-        if exists == 'yes':
-            content = ssh_command(f'cat "{csv_path}"', log_cmd=False, timeout=120)
-            lines = content.strip().split('\n')
-            
-            if lines:
-                if not header_added:
-                    # Add header from first file
-                    combined_csv.append(lines[0])
-                    header_added = True
-                # Add data rows (skip header in subsequent files)
-                combined_csv.extend(lines[1:] if header_added else lines)
-    
-    if not combined_csv:
+    # Reports are fetched concurrently but emitted in order, so only a few are held at a time
+    contents = prefetch_in_order(fetch_results_csv, report_names, CSV_PREFETCH)
+    # Wait for the first CSV with data before answering, so an empty export is still a 404
+    first = next((content for content in contents if content.strip()), None)
+    if first is None:
         return jsonify({'error': 'No CSV data found'}), 404
     
-    combined_content = '\n'.join(combined_csv)
-    logger.info(f"Combined CSV download complete: {len(combined_content)} bytes from {len(report_names)} reports")
+    compress = request.accept_encodings['gzip'] > 0
+    headers = {'Content-Disposition': 'attachment; filename=combined_results.csv', 'Vary': 'Accept-Encoding'}
+    if compress:
+        headers['Content-Encoding'] = 'gzip'
     
-    return Response(
-        combined_content,
-        mimetype='text/csv',
-        headers={'Content-Disposition': 'attachment; filename=combined_results.csv'}
-    )
+    def generate():
+        sent = 0
+        for chunk in encode_chunks(combined_csv_lines(itertools.chain([first], contents)), compress):
+            sent += len(chunk)
+            yield chunk
+        logger.info(f"Combined CSV download complete: {sent} bytes from {len(report_names)} reports")
+    
+    return Response(generate(), mimetype='text/csv', headers=headers)
+
+# ============== RESULTS CACHE ==============
+
+# Rows per row group of a cached results.csv
+RESULTS_ROW_GROUP = 4096
+
+class ResultsFile:
+    """One cached results.csv, opened for reading.
+
+    Only the header is read up front; dictionaries and code blocks are read
+    and decompressed when a query first needs them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._dictionaries = {}
+        with open(path, 'rb') as f:
+            if f.read(len(ResultsCache.MAGIC)) != ResultsCache.MAGIC:
+                raise ValueError(f'not a results cache file: {path}')
+            size, = struct.unpack('>I', f.read(4))
+            header = json.loads(f.read(size))
+            self.data_start = f.tell()
+        self.columns = header['columns']
+        self.rows = header['rows']
+        self.dictionary_blocks = header['dictionaries']
+        self.row_groups = header['row_groups']
+        self._f = None
+
+    def _block(self, offset, length):
+        self._f.seek(self.data_start + offset)
+        return zlib.decompress(self._f.read(length))
+
+    def dictionary(self, column):
+        if column not in self._dictionaries:
+            offset, length, _ = self.dictionary_blocks[column]
+            self._dictionaries[column] = json.loads(self._block(offset, length))
+        return self._dictionaries[column]
+
+    def codes(self, group, column):
+        offset, length = self.row_groups[group]['blocks'][column]
+        return array.array(self.dictionary_blocks[column][2], self._block(offset, length))
+
+    def _matches(self, filters, columns):
+        """(row indexes, [(codes, dictionary) of each column]) of every row group with rows matching
+        ``filters``, a {column: set of values} dict; (None, None) stands for a column this file lacks"""
+        wanted = {}
+        for column, values in filters.items():
+            codes = set()
+            if column in self.columns:
+                codes = {code for code, value in enumerate(self.dictionary(column)) if value in values}
+            if not codes:
+                return
+            wanted[column] = codes
+        for number, group in enumerate(self.row_groups):
+            # Dictionaries are sorted, so a group whose code range misses every wanted code is skipped unread
+            if any(not any(low <= code <= high for code in wanted[column])
+                   for column, (low, high) in group['ranges'].items() if column in wanted):
+                continue
+            selected = range(group['rows'])
+            for column, codes in wanted.items():
+                block = self.codes(number, column)
+                selected = list(itertools.compress(selected, map(codes.__contains__, map(block.__getitem__, selected))))
+            if selected:
+                yield selected, [(self.codes(number, column), self.dictionary(column)) if column in self.columns
+                                 else (None, None) for column in columns]
+
+    def scan(self, filters, columns):
+        """Values of ``columns`` ('' for one this file lacks) of every row matching ``filters``"""
+        with open(self.path, 'rb') as self._f:
+            for selected, blocks in self._matches(filters, columns):
+                for i in selected:
+                    yield [dictionary[block[i]] if block is not None else '' for block, dictionary in blocks]
+
+    def count(self, filters, columns):
+        """{values of ``columns``: rows} over the rows matching ``filters``, counted by code"""
+        counts = {}
+        with open(self.path, 'rb') as self._f:
+            for selected, blocks in self._matches(filters, columns):
+                present = [block for block, _ in blocks if block is not None]
+                if not isinstance(selected, range):
+                    present = [[block[i] for i in selected] for block in present]
+                keys = zip(*present) if present else [()] * len(selected)
+                group_counts = {}
+                for key in keys:
+                    group_counts[key] = group_counts.get(key, 0) + 1
+                for key, rows in group_counts.items():
+                    codes = iter(key)
+                    values = tuple(dictionary[next(codes)] if block is not None else ''
+                                   for block, dictionary in blocks)
+                    counts[values] = counts.get(values, 0) + rows
+        return counts
+
+
+class ResultsCache:
+    """Sealed reports' results.csv converted once into compressed columnar files.
+
+    Each column is dictionary-encoded: its distinct values are stored once,
+    sorted, and rows hold array codes, in row groups of RESULTS_ROW_GROUP
+    rows. The header lists the offset of every zlib-compressed block and the
+    code range of each column per row group, so a query reads only the
+    columns it filters on or returns and skips row groups that cannot match.
+    Like the report index, the cache is derived from REPORT_DIR and can be
+    deleted at any time.
+    """
+
+    MAGIC = b'operator-test-results 1\n'
+
+    def __init__(self, directory, row_group=RESULTS_ROW_GROUP):
+        self.directory = directory
+        self.row_group = row_group
+
+    def path(self, name):
+        return os.path.join(self.directory, f'{name}.results')
+
+    def has(self, name):
+        return os.path.exists(self.path(name))
+
+    def write(self, name, content):
+        """Convert the content of a report's results.csv and store it"""
+        rows = list(csv.reader(io.StringIO(content)))
+        header = rows[0] if rows else []
+        # A sharded run's merged results.csv repeats the header
+        rows = [row for row in rows[1:] if row and row != header]
+        data = io.BytesIO()
+        
+        def block(raw):
+            offset = data.tell()
+            data.write(zlib.compress(raw, 6))
+            return [offset, data.tell() - offset]
+        
+        dictionaries = {}
+        codes = {}
+        for i, column in enumerate(header):
+            values = [row[i] if i < len(row) else '' for row in rows]
+            dictionary = sorted(set(values))
+            index = {value: code for code, value in enumerate(dictionary)}
+            typecode = 'H' if len(dictionary) <= 1 << 16 else 'I'
+            codes[column] = array.array(typecode, map(index.__getitem__, values))
+            dictionaries[column] = block(json.dumps(dictionary).encode()) + [typecode]
+        groups = []
+        for start in range(0, len(rows), self.row_group):
+            group = {'rows': min(self.row_group, len(rows) - start), 'blocks': {}, 'ranges': {}}
+            for column in header:
+                chunk = codes[column][start:start + self.row_group]
+                group['blocks'][column] = block(chunk.tobytes())
+                group['ranges'][column] = [min(chunk), max(chunk)]
+            groups.append(group)
+        meta = json.dumps({'columns': header, 'rows': len(rows), 'dictionaries': dictionaries,
+                           'row_groups': groups}).encode()
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(name)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(self.MAGIC + struct.pack('>I', len(meta)) + meta + data.getvalue())
+        os.replace(tmp, path)
+
+    def open(self, name):
+        """ResultsFile of a cached report, None if it is not cached (or was written by another version)"""
+        try:
+            return ResultsFile(self.path(name))
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    def remove(self, names):
+        for name in names:
+            try:
+                os.remove(self.path(name))
+            except FileNotFoundError:
+                pass
+
+results_cache = ResultsCache(RESULTS_CACHE_DIR)
+results_cache_lock = threading.Lock()
+
+# Most reports one query can span, and most rows a JSON answer holds (CSV streams them all)
+MAX_QUERY_REPORTS = 200
+MAX_QUERY_ROWS = 10000
+# Columns a query returns unless it names them; the long text columns are left out
+RESULTS_DEFAULT_COLUMNS = ('report', 'CNFName', 'OperatorVersion', 'testID', 'Suite', 'State', 'StartTime', 'EndTime')
+# Query parameters that filter on a results.csv column
+RESULTS_FILTERS = {'operator': 'CNFName', 'test': 'testID', 'suite': 'Suite', 'result': 'State'}
+
+async def read_results_csv(report_name):
+    """(name, content of its results.csv), content None if it could not be read"""
+    try:
+        return report_name, await backend.read_csv(report_name)
+    except Exception as e:
+        logger.warning(f"Could not read results.csv of {report_name}: {e}")
+        return report_name, None
+
+def cache_results(report_names):
+    """Convert the results.csv of sealed reports not cached yet; returns those that could not be read"""
+    if all(results_cache.has(name) for name in report_names):
+        return []
+    unavailable = []
+    with results_cache_lock:
+        missing = [name for name in report_names if not results_cache.has(name)]
+        for name, content in prefetch_in_order(read_results_csv, missing, CSV_PREFETCH):
+            if content is None:
+                unavailable.append(name)
+            else:
+                results_cache.write(name, content)
+        if missing:
+            logger.info(f"Results cache: converted {len(missing) - len(unavailable)} results.csv file(s)")
+    return unavailable
+
+def result_rows(files, filters, columns):
+    """Matching rows of cached reports, in report order; the 'report' column is the report name"""
+    for name, results in files:
+        for values in results.scan(filters, columns):
+            yield [name if column == 'report' else value for column, value in zip(columns, values)]
+
+def csv_text(rows, batch=1000):
+    """CSV text of rows, ``batch`` rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, batch))
+        if not chunk:
+            return
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+def split_param(name):
+    return [value.strip() for value in request.args.get(name, '').split(',') if value.strip()]
+
+@app.route('/api/results/query')
+def query_results():
+    """Test case rows from the results.csv of sealed reports, read from the columnar results cache.
+
+    Query parameters (all optional):
+      limit                         newest sealed reports to cover (default 30, max MAX_QUERY_REPORTS)
+      since, until                  run start date range, as for /api/reports
+      operator, test, suite, result comma-separated values to keep (CNFName, testID, Suite, State)
+      columns                       comma-separated columns to return (default RESULTS_DEFAULT_COLUMNS);
+                                    'report' is the report a row comes from
+      group_by                      comma-separated columns to count the matching rows by instead
+      format                        'json' (default, at most MAX_QUERY_ROWS rows) or 'csv' (streamed, every row)
+    """
+    limit = request.args.get('limit', 30, type=int)
+    limit = min(max(limit, 1), MAX_QUERY_REPORTS)
+    output = request.args.get('format', 'json')
+    if output not in ('json', 'csv'):
+        return jsonify({'error': "format must be 'json' or 'csv'"}), 400
+    try:
+        since = parse_date_bound(request.args.get('since', ''))
+        until = parse_date_bound(request.args.get('until', ''), end=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    filters = {column: set(split_param(param)) for param, column in RESULTS_FILTERS.items() if split_param(param)}
+    group_by = split_param('group_by')
+    columns = group_by or split_param('columns') or list(RESULTS_DEFAULT_COLUMNS)
+    
+    # Sealed reports' results never change: each results.csv crosses the wire once
+    sync_report_index()
+    names = report_index.sealed_names(limit, since, until)
+    unavailable = cache_results(names)
+    files = [(name, results_cache.open(name)) for name in names if name not in unavailable]
+    files = [(name, results) for name, results in files if results is not None]
+    known = set(itertools.chain(['report'], *(results.columns for _, results in files)))
+    unknown = [column for column in columns if column not in known]
+    if files and unknown:
+        return jsonify({'error': f"Unknown column(s): {', '.join(unknown)}"}), 400
+    
+    etag = payload_etag({'query': sorted(request.args.items(multi=True)), 'reports': names, 'unavailable': unavailable})
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    if group_by:
+        counts = {}
+        for name, results in files:
+            file_columns = ['' if column == 'report' else column for column in columns]
+            for key, rows in results.count(filters, file_columns).items():
+                key = tuple(name if column == 'report' else value for column, value in zip(columns, key))
+                counts[key] = counts.get(key, 0) + rows
+        rows = [list(key) + [count] for key, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+        columns = columns + ['count']
+    else:
+        rows = result_rows(files, filters, columns)
+    
+    if output == 'csv':
+        compress = request.accept_encodings['gzip'] > 0
+        headers = {'Content-Disposition': 'attachment; filename=results_query.csv', 'Vary': 'Accept-Encoding'}
+        if compress:
+            headers['Content-Encoding'] = 'gzip'
+        text = csv_text(itertools.chain([columns], rows))
+        return with_etag(Response(encode_chunks(text, compress), mimetype='text/csv', headers=headers), etag)
+    
+    page = list(itertools.islice(rows, MAX_QUERY_ROWS + 1))
+    return json_with_etag({
+        'reports': names,
+        'unavailable': unavailable,
+        'columns': columns,
+        'rows': page[:MAX_QUERY_ROWS],
+        'truncated': len(page) > MAX_QUERY_ROWS,
+    }, etag)
 
 if __name__ == '__main__':
     debug_mode = os.environ.get('DEBUG', 'false').lower() == 'true'
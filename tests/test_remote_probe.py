@@ -0,0 +1,116 @@
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import remote_probe  # noqa: E402
+from remote_probe import JSONStream  # noqa: E402
+
+
+def claim_document(test_count=20):
+    """A claim.json-like document: large sections to skip around the results to decode"""
+    random.seed(test_count)
+    results = {}
+    for index in range(test_count):
+        results[f'test-{index}'] = {
+            'testID': {'id': f'test-{index}', 'suite': ['lifecycle', 'networking', 'access-control'][index % 3]},
+            'state': ['passed', 'failed', 'skipped'][index % 3],
+            'duration': random.choice([94786.5, 12, -3.25e-4, 1e10, 0, 7.0]),
+            'capturedTestOutput': 'line "quoted" \\ with\nnewlines {[ ]} ' * 3,
+            'checkDetails': [{'x': 1.5, 'y': [True, False, None]}, '}]'],
+        }
+    return {
+        'claim': {
+            'configurations': {'abc"\\': [1, 2.5, {'nested': '"]}'}], 'numbers': [123456.789, -0.5, 1e-3]},
+            'nodes': {'node-1': {'cpu': 64, 'mem': 1048576.25, 'labels': {'a': 'b\\"c'}}},
+            'results': results,
+            'versions': {'ocp': '4.20', 'k8s': 1.33},
+        },
+        'trailer': [0.1, 22.75, 'x'],
+    }
+
+
+def walk(stream):
+    """Rows claim_results would build, read through ``stream``"""
+    rows = []
+    for key in stream.keys():
+        if key != 'claim':
+            stream.skip()
+            continue
+        for section in stream.keys():
+            if section != 'results':
+                stream.skip()
+                continue
+            for test_id in stream.keys():
+                result = stream.decode()
+                rows.append([result['testID']['id'], result['testID']['suite'], result['state'], result['duration']])
+    return rows
+
+
+def expected_rows(document):
+    return [[result['testID']['id'], result['testID']['suite'], result['state'], result['duration']]
+            for result in document['claim']['results'].values()]
+
+
+class RandomChunks(io.StringIO):
+    """Text file whose reads return between 1 and ``largest`` characters"""
+
+    def __init__(self, text, largest, seed):
+        super().__init__(text)
+        self.largest = largest
+        self.random = random.Random(seed)
+
+    def read(self, size=-1):
+        return super().read(self.random.randint(1, self.largest))
+
+
+class JSONStreamTest(unittest.TestCase):
+
+    def test_one_character_at_a_time(self):
+        document = claim_document()
+        for indent in (None, 2):
+            text = json.dumps(document, indent=indent)
+            self.assertEqual(walk(JSONStream(io.StringIO(text), chunk_size=1)), expected_rows(document))
+
+    def test_random_chunk_sizes(self):
+        document = claim_document()
+        text = json.dumps(document)
+        for seed in range(300):
+            with self.subTest(seed=seed):
+                stream = JSONStream(RandomChunks(text, random.Random(seed).randint(16, 1000), seed))
+                self.assertEqual(walk(stream), expected_rows(document))
+
+    def test_number_split_by_chunk(self):
+        for text in ('[94786.5, 1]', '[1e10, 2]', '[-3.25e-4]', '[12]', '123.5'):
+            for size in range(1, len(text) + 1):
+                with self.subTest(text=text, size=size):
+                    self.assertEqual(JSONStream(io.StringIO(text), chunk_size=size).decode(), json.loads(text))
+
+    def test_skip_then_decode(self):
+        text = json.dumps({'skip': {'a': ['}', '"\\"', [1.25, {'b': None}]]}, 'keep': [3.5, 'x']})
+        for size in range(1, len(text) + 1):
+            stream = JSONStream(io.StringIO(text), chunk_size=size)
+            values = {}
+            for key in stream.keys():
+                if key == 'keep':
+                    values[key] = stream.decode()
+                else:
+                    stream.skip()
+            self.assertEqual(values, {'keep': [3.5, 'x']})
+
+    def test_claim_results(self):
+        document = claim_document()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'claim.json')
+            with open(path, 'w') as f:
+                json.dump(document, f)
+            self.assertEqual(remote_probe.claim_results(path), expected_rows(document))
+
+
+if __name__ == '__main__':
+    unittest.main()
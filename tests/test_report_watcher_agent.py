@@ -0,0 +1,131 @@
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+AGENT_PATH = os.path.join(SCRIPTS_DIR, 'report-watcher-agent.py')
+
+sys.path.insert(0, SCRIPTS_DIR)
+spec = importlib.util.spec_from_file_location('report_watcher_agent', AGENT_PATH)
+agent = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(agent)
+
+
+def read_events(path):
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+    except FileNotFoundError:
+        return []
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        result = condition()
+        if result:
+            return result
+        time.sleep(0.05)
+    raise AssertionError('condition not met within {}s'.format(timeout))
+
+
+class ReportWatcherTest(unittest.TestCase):
+    """Runs the watcher against a report directory tree in a temp folder"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.report_dir = os.path.join(self.tmp, 'reports')
+        os.makedirs(os.path.join(self.report_dir, 'report_2026-01-01_00-00-00_UTC', 'nfd'))
+        self.event_log = os.path.join(self.tmp, 'events.jsonl')
+
+    def test_inotify_events(self):
+        try:
+            notifier = agent.Inotify()
+        except OSError as e:
+            self.skipTest(str(e))
+        log = agent.EventLog(self.event_log)
+        watcher = agent.ReportWatcher(self.report_dir, notifier, log.append)
+        watcher.scan()
+        self.assertEqual(read_events(self.event_log), [])
+
+        def settle():
+            # Wake-ups come from inotify, as in ReportWatcher.run
+            self.assertTrue(notifier.read(5))
+            time.sleep(agent.DEBOUNCE_SECONDS)
+            notifier.read(0)
+            watcher.scan()
+
+        report = os.path.join(self.report_dir, 'report_2026-01-02_00-00-00_UTC')
+        os.makedirs(report)
+        settle()
+        os.makedirs(os.path.join(report, 'ptp-operator'))
+        settle()
+        with open(os.path.join(report, 'results.csv'), 'w') as f:
+            f.write('CNFName,testID,State\nptp-operator,a,passed\nptp-operator,b,failed\n')
+        settle()
+        shutil.rmtree(os.path.join(self.report_dir, 'report_2026-01-01_00-00-00_UTC'))
+        settle()
+
+        events = read_events(self.event_log)
+        self.assertEqual([event['seq'] for event in events], list(range(1, len(events) + 1)))
+        self.assertEqual([{key: value for key, value in event.items() if key not in ('seq', 'time', 'size')}
+                          for event in events], [
+            {'type': 'report_created', 'report': 'report_2026-01-02_00-00-00_UTC'},
+            {'type': 'operator_started', 'report': 'report_2026-01-02_00-00-00_UTC', 'operator': 'ptp-operator'},
+            {'type': 'results_appended', 'report': 'report_2026-01-02_00-00-00_UTC', 'rows': 2},
+            {'type': 'report_removed', 'report': 'report_2026-01-01_00-00-00_UTC'},
+        ])
+
+    def start_agent(self, folder):
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(folder, 'report-watcher-agent.py'), '--event-log', self.event_log,
+             'watch', '--report-dir', self.report_dir],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        self.addCleanup(self.stop_agent, process)
+        return process
+
+    @staticmethod
+    def stop_agent(process):
+        if process.poll() is None:
+            process.kill()
+        process.communicate()
+
+    def started(self):
+        return [event for event in read_events(self.event_log) if event['type'] == 'agent_started']
+
+    def test_new_version_replaces_running_agent(self):
+        # A copy of the agent, as the dashboard installs it on the test host
+        folder = os.path.join(self.tmp, 'agent')
+        os.makedirs(folder)
+        for name in ('report-watcher-agent.py', 'remote_probe.py'):
+            shutil.copy(os.path.join(SCRIPTS_DIR, name), folder)
+
+        first = self.start_agent(folder)
+        wait_for(self.started)
+
+        # Same code: the second agent leaves the running one alone
+        second = self.start_agent(folder)
+        self.assertEqual(second.communicate(timeout=10)[0].strip(), 'report watcher agent already running')
+        self.assertIsNone(first.poll())
+
+        # New code: the running agent is stopped and the new one takes over
+        with open(os.path.join(folder, 'report-watcher-agent.py'), 'a') as f:
+            f.write('# changed\n')
+        third = self.start_agent(folder)
+        first.wait(timeout=agent.TAKEOVER_TIMEOUT)
+        started = wait_for(lambda: len(self.started()) == 2 and self.started())
+        self.assertEqual(started[1]['pid'], third.pid)
+        self.assertNotEqual(started[0]['version'], started[1]['version'])
+        self.assertEqual(agent.read_lock(self.event_log + '.lock'),
+                         {'pid': third.pid, 'version': started[1]['version']})
+
+
+if __name__ == '__main__':
+    unittest.main()